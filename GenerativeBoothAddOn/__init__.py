@@ -0,0 +1,25 @@
+bl_info = {
+    "name": "Generative Booth",
+    "author": "Arya Harditya, Graciella T. N. S.",
+    "version": (0, 0, 3),
+    "blender": (4, 0, 2),
+    "location": "3D Viewport > Sidebar > Generative Booth",
+    "description": "Generative Booth Add-on",
+    "category": "Development",
+}
+
+# The add-on itself lives in addon.py. Outside Blender only the bpy-free
+# modules (booth, cache, instrument, placement, rng, search, solver, specs) are
+# importable, e.g. from plain CPython tests or benchmarks and from worker
+# processes.
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+if bpy is not None:
+    from .addon import *  # noqa: F401,F403
+    from .addon import register, unregister
+
+if __name__ == "__main__":
+    register()
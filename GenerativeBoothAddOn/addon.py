@@ -0,0 +1,3193 @@
+import bpy
+import contextlib
+import math
+import os
+import shutil
+import tempfile
+import time
+import types
+
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from mathutils import Vector
+
+from . import bl_info
+from . import booth
+from . import cache
+from . import geometry
+from . import instrument
+from . import materials
+from . import placement
+from . import rng
+from . import search
+from . import solver
+from . import specs
+from . import updates
+
+# ------------------------------------DEFS-----------------------------------
+
+# ______________MATERIAL______________
+            
+def add_material(role, col, mesh_obj=None):
+    """Gives the object the shared material of its role in color ``col``."""
+    if mesh_obj is None:
+        mesh_obj = bpy.context.active_object
+
+    return materials.assign(mesh_obj, role, col)
+
+def palette(floor, roof, walls, table, chair, totem, pole):
+    """Returns a palette mapping every material role to its color."""
+    return {
+        "floor": floor, "roof": roof,
+        "back_wall": walls, "left_wall": walls, "right_wall": walls,
+        "table": table, "chair": chair, "totem": totem, "pole": pole,
+    }
+
+BOOTH_PALETTES = {
+    'WHITE': ("White", palette(
+        (1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0),
+        (1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0), (1.0, 1.0, 1.0, 1.0))),
+    'NEUTRAL': ("Neutral", palette(
+        (0.8, 0.8, 0.8, 1.0), (0.9, 0.9, 0.9, 1.0), (1.0, 1.0, 1.0, 1.0), (0.35, 0.25, 0.18, 1.0),
+        (0.2, 0.2, 0.2, 1.0), (0.9, 0.9, 0.9, 1.0), (0.6, 0.6, 0.6, 1.0))),
+    'WARM': ("Warm", palette(
+        (0.55, 0.35, 0.2, 1.0), (0.95, 0.9, 0.8, 1.0), (0.95, 0.85, 0.7, 1.0), (0.45, 0.25, 0.12, 1.0),
+        (0.8, 0.4, 0.2, 1.0), (0.9, 0.6, 0.3, 1.0), (0.3, 0.2, 0.15, 1.0))),
+    'CONTRAST': ("Contrast", palette(
+        (0.05, 0.05, 0.05, 1.0), (0.05, 0.05, 0.05, 1.0), (1.0, 1.0, 1.0, 1.0), (1.0, 0.8, 0.0, 1.0),
+        (0.9, 0.1, 0.1, 1.0), (0.1, 0.3, 0.9, 1.0), (0.05, 0.05, 0.05, 1.0))),
+}
+
+def apply_palette(colors):
+    """Recolors every booth part and every booth's color properties to ``colors``.
+
+    The properties are written as raw values so their update callbacks, which
+    would reassign materials object by object, do not fire.
+    """
+    merged = materials.swap_palette(colors)
+    for scene in bpy.data.scenes:
+        for props in (scene.generative_booth_props, *scene.generative_booths):
+            for role, color in colors.items():
+                props[f"{role}_color"] = color
+    return merged
+
+# ______________REGISTRY______________
+
+# Parts a booth has at most one of. Each is held by a "<role>_object" pointer
+# on GenerativeBoothProperties, so finding it never searches bpy.data by name
+# and survives Blender renaming a duplicate to ".001".
+SINGLE_ROLES = (
+    "floor", "roof", "back_wall", "left_wall", "right_wall", "pole_cloud",
+    "light_top", "light_back", "light_front", "light_left", "light_right", "camera",
+)
+
+# Names the parts had before they were registered, used to adopt old files
+LEGACY_NAMES = {
+    "floor": "Booth_Floor",
+    "roof": "Booth_Roof",
+    "back_wall": "Booth_Wall_Back",
+    "left_wall": "Booth_Wall_Left",
+    "right_wall": "Booth_Wall_Right",
+    "pole_cloud": "Booth_Poles",
+    "light_top": "Area_Light_Top",
+    "light_back": "Area_Light_Back",
+    "light_front": "Area_Light_Front",
+    "light_left": "Area_Light_Left",
+    "light_right": "Area_Light_Right",
+    "camera": "Keyframed_Booth_Camera",
+}
+
+def active_booth(scene):
+    """Returns the booth the panels and operators act on.
+
+    That is the selected entry of the scene's booth instances, or the scene's
+    own booth while no instance exists.
+    """
+    booths = scene.generative_booths
+    if 0 <= scene.generative_booth_index < len(booths):
+        return booths[scene.generative_booth_index]
+    return scene.generative_booth_props
+
+def booth_object(props, role):
+    """Returns the object playing ``role`` in the booth, or None."""
+    return getattr(props, f"{role}_object")
+
+def set_booth_object(props, role, obj):
+    """Registers ``obj`` as the booth's ``role``."""
+    setattr(props, f"{role}_object", obj)
+
+def add_booth_element(props, obj):
+    """Registers a table, chair, totem or pole object with the booth."""
+    item = props.elements.add()
+    item.kind = obj.get("gb_kind", "")
+    item.object = obj
+
+def booth_elements(props, kind=None):
+    """Returns the element objects of the booth, optionally only those of ``kind``."""
+    return [
+        item.object for item in props.elements
+        if item.object is not None and (kind is None or item.kind == kind)
+    ]
+
+def booth_poles(props):
+    """Returns the pole objects of the booth, including its pole cloud."""
+    poles = booth_elements(props, "pole")
+    if props.pole_cloud_object is not None:
+        poles.append(props.pole_cloud_object)
+    return poles
+
+def prune_booth_elements(props):
+    """Drops registry entries whose object was deleted from the scene."""
+    for i in reversed(range(len(props.elements))):
+        obj = props.elements[i].object
+        if obj is None or not obj.users_collection:
+            props.elements.remove(i)
+
+def register_booth_objects(props, objects):
+    """Registers freshly built booth objects by the role recorded on them.
+
+    Objects are parented to the booth's root, if it has one, so they follow
+    the booth when it is moved around the hall.
+    """
+    root = props.root_object
+    for obj in objects:
+        if root is not None and obj.parent is None and obj != root:
+            obj.parent = root
+        role = obj.get("gb_role")
+        if role in SINGLE_ROLES:
+            set_booth_object(props, role, obj)
+        elif obj.get("gb_kind") in ELEMENT_KINDS:
+            add_booth_element(props, obj)
+
+@bpy.app.handlers.persistent
+def adopt_legacy_objects(_file=None):
+    """Fills empty registries of a loaded file from the names parts used to have."""
+    for scene in bpy.data.scenes:
+        props = scene.generative_booth_props
+        for role, name in LEGACY_NAMES.items():
+            if booth_object(props, role) is None:
+                obj = scene.objects.get(name)
+                if obj is not None:
+                    set_booth_object(props, role, obj)
+
+        if not props.elements:
+            for index, obj in enumerate(o for o in scene.objects if o.name.startswith("Booth_Pole_")):
+                if "gb_kind" not in obj:
+                    tag_element(obj, "pole", index)
+                add_booth_element(props, obj)
+
+# ______________BOOTH BASE______________
+
+def add_floor_booth(width, length, height, collection=None):
+    """Creates the main floor object."""
+    obj = geometry.new_cube_object(
+        "Booth_Floor",
+        location=(0, 0, height / 2.0),
+        scale=(width, length, height),
+        collection=collection
+    )
+    obj["gb_role"] = "floor"
+    return obj
+    
+def add_roof_booth(width, length, height, collection=None):
+    """Creates the main roof object."""
+    obj = geometry.new_cube_object(
+        "Booth_Roof",
+        location=(0, 0, booth.ROOF_BASE + (height / 2.0)),
+        scale=(width, length, height),
+        collection=collection
+    )
+    obj["gb_role"] = "roof"
+    return obj
+
+def add_wall(props, side, collection=None):
+    """Creates the ``side`` wall using its wall properties for scale, color and visibility."""
+    return new_part_object(booth.base_part(props, f"{side}_wall"), collection)
+
+def add_all_walls(props, collection=None):
+    """Creates all three walls using the specific wall properties for scale and color."""
+    return [add_wall(props, side, collection) for side in booth.WALL_SIDES]
+
+# Objects created inside object_batch and hidden in the viewport at its end
+_batch = {"depth": 0, "hidden": []}
+
+@contextlib.contextmanager
+def object_batch():
+    """Defers the view layer work of the objects created in the block to its end.
+
+    Linking an object leaves the view layer out of sync, and hiding one in the
+    viewport syncs it again, so building and hiding objects one by one resyncs
+    the view layer once per object. Inside a batch only the render visibility
+    is set right away; viewport hiding waits for the end, where one sync serves
+    every object.
+    """
+    _batch["depth"] += 1
+    try:
+        yield
+    finally:
+        _batch["depth"] -= 1
+        if _batch["depth"] == 0:
+            hidden = _batch["hidden"]
+            _batch["hidden"] = []
+            for obj in hidden:
+                try:
+                    set_object_visibility(obj, not obj.hide_render)
+                except ReferenceError:
+                    # Deleted again before the batch ended
+                    pass
+
+def set_object_visibility(obj, visible):
+    """Hides or shows an object in the viewport and in renders, writing only what changes."""
+    if obj.hide_render != (not visible):
+        obj.hide_render = not visible
+    if _batch["depth"]:
+        _batch["hidden"].append(obj)
+        return
+    try:
+        if obj.hide_get() != (not visible):
+            obj.hide_set(not visible)
+    except RuntimeError:
+        # Not in the current view layer, e.g. a batch variant being written out
+        pass
+
+def toggle_wall_visibility(wall_obj, visible):
+    """Hides or shows a specific wall object."""
+    if wall_obj is not None:
+        set_object_visibility(wall_obj, visible)
+
+# ______________BOOTH ELEMENTS______________
+
+def tag_element(obj, kind, index):
+    """Records which element stream an object draws its position from."""
+    obj["gb_kind"] = kind
+    obj["gb_index"] = index
+    obj["gb_generation"] = 0
+
+def next_element_index(props, kind):
+    """Returns the index the next element of ``kind`` in the booth gets."""
+    indices = [obj.get("gb_index", 0) for obj in booth_elements(props, kind)]
+    return max(indices) + 1 if indices else 0
+
+def add_element_booth(kind, width, length, height, loc_range, collection=None, seed=0, index=0):
+    """Creates a table, chair or totem at the position of its (seed, kind, index) stream."""
+    x_loc, y_loc = rng.element_position(seed, kind, index, loc_range)
+    obj = geometry.new_cube_object(
+        "Cube",
+        location=(x_loc, y_loc, height / 2.0),
+        scale=(width, length, height),
+        collection=collection
+    )
+    tag_element(obj, kind, index)
+    return obj
+
+def add_table_booth(width, length, height, loc_range, collection=None, seed=0, index=0):
+    """Creates a table object."""
+    return add_element_booth("table", width, length, height, loc_range, collection, seed, index)
+    
+def add_chair_booth(width, length, height, loc_range, collection=None, seed=0, index=0):
+    """Creates a chair object."""
+    return add_element_booth("chair", width, length, height, loc_range, collection, seed, index)
+
+def add_totem_booth(width, length, height, loc_range, collection=None, seed=0, index=0):
+    """Creates a totem object."""
+    return add_element_booth("totem", width, length, height, loc_range, collection, seed, index)
+
+def reroll_element_position(obj, seed, loc_range):
+    """Moves an element to the next position of its stream."""
+    kind = obj.get("gb_kind", "element")
+    generation = obj.get("gb_generation", 0) + 1
+    obj.location.xy = rng.element_position(seed, kind, obj.get("gb_index", 0), loc_range, generation)
+    obj["gb_generation"] = generation
+    
+def create_single_pole(x_loc, y_loc, z_scale, z_loc, name="Cube", collection=None):
+    """Creates a single pole object."""
+    return geometry.new_cube_object(
+        name,
+        location=(x_loc, y_loc, z_loc),
+        scale=(0.1, 0.1, z_scale),
+        collection=collection,
+        cuts=0
+    )
+
+def generate_poles(count, pos_range, pole_color, collection=None, instancing='OBJECTS', seed=0):
+    """Generates multiple poles with seeded random positions."""
+    positions = placement.sample_positions(seed, "pole", count, pos_range)
+    return add_poles(booth.Poles(positions, pole_color, instancing), collection)
+
+def add_poles(poles, collection=None):
+    """Creates the pole objects, or the one pole cloud, of a layout's poles."""
+    objects = []
+    for _ in pole_steps(poles, collection, objects):
+        pass
+    return objects
+
+def pole_steps(poles, collection, objects):
+    """Creates the poles one at a time, appending each to ``objects`` and yielding after it.
+
+    A pole cloud is a single step. Lets a modal operator spread a large pole
+    count over many timer events.
+    """
+    if poles.instancing == 'GEOMETRY_NODES':
+        cloud = geometry.new_instancer_object(
+            "Booth_Poles", placement.to_points(poles.positions, poles.z), poles.scale,
+            collection=collection, cuts=0
+        )
+        tag_element(cloud, "pole", 0)
+        cloud["gb_role"] = "pole_cloud"
+        add_material("pole", poles.color, cloud)
+        objects.append(cloud)
+        yield
+        return
+
+    # Looked up once for all poles
+    mat = materials.material_for("pole", poles.color)
+    for i, (x_loc, y_loc) in enumerate(poles.positions.tolist()):
+        pole_obj = create_single_pole(x_loc, y_loc, poles.scale[2], poles.z,
+                                      name=f"Booth_Pole_{i+1}", collection=collection)
+        tag_element(pole_obj, "pole", i)
+        geometry.set_object_material(pole_obj, mat)
+        objects.append(pole_obj)
+        yield
+
+def reroll_poles(poles, seed, pos_range):
+    """Moves every pole to the next generation of the pole stream in one sampling call.
+
+    Pole objects are placed by their element index, pole clouds by vertex.
+    """
+    generation = max((obj.get("gb_generation", 0) for obj in poles), default=0) + 1
+    clouds = [obj for obj in poles if geometry.is_instancer(obj)]
+    singles = [obj for obj in poles if not geometry.is_instancer(obj)]
+
+    count = max((obj.get("gb_index", 0) + 1 for obj in singles), default=0)
+    count = max([count] + [len(obj.data.vertices) for obj in clouds])
+    positions = placement.sample_positions(seed, "pole", count, pos_range, generation)
+
+    for cloud in clouds:
+        points = geometry.get_instancer_points(cloud)
+        points[:, :2] = positions[:len(points)]
+        geometry.set_instancer_points(cloud, points)
+
+    if singles:
+        indices = [obj.get("gb_index", 0) for obj in singles]
+        geometry.set_object_positions(singles, positions[indices])
+
+    for obj in poles:
+        obj["gb_generation"] = generation
+        
+# ______________LAYOUT______________
+
+ELEMENT_KINDS = ("table", "chair", "totem", "pole")
+
+def layout_elements(objects):
+    """Turns tagged element objects into layout footprints.
+
+    Every instanced pole of a pole cloud becomes its own footprint. Returns the
+    footprints and, for each, the object and vertex index it came from.
+    """
+    elements = []
+    sources = []
+    for obj in objects:
+        kind = obj.get("gb_kind")
+        if kind not in ELEMENT_KINDS:
+            continue
+        if geometry.is_instancer(obj):
+            for i in range(len(obj.data.vertices)):
+                elements.append(solver.Element(kind, i, 0.05, 0.05, 0.0))
+                sources.append((obj, i))
+        else:
+            elements.append(solver.Element(kind, obj.get("gb_index", 0), obj.scale.x / 2.0, obj.scale.y / 2.0, 0.0))
+            sources.append((obj, None))
+    return elements, sources
+
+def arrange_elements(objects, params):
+    """Re-places tagged elements so none overlap each other or crowd the walls.
+
+    Returns the number of elements that did not fit; those keep their position.
+    """
+    elements, sources = layout_elements(objects)
+    for element in elements:
+        element.pos_range = getattr(params, f"{element.kind}_pos_range")
+
+    walls = [side for side in solver.WALL_SIDES if getattr(params, f"{side}_wall_visible")]
+    unplaced = solver.solve_layout(
+        elements, params.floor_width, params.floor_length, walls,
+        gap=params.layout_gap, wall_clearance=params.wall_clearance, seed=params.seed
+    )
+
+    place_elements(elements, sources)
+    return len(unplaced)
+
+def place_elements(elements, sources):
+    """Moves the objects behind placed layout footprints to their footprint's position."""
+    clouds = {}
+    for element, (obj, vertex) in zip(elements, sources):
+        if not element.placed:
+            continue
+        if vertex is None:
+            if geometry.differs(obj.location.xy, (element.x, element.y)):
+                obj.location.xy = (element.x, element.y)
+        else:
+            if obj.name not in clouds:
+                clouds[obj.name] = (obj, geometry.get_instancer_points(obj))
+            clouds[obj.name][1][vertex, :2] = (element.x, element.y)
+
+    for obj, points in clouds.values():
+        geometry.set_instancer_points(obj, points)
+
+# ______________LAYOUT SEARCH______________
+
+def search_weights(coverage=1.0, clearance=1.0, aisle=1.0, visibility=1.0):
+    return {"coverage": coverage, "clearance": clearance, "aisle": aisle, "visibility": visibility}
+
+def element_search_space(props):
+    """Returns the search.SearchSpace of the booth's element objects with their footprints and sources.
+
+    Returns None while the booth has no elements.
+    """
+    prune_booth_elements(props)
+    objects = booth_elements(props)
+    if props.pole_cloud_object is not None:
+        objects.append(props.pole_cloud_object)
+    elements, sources = layout_elements(objects)
+    if not elements:
+        return None
+    for element in elements:
+        element.pos_range = getattr(props, f"{element.kind}_pos_range")
+    heights = [booth.POLE_Z_SCALE if vertex is not None else obj.scale.z for obj, vertex in sources]
+    return search.SearchSpace(elements, heights, props), elements, sources
+
+def apply_search_winner(elements, sources, winner):
+    """Moves the element objects a search space was made from to ``winner``'s positions."""
+    for element, (x, y) in zip(elements, winner.positions.tolist()):
+        element.x, element.y = x, y
+    place_elements(elements, sources)
+
+def search_elements(props, candidates, keep=3, weights=None, aisle_width=search.AISLE_WIDTH):
+    """Scores ``candidates`` placements of the booth's element objects and moves them to the best.
+
+    Only the objects are written, once, after the search. Returns the ``keep``
+    best candidates, best first.
+    """
+    target = element_search_space(props)
+    if target is None:
+        return []
+    space, elements, sources = target
+    winners = search.search(space, candidates, keep, props.seed, weights, aisle_width)
+    apply_search_winner(elements, sources, winners[0])
+    return winners
+
+def build_search_winners(context, props, params, winners, lights=True):
+    """Builds a booth of ``params`` for every winner, in a row behind the booth.
+
+    Returns the collection name and candidate of every built booth, best first.
+    """
+    origin = props.root_object.location.copy() if props.root_object is not None else Vector()
+    results = []
+    for rank, (layout, winner) in enumerate(search.winner_layouts(params, winners, lights, camera=False), start=1):
+        name = f"{props.name or 'Booth'}_Search_{rank}"
+        collection = bpy.data.collections.new(name)
+        context.scene.collection.children.link(collection)
+        collection["gb_search_score"] = winner.score
+        objects = apply_layout(layout, collection)
+        location = origin + Vector((0.0, -rank * BOOTH_SPACING, 0.0))
+        store_batch_booth(context, collection, objects, name, f"{name}_Root", location, 'COLLECTIONS', "", 'BLEND')
+        results.append((collection.name, winner))
+    return results
+
+def build_searched_booths(context, props, candidates, keep=3, weights=None, aisle_width=search.AISLE_WIDTH,
+                          lights=True):
+    """Builds the ``keep`` best layouts of the booth's parameters as booths behind it."""
+    params = booth_params(props)
+    winners = search.search(search.params_space(params), candidates, keep, params.seed, weights, aisle_width)
+    return build_search_winners(context, props, params, winners, lights)
+
+def summarize_search(candidates, seconds, winners):
+    if not winners:
+        return "The booth has no elements to place"
+    best = winners[0]
+    terms = ", ".join(f"{name} {value:.2f}" for name, value in best.terms.items())
+    return (f"Searched {candidates} layouts in {seconds:.2f} s ({candidates / max(seconds, 1e-9):.0f}/s), "
+            f"best {best.score:.3f}: {terms}")
+
+# ______________LIGHTS______________
+
+def toggle_light_visibility(light_obj, visible):
+    """Hides or shows a specific light object."""
+    if light_obj is not None:
+        set_object_visibility(light_obj, visible)
+
+def light_visibility_update(side):
+    """Returns the update callback of the visibility toggle of ``side``, which touches only that light."""
+    def update(self, context):
+        toggle_light_visibility(booth_object(self, f"light_{side}"), getattr(self, f"light_{side}_visible"))
+    return update
+
+def new_light(light, collection=None):
+    """Creates the object of a light of the booth's light rig and tags its role."""
+    obj = geometry.new_light_object(
+        light.name, 'AREA', location=light.location, rotation=light.rotation,
+        size=light.size, energy=light.energy, collection=collection
+    )
+    obj["gb_role"] = light.role
+    if not light.visible:
+        set_object_visibility(obj, False)
+    return obj
+
+def add_light(props, side, collection=None):
+    """Creates the area light of ``side``, shown or hidden by its visibility property."""
+    return new_light(booth.booth_light(props, side), collection)
+
+def add_all_lights(props, collection=None):
+    """Creates every light of the booth's light rig."""
+    return [new_light(light, collection) for light in booth.booth_lights(props)]
+
+def sync_light(obj, light):
+    """Moves a light object to where ``light`` wants it and puts it on the light datablock it shares."""
+    changed = geometry.set_transform(obj, light.location, rotation=light.rotation)
+    changed |= geometry.set_light_data(obj, 'AREA', light.size, light.energy)
+    return changed
+
+def has_lights(props):
+    """Whether the booth has any light object."""
+    return any(object_alive(booth_object(props, f"light_{side}")) for side in booth.LIGHT_SIDES)
+
+def sync_lights(props, stats=None):
+    """Makes the booth's lights match its light rig: one per side the rig lights, none elsewhere.
+
+    Returns the light objects of the rig.
+    """
+    if stats is None:
+        stats = new_rebuild_stats()
+    rig = booth.light_rig(props)
+    lights = []
+    for side in booth.LIGHT_SIDES:
+        role = f"light_{side}"
+        if side in rig:
+            lights.append(ensure_part(props, role, stats))
+            continue
+        obj = booth_object(props, role)
+        if object_alive(obj):
+            remove_objects([obj])
+            stats["removed"] += 1
+        if obj is not None:
+            set_booth_object(props, role, None)
+    return lights
+
+# ______________CAMERA______________
+
+def add_keyframed_camera(collection=None, scene=None, keys=None):
+    """Adds a camera with keyframed animation.
+
+    When ``scene`` is given the camera becomes its active camera and the scene
+    is trimmed to the keyframes.
+    """
+    if keys is None:
+        keys = booth.camera_keys()
+
+    cam_obj = bpy.data.objects.new("Keyframed_Booth_Camera", bpy.data.cameras.new("Keyframed_Booth_Camera"))
+    if collection is None:
+        collection = bpy.context.collection
+    collection.objects.link(cam_obj)
+    cam_obj["gb_role"] = "camera"
+    
+    if scene is not None:
+        scene.camera = cam_obj
+        scene.frame_end = keys[-1].frame
+
+    # keyframe_insert takes the frame directly, so there is no need to
+    # re-evaluate the whole scene with frame_set for every key
+    for key in keys:
+        cam_obj.location = key.location
+        cam_obj.rotation_euler = key.rotation
+        cam_obj.keyframe_insert(data_path="location", frame=key.frame)
+        cam_obj.keyframe_insert(data_path="rotation_euler", frame=key.frame)
+    
+    cam_obj.location = keys[0].location
+    cam_obj.rotation_euler = keys[0].rotation
+    
+    return cam_obj
+
+# ______________BOOTH______________
+
+# Property types copied into parameter namespaces and specs
+BOOTH_PARAM_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+
+def booth_params(props, **overrides):
+    """Copies the booth properties into a plain namespace.
+
+    Variants are built from these copies, so sampling a variant never writes to
+    the scene properties and never fires their update callbacks.
+    """
+    values = {}
+    for prop in props.bl_rna.properties:
+        if prop.type not in BOOTH_PARAM_TYPES:
+            continue
+        value = getattr(props, prop.identifier)
+        if getattr(prop, "is_array", False):
+            value = tuple(value)
+        values[prop.identifier] = value
+    values.update(overrides)
+    return types.SimpleNamespace(**values)
+
+def new_part_object(part, collection=None):
+    """Creates the object of a layout part with its material, tags and visibility."""
+    obj = geometry.new_cube_object(
+        part.name,
+        location=part.location,
+        scale=part.scale,
+        rotation=part.rotation,
+        collection=collection,
+        cuts=geometry.DEFAULT_CUTS if part.cuts is None else part.cuts
+    )
+    if part.role is not None:
+        obj["gb_role"] = part.role
+    if part.kind is not None:
+        tag_element(obj, part.kind, part.index)
+    add_material(part.material, part.color, obj)
+    if part.detail:
+        geometry.set_detail(obj, part.detail)
+    if not part.visible:
+        set_object_visibility(obj, False)
+    return obj
+
+def apply_layout(layout, collection, scene=None):
+    """Creates the objects of a booth.BoothLayout in one pass.
+
+    Returns every created object, in build order.
+    """
+    objects = []
+    with object_batch():
+        for _ in layout_steps(layout, collection, objects, scene):
+            pass
+    return objects
+
+def layout_steps(layout, collection, objects, scene=None):
+    """Creates the objects of a layout one at a time, appending each to ``objects``.
+
+    Yields after every object, so the build can be paused between any two of
+    them. layout_step_count tells how many steps there are.
+    """
+    for part in layout.parts:
+        objects.append(new_part_object(part, collection))
+        yield
+    yield from pole_steps(layout.poles, collection, objects)
+    for light in layout.lights:
+        objects.append(new_light(light, collection))
+        yield
+    if layout.camera:
+        objects.append(add_keyframed_camera(collection, scene, layout.camera))
+        yield
+
+def layout_step_count(layout):
+    """Returns how many steps layout_steps takes to build ``layout``."""
+    poles = 1 if layout.poles.instancing == 'GEOMETRY_NODES' else len(layout.poles.positions)
+    return len(layout.parts) + poles + len(layout.lights) + (1 if layout.camera else 0)
+
+def build_booth(params, collection, lights=True, camera=True):
+    """Builds a complete booth described by ``params`` into ``collection``.
+
+    Returns every created object. Nothing is selected and no operator is called,
+    so this is safe to run many times in a row from a batch.
+    """
+    return apply_layout(booth.booth_layout(params, lights, camera), collection)
+
+def remove_booth_collection(collection):
+    """Deletes a booth collection with its objects and the datablocks only they used."""
+    remove_objects(collection.all_objects)
+    bpy.data.collections.remove(collection)
+
+def remove_objects(objects):
+    """Deletes objects together with the data, actions and booth materials only they used."""
+    used_materials = set()
+    for obj in list(objects):
+        data = obj.data
+        action = obj.animation_data.action if obj.animation_data else None
+        used_materials.update(slot.material.name for slot in obj.material_slots if slot.material)
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+        if data is not None and data.users == 0:
+            if isinstance(data, bpy.types.Mesh):
+                bpy.data.meshes.remove(data)
+            elif isinstance(data, bpy.types.Light):
+                bpy.data.lights.remove(data)
+            elif isinstance(data, bpy.types.Camera):
+                bpy.data.cameras.remove(data)
+        if action is not None and action.users == 0:
+            bpy.data.actions.remove(action)
+
+    for name in used_materials:
+        materials.release(bpy.data.materials.get(name))
+
+# ______________REBUILD______________
+
+# Parts sized from the floor, roof and wall properties
+BASE_ROLES = ("floor", "roof", "back_wall", "left_wall", "right_wall")
+
+def object_alive(obj):
+    """True if ``obj`` is set and still linked into a collection."""
+    return obj is not None and bool(obj.users_collection)
+
+def part_layout(props, role):
+    """Returns the (location, scale) a floor, roof or wall of the booth should have."""
+    part = booth.base_part(props, role)
+    return part.location, part.scale
+
+def build_part(props, role, collection=None):
+    """Creates the object of a single ``role`` from the booth properties."""
+    if role in BASE_ROLES:
+        obj = new_part_object(booth.base_part(props, role), collection)
+    elif role.startswith("light_"):
+        obj = add_light(props, role[len("light_"):], collection)
+    elif role == "camera":
+        obj = add_keyframed_camera(collection, bpy.context.scene)
+    else:
+        raise ValueError(f"Unknown booth part {role!r}")
+    return obj
+
+def sync_part(props, role, obj):
+    """Writes only the transform, material and visibility values that differ. Returns True if any did."""
+    changed = False
+    if role in BASE_ROLES:
+        changed = geometry.set_transform(obj, *part_layout(props, role))
+
+        color = getattr(props, f"{role}_color")
+        if geometry.object_material(obj) != materials.material_for(role, color):
+            add_material(role, color, obj)
+            changed = True
+    elif role.startswith("light_"):
+        changed = sync_light(obj, booth.booth_light(props, role[len("light_"):]))
+
+    visible = getattr(props, f"{role}_visible", None)
+    if visible is not None and obj.hide_render == visible:
+        set_object_visibility(obj, visible)
+        changed = True
+    return changed
+
+def new_rebuild_stats():
+    return {"created": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+def ensure_part(props, role, stats=None):
+    """Returns the booth's ``role`` object, creating it only if it is missing.
+
+    An existing object is brought in line with the properties instead, so
+    clicking an add button twice never stacks a second copy.
+    """
+    if stats is None:
+        stats = new_rebuild_stats()
+    obj = booth_object(props, role)
+    if not object_alive(obj):
+        obj = build_part(props, role, props.collection)
+        register_booth_objects(props, [obj])
+        stats["created"] += 1
+    elif sync_part(props, role, obj):
+        stats["updated"] += 1
+    else:
+        stats["unchanged"] += 1
+    return obj
+
+def sync_poles(props, stats=None):
+    """Makes the booth's poles match pole count, instancing and color.
+
+    Poles that are still wanted keep their current position. Missing ones are
+    added at their row of the pole stream, surplus ones and poles of the other
+    instancing mode are deleted. Returns the pole objects.
+    """
+    if stats is None:
+        stats = new_rebuild_stats()
+    prune_booth_elements(props)
+    count = props.pole_count
+    cloud = props.pole_cloud_object if object_alive(props.pole_cloud_object) else None
+    singles = booth_elements(props, "pole")
+
+    surplus = []
+    if props.pole_instancing == 'GEOMETRY_NODES':
+        surplus.extend(singles)
+        if cloud is None:
+            created = generate_poles(count, props.pole_pos_range, props.pole_color, props.collection,
+                                     'GEOMETRY_NODES', props.seed)
+            register_booth_objects(props, created)
+            stats["created"] += 1
+            poles = created
+        else:
+            points = geometry.get_instancer_points(cloud)
+            if len(points) != count:
+                positions = placement.sample_positions(props.seed, "pole", count, props.pole_pos_range)
+                wanted = placement.to_points(positions, booth.POLE_Z_LOC)
+                keep = min(len(points), count)
+                wanted[:keep] = points[:keep]
+                geometry.set_instancer_points(cloud, wanted)
+                stats["updated"] += 1
+            else:
+                stats["unchanged"] += 1
+            poles = [cloud]
+    else:
+        if cloud is not None:
+            surplus.append(cloud)
+        kept = {}
+        for obj in singles:
+            index = obj.get("gb_index", 0)
+            if index < count and index not in kept:
+                kept[index] = obj
+            else:
+                surplus.append(obj)
+        stats["unchanged"] += len(kept)
+
+        missing = [i for i in range(count) if i not in kept]
+        created = []
+        if missing:
+            positions = placement.sample_positions(props.seed, "pole", count, props.pole_pos_range)
+            for i in missing:
+                x_loc, y_loc = positions[i].tolist()
+                pole_obj = create_single_pole(x_loc, y_loc, booth.POLE_Z_SCALE, booth.POLE_Z_LOC,
+                                              name=f"Booth_Pole_{i+1}", collection=props.collection)
+                tag_element(pole_obj, "pole", i)
+                created.append(pole_obj)
+            register_booth_objects(props, created)
+            stats["created"] += len(created)
+        poles = list(kept.values()) + created
+
+    materials.assign_all(poles, "pole", props.pole_color)
+    if surplus:
+        stats["removed"] += len(surplus)
+        remove_objects(surplus)
+        prune_booth_elements(props)
+    return poles
+
+def rebuild_booth(props, lights=True):
+    """Diffs the booth properties against the booth's objects and fixes only what differs.
+
+    Missing parts are created, existing ones updated in place and surplus or
+    duplicate ones deleted, so rebuilding any number of times leaves exactly
+    one booth. Tables, chairs and totems added by hand are kept; a booth
+    without any gets one of each. Returns counts of created, updated, removed
+    and unchanged objects.
+    """
+    with object_batch():
+        return sync_booth(props, lights)
+
+def sync_booth(props, lights):
+    """The body of rebuild_booth, run inside one object batch."""
+    stats = new_rebuild_stats()
+    for role in BASE_ROLES:
+        ensure_part(props, role, stats)
+    if lights:
+        sync_lights(props, stats)
+
+    prune_booth_elements(props)
+    seen = set()
+    duplicates = []
+    for obj in booth_elements(props):
+        key = (obj.get("gb_kind"), obj.get("gb_index", 0))
+        if key[0] != "pole" and key in seen:
+            duplicates.append(obj)
+        seen.add(key)
+    if duplicates:
+        stats["removed"] += len(duplicates)
+        remove_objects(duplicates)
+        prune_booth_elements(props)
+
+    created = []
+    for kind in booth.ELEMENT_SIZES:
+        if not booth_elements(props, kind):
+            created.append(new_part_object(booth.element_part(props, kind), props.collection))
+    register_booth_objects(props, created)
+    stats["created"] += len(created)
+
+    created_before_poles = stats["created"]
+    sync_poles(props, stats)
+
+    # Only re-arrange when new elements may have landed on top of others
+    if props.avoid_overlaps and (created or stats["created"] > created_before_poles):
+        objects = booth_elements(props)
+        if props.pole_cloud_object is not None:
+            objects.append(props.pole_cloud_object)
+        arrange_elements(objects, props)
+    stats["vertices"] = apply_detail(props, props.id_data)
+    return stats
+
+def summarize_rebuild(stats):
+    summary = (f"Created {stats['created']}, updated {stats['updated']}, removed {stats['removed']}, "
+               f"kept {stats['unchanged']} object(s)")
+    if "vertices" in stats:
+        summary += f", {stats['vertices']} vertices"
+    return summary
+
+# ______________DETAIL______________
+
+# (scene name, booth data path) -> evaluated vertex count, as of the last detail pass
+vertex_counts = {}
+
+def booth_key(props):
+    return (props.id_data.name, props.path_from_id())
+
+def object_vertex_count(obj):
+    """Returns the vertices ``obj`` evaluates to, without evaluating it.
+
+    Meshes count their detail levels on top of the shared mesh, a pole cloud
+    one base cube per point.
+    """
+    if obj.type != 'MESH':
+        return 0
+    if geometry.is_instancer(obj):
+        return len(obj.data.vertices) * booth.cube_counts(0)[0]
+    mesh = obj.data
+    counts = (len(mesh.vertices), len(mesh.edges), len(mesh.polygons))
+    return booth.subdivided_counts(*counts, geometry.detail_level(obj))[0]
+
+def vertex_count(objects):
+    return sum(object_vertex_count(obj) for obj in objects)
+
+def booth_viewpoints(props, scene):
+    """Returns world space points the 'NEAR_CAMERA' detail mode measures from.
+
+    That is the scene camera, or the booth's own camera keys while the scene
+    has none.
+    """
+    if scene is not None and scene.camera is not None:
+        return [tuple(scene.camera.matrix_world.translation)]
+    root = props.root_object
+    points = booth.camera_viewpoints()
+    if root is None:
+        return points
+    return [tuple(root.matrix_world @ Vector(point)) for point in points]
+
+def booth_mesh_objects(props):
+    """Returns the booth's floor, roof, walls, elements and poles."""
+    objects = [booth_object(props, role) for role in BASE_ROLES]
+    objects = [obj for obj in objects if obj is not None]
+    objects.extend(booth_elements(props))
+    if props.pole_cloud_object is not None:
+        objects.append(props.pole_cloud_object)
+    return objects
+
+def apply_detail(props, scene=None):
+    """Adds or removes detail modifiers so the booth matches its detail settings.
+
+    Parts stay at base resolution unless the mode asks for detail, poles
+    always do. Returns the booth's vertex count, which is also kept in
+    ``vertex_counts`` for the panel.
+    """
+    objects = booth_mesh_objects(props)
+    viewpoints = booth_viewpoints(props, scene) if props.detail_mode == 'NEAR_CAMERA' else None
+    for obj in objects:
+        if obj.get("gb_kind") == "pole":
+            levels = 0
+        else:
+            levels = booth.detail_level(tuple(obj.matrix_world.translation), props, viewpoints)
+        geometry.set_detail(obj, levels)
+    count = vertex_counts[booth_key(props)] = vertex_count(objects)
+    return count
+
+# ______________BOOTH INSTANCES______________
+
+# Booth instances are laid out on a grid of this many columns, this far apart
+BOOTH_GRID_COLUMNS = 10
+BOOTH_SPACING = 10.0
+
+def add_booth_instance(scene, name=""):
+    """Adds a booth with its own parameters, collection, root empty and registry.
+
+    The new booth becomes the active one. Returns its properties.
+    """
+    booths = scene.generative_booths
+    index = len(booths)
+    if not name:
+        taken = {booth.name for booth in booths}
+        number = index + 1
+        while f"Booth_{number:03d}" in taken:
+            number += 1
+        name = f"Booth_{number:03d}"
+
+    props = booths.add()
+    props.name = name
+
+    collection = bpy.data.collections.new(name)
+    scene.collection.children.link(collection)
+    root = bpy.data.objects.new(f"{name}_Root", None)
+    root.location = ((index % BOOTH_GRID_COLUMNS) * BOOTH_SPACING,
+                     (index // BOOTH_GRID_COLUMNS) * BOOTH_SPACING, 0.0)
+    collection.objects.link(root)
+
+    props.collection = collection
+    props.root_object = root
+    scene.generative_booth_index = index
+    return props
+
+def remove_booth_instance(scene, index):
+    """Deletes a booth instance together with its collection and objects."""
+    booths = scene.generative_booths
+    collection = booths[index].collection
+    if collection is not None:
+        remove_booth_collection(collection)
+    booths.remove(index)
+    scene.generative_booth_index = min(index, len(booths) - 1)
+
+def booth_instance_steps(scene, name, layout):
+    """Builds ``layout`` into the booth instance ``name`` one object per step.
+
+    Every object is registered with the booth as soon as it exists, so removing
+    the booth at any point also removes everything built so far. The booth is
+    looked up again for every object, because adding or removing booths while
+    the build waits between steps moves their properties in memory. Stops early
+    if the booth was removed meanwhile.
+    """
+    objects = []
+    collection = scene.generative_booths[name].collection
+    for _ in layout_steps(layout, collection, objects, scene):
+        props = scene.generative_booths.get(name)
+        if props is None:
+            return
+        register_booth_objects(props, objects[-1:])
+        yield
+
+
+# ______________SPECS______________
+
+def spec_from_booth(props):
+    """Describes a booth, with the placement of each of its elements, as a spec."""
+    params = {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in vars(booth_params(props)).items() if key != "name"
+    }
+
+    elements = []
+    for obj in booth_elements(props):
+        mat = geometry.object_material(obj)
+        elements.append(specs.element_entry(
+            obj["gb_kind"], obj.get("gb_index", 0), obj.location, obj.scale,
+            obj.get("gb_generation", 0), mat.diffuse_color if mat is not None else None
+        ))
+
+    cloud = props.pole_cloud_object
+    pole_cloud = geometry.get_instancer_points(cloud).tolist() if object_alive(cloud) else None
+    return specs.new_spec(params, elements, pole_cloud, has_lights(props), props.name)
+
+def spec_from_params(params, lights=True):
+    """Describes the booth a parameter namespace builds as a spec without placements."""
+    values = {key: value for key, value in vars(params).items() if key != "name"}
+    return specs.new_spec(values, lights=lights, name=params.name)
+
+def spec_params(spec):
+    """Returns the booth parameters of a spec as a namespace, with defaults for missing ones.
+
+    Parameters the add-on does not know (any more) are ignored.
+    """
+    values = {}
+    for prop in GenerativeBoothProperties.bl_rna.properties:
+        if prop.type not in BOOTH_PARAM_TYPES:
+            continue
+        if getattr(prop, "is_array", False):
+            values[prop.identifier] = tuple(prop.default_array)
+        else:
+            values[prop.identifier] = prop.default
+
+    for key, value in spec["params"].items():
+        if key in values and key != "name":
+            values[key] = tuple(value) if isinstance(value, list) else value
+    values["name"] = spec["name"]
+    return types.SimpleNamespace(**values)
+
+def has_placements(spec):
+    return bool(spec["elements"]) or spec["pole_cloud"] is not None
+
+def place_spec_elements(spec, objects, collection=None):
+    """Moves the elements among ``objects`` to the placements recorded in ``spec``.
+
+    Elements the spec lists but ``objects`` lacks are created, elements it does
+    not list are deleted. Returns the created objects.
+    """
+    by_key = {}
+    surplus = []
+    cloud = None
+    for obj in objects:
+        if obj.get("gb_kind") not in ELEMENT_KINDS:
+            continue
+        if geometry.is_instancer(obj):
+            cloud = obj
+            continue
+        key = (obj["gb_kind"], obj.get("gb_index", 0))
+        if key in by_key:
+            surplus.append(obj)
+        else:
+            by_key[key] = obj
+
+    created = []
+    for entry in spec["elements"]:
+        kind, index = entry["kind"], entry["index"]
+        location, scale = entry["location"], entry["scale"]
+        obj = by_key.pop((kind, index), None)
+        if obj is None:
+            if kind == "pole":
+                obj = create_single_pole(location[0], location[1], scale[2], location[2],
+                                         name=f"Booth_Pole_{index+1}", collection=collection)
+            else:
+                obj = geometry.new_cube_object("Cube", location, scale, collection=collection)
+            tag_element(obj, kind, index)
+            created.append(obj)
+
+        geometry.set_transform(obj, location, scale)
+        obj["gb_generation"] = entry["generation"]
+        if entry.get("color") is not None:
+            add_material(kind, entry["color"], obj)
+
+    if cloud is not None and spec["pole_cloud"] is not None:
+        geometry.set_instancer_points(cloud, spec["pole_cloud"])
+
+    remove_objects(surplus + list(by_key.values()))
+    return created
+
+def write_booth_params(props, params):
+    """Writes a parameter namespace to booth properties as raw values, keeping the booth's name."""
+    for prop in props.bl_rna.properties:
+        if prop.type not in BOOTH_PARAM_TYPES or prop.identifier == "name":
+            continue
+        value = getattr(params, prop.identifier)
+        if prop.type == 'ENUM':
+            setattr(props, prop.identifier, value)
+        else:
+            props[prop.identifier] = value
+
+def apply_spec(props, spec):
+    """Makes a booth match a spec: parameters first, then parts, then placements.
+
+    Parameters are written as raw values so no update callback fires while
+    they change one by one; the rebuild then syncs the objects in one pass.
+    Returns the rebuild counts.
+    """
+    write_booth_params(props, spec_params(spec))
+    stats = rebuild_booth(props, lights=spec["lights"])
+    if has_placements(spec):
+        objects = booth_elements(props)
+        if props.pole_cloud_object is not None:
+            objects.append(props.pole_cloud_object)
+        register_booth_objects(props, place_spec_elements(spec, objects, props.collection))
+        prune_booth_elements(props)
+    return stats
+
+def build_booth_from_spec(spec, collection, camera=False):
+    """Builds the booth of a spec into ``collection`` without touching any scene properties.
+
+    Returns every object of the booth.
+    """
+    objects = build_booth(spec_params(spec), collection, lights=spec["lights"], camera=camera)
+    if has_placements(spec):
+        place_spec_elements(spec, objects, collection)
+        objects = list(collection.all_objects)
+    return objects
+
+def generate_from_specs(context, booth_specs, output='COLLECTIONS', directory="", camera=False,
+                        spacing=12.0, file_format='BLEND', booth_cache=None):
+    """Builds one booth per spec, either into collections or into files.
+
+    ``booth_specs`` may be any iterable, e.g. specs.iter_specs(path), so a spec
+    file is read one booth at a time. Returns per-booth results like
+    generate_variants.
+    """
+    return list(spec_steps(context, booth_specs, output, directory, camera, spacing, file_format, booth_cache))
+
+def spec_steps(context, booth_specs, output='COLLECTIONS', directory="", camera=False,
+               spacing=12.0, file_format='BLEND', booth_cache=None):
+    """Builds the booths of generate_from_specs one at a time, yielding each result."""
+    if output == 'FILES':
+        directory = bpy.path.abspath(directory)
+        os.makedirs(directory, exist_ok=True)
+
+    for index, spec in enumerate(booth_specs):
+        start = time.perf_counter()
+        name = spec["name"] or f"Booth_Spec_{index}"
+
+        result = {"index": index, "name": name}
+        result.update(batch_booth(
+            context, spec, name, f"booth_spec_{index:05d}_{bpy.path.clean_name(name)}",
+            ((index % BOOTH_GRID_COLUMNS) * spacing, (index // BOOTH_GRID_COLUMNS) * spacing, 0.0),
+            output, directory, file_format, camera, booth_cache
+        ))
+        result["seconds"] = time.perf_counter() - start
+        yield result
+
+# ______________CACHE______________
+
+DEFAULT_CACHE_MB = 1024
+
+# Version of what a spec builds. It is part of every cache key, so bump it with
+# any change to the generated objects, meshes, modifiers or lights; otherwise
+# caches keep serving booths built the old way. 2: base resolution parts with
+# detail modifiers, 3: light rigs on shared light datablocks.
+GENERATOR_VERSION = 3
+
+def addon_preferences():
+    """Returns the add-on preferences, or None when the add-on runs without being enabled."""
+    addon = bpy.context.preferences.addons.get(__package__)
+    return addon.preferences if addon is not None else None
+
+def default_cache_directory():
+    return os.path.join(tempfile.gettempdir(), "generative_booth_cache")
+
+def booth_cache():
+    """Returns the booth cache set up in the preferences, or None if caching is off."""
+    prefs = addon_preferences()
+    if prefs is None or not prefs.use_cache:
+        return None
+    directory = bpy.path.abspath(prefs.cache_directory) if prefs.cache_directory else default_cache_directory()
+    return cache.open_cache(directory, prefs.cache_max_mb * 1024 * 1024)
+
+def booth_cache_key(spec, camera=False, file_format='BLEND'):
+    """Hashes a spec with everything else that changes the generated file."""
+    return cache.spec_key(spec, bl_info["version"], (GENERATOR_VERSION, specs.SPEC_VERSION, camera, file_format))
+
+def adopt_appended(objects):
+    """Points appended booth objects back at the file's shared datablocks.
+
+    Appending brings copies such as "GB_Cube_5.001" or "GB_floor_ffffffff.001"
+    whenever the file already has the original; those are swapped for the
+    original and removed.
+    """
+    for obj in objects:
+        mesh = obj.data
+        if isinstance(mesh, bpy.types.Mesh) and "gb_primitive" in mesh:
+            shared = geometry.shared_mesh(mesh["gb_primitive"], mesh["gb_cuts"])
+            if shared != mesh:
+                mesh.user_remap(shared)
+                bpy.data.meshes.remove(mesh)
+
+        for slot in obj.material_slots:
+            mat = slot.material
+            if materials.is_managed(mat):
+                interned = materials.material_for(mat["gb_role"], mat.diffuse_color)
+                if interned != mat:
+                    slot.material = interned
+                    materials.release(mat)
+
+        modifier = obj.modifiers.get("GB_Instances")
+        if modifier is not None and modifier.node_group is not None:
+            group = geometry.instancer_node_group()
+            old = modifier.node_group
+            if old != group:
+                modifier.node_group = group
+                if old.users == 0:
+                    bpy.data.node_groups.remove(old)
+
+def append_cached_booth(path, name, parent):
+    """Appends the booth collection of a cached .blend into ``parent``. Returns it and its objects."""
+    with bpy.data.libraries.load(path, link=False) as (data_from, data_to):
+        data_to.collections = list(data_from.collections)
+
+    collection = data_to.collections[0]
+    # libraries.write stored it with a fake user
+    collection.use_fake_user = False
+    collection.name = name
+    parent.children.link(collection)
+    objects = list(collection.all_objects)
+    adopt_appended(objects)
+    return collection, objects
+
+def build_cached(context, spec, name, booth_cache, camera=False, parent=None):
+    """Appends the booth of ``spec`` from the cache, or builds and caches it on a miss.
+
+    Returns the collection, its objects and whether it came from the cache.
+    """
+    if parent is None:
+        parent = context.scene.collection
+
+    key = booth_cache_key(spec, camera)
+    path = booth_cache.lookup(key, ".blend")
+    if path is not None:
+        collection, objects = append_cached_booth(path, name, parent)
+        return collection, objects, True
+
+    collection = bpy.data.collections.new(name)
+    parent.children.link(collection)
+    objects = build_booth_from_spec(spec, collection, camera)
+
+    pending = booth_cache.pending_path(key, ".blend")
+    bpy.data.libraries.write(pending, {collection}, fake_user=True)
+    booth_cache.commit(key, ".blend", pending)
+    return collection, objects, False
+
+def build_batch_collection(context, spec, name, camera, stages):
+    start = time.perf_counter()
+    collection = bpy.data.collections.new(name)
+    context.scene.collection.children.link(collection)
+    objects = build_booth_from_spec(spec, collection, camera)
+    stages["build"] = time.perf_counter() - start
+    return collection, objects
+
+def batch_booth(context, spec, name, stem, location, output, directory, file_format,
+                camera=False, booth_cache=None):
+    """Builds one booth of a batch, or takes it from ``booth_cache``, and stores it.
+
+    For FILES output a cached file is copied to the output directory as is;
+    no booth is built at all. Returns the result dict of store_batch_booth,
+    plus whether the cache was hit.
+    """
+    stages = {}
+    if booth_cache is None:
+        collection, objects = build_batch_collection(context, spec, name, camera, stages)
+        return store_batch_booth(context, collection, objects, stem, f"{name}_Root", location,
+                                 output, directory, file_format, stages)
+
+    if output == 'FILES':
+        extension = EXPORT_EXTENSIONS[file_format]
+        key = booth_cache_key(spec, camera, file_format)
+        start = time.perf_counter()
+        cached = booth_cache.lookup(key, extension)
+        if cached is not None:
+            path = os.path.join(directory, f"{stem}{extension}")
+            shutil.copyfile(cached, path)
+            stages["cache"] = time.perf_counter() - start
+            return {"path": path, "cached": True, "stages": stages}
+
+        collection, objects = build_batch_collection(context, spec, name, camera, stages)
+        result = store_batch_booth(context, collection, objects, stem, f"{name}_Root", location,
+                                   output, directory, file_format, stages)
+        start = time.perf_counter()
+        booth_cache.store(key, extension, result["path"])
+        stages["cache"] = time.perf_counter() - start
+        result["cached"] = False
+        return result
+
+    start = time.perf_counter()
+    collection, objects, hit = build_cached(context, spec, name, booth_cache, camera)
+    stages["build"] = time.perf_counter() - start
+    result = store_batch_booth(context, collection, objects, stem, f"{name}_Root", location,
+                               output, directory, file_format, stages)
+    result["cached"] = hit
+    return result
+
+# ______________VARIANTS______________
+
+# Parameter ranges sampled by default when generating variants
+DEFAULT_VARIANT_RANGES = {
+    "floor_width": (3.0, 8.0),
+    "floor_length": (3.0, 8.0),
+    "pole_count": (2, 8),
+}
+
+def sample_variant(base, seed, ranges):
+    """Returns a copy of ``base`` with every parameter in ``ranges`` drawn from ``seed``.
+
+    Roof and wall lengths follow the sampled floor so every variant stays closed.
+    """
+    variant_rng = rng.element_rng(seed, "variant")
+    values = dict(vars(base))
+
+    for name in sorted(ranges):
+        low, high = ranges[name]
+        if isinstance(values[name], bool) or not isinstance(values[name], (int, float)):
+            raise ValueError(f"Cannot sample non-numeric booth parameter {name!r}")
+        if isinstance(values[name], int):
+            values[name] = variant_rng.randint(int(low), int(high))
+        else:
+            values[name] = variant_rng.uniform(low, high)
+
+    fit_to_floor(values)
+    values["seed"] = seed
+    return types.SimpleNamespace(**values)
+
+def fit_to_floor(values):
+    """Makes roof and wall lengths in ``values`` follow the floor so the booth stays closed."""
+    values["roof_width"] = values["floor_width"]
+    values["roof_length"] = values["floor_length"]
+    values["back_wall_length"] = values["floor_width"]
+    values["left_wall_length"] = values["floor_length"]
+    values["right_wall_length"] = values["floor_length"]
+
+EXPORT_EXTENSIONS = {
+    'BLEND': ".blend",
+    'GLTF': ".glb",
+    'FBX': ".fbx",
+    'OBJ': ".obj",
+}
+
+def export_booth_collection(context, collection, path, file_format='BLEND'):
+    """Writes a booth collection to ``path`` as a .blend library, binary glTF, FBX or OBJ."""
+    if file_format == 'BLEND':
+        bpy.data.libraries.write(path, {collection}, fake_user=True)
+        return
+
+    view_layer = context.view_layer
+    previous = view_layer.active_layer_collection
+    view_layer.active_layer_collection = view_layer.layer_collection.children[collection.name]
+    try:
+        if file_format == 'GLTF':
+            bpy.ops.export_scene.gltf(filepath=path, export_format='GLB', use_active_collection=True)
+        elif file_format == 'FBX':
+            bpy.ops.export_scene.fbx(filepath=path, use_active_collection=True)
+        elif file_format == 'OBJ':
+            # The OBJ exporter has no collection filter, it goes by selection.
+            # No .mtl either: a second file per booth would not survive the cache.
+            geometry.select_objects(list(collection.all_objects), context)
+            bpy.ops.wm.obj_export(filepath=path, export_selected_objects=True, export_materials=False)
+        else:
+            raise ValueError(f"Unknown export format: {file_format!r}")
+    finally:
+        view_layer.active_layer_collection = previous
+
+def purge_orphans():
+    """Removes every datablock nothing uses any more. Returns how many went away."""
+    return bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+
+def datablock_count():
+    """Returns the number of objects, meshes, materials, lights and collections in the file."""
+    data = bpy.data
+    return sum(len(blocks) for blocks in (data.objects, data.meshes, data.materials,
+                                          data.lights, data.collections, data.node_groups))
+
+def store_batch_booth(context, collection, objects, stem, root_name, location, output, directory,
+                      file_format, stages=None):
+    """Puts a freshly built batch booth where the batch wants it.
+
+    FILES output streams: the collection is exported to ``directory/stem``,
+    removed, and every orphan it left behind is purged before the next booth
+    is built, so the file does not grow with the batch. Otherwise the booth is
+    parented to a root empty at ``location``.
+
+    Returns the path or collection name as a result dict, with the time of
+    every stage in ``stages`` and the booth's vertex count.
+    """
+    if stages is None:
+        stages = {}
+    vertices = vertex_count(objects)
+    if output == 'FILES':
+        path = os.path.join(directory, f"{stem}{EXPORT_EXTENSIONS[file_format]}")
+        start = time.perf_counter()
+        export_booth_collection(context, collection, path, file_format)
+        stages["export"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        remove_booth_collection(collection)
+        purge_orphans()
+        stages["purge"] = time.perf_counter() - start
+        return {"path": path, "stages": stages, "datablocks": datablock_count(), "vertices": vertices}
+
+    root = bpy.data.objects.new(root_name, None)
+    root.location = location
+    collection.objects.link(root)
+    for obj in objects:
+        obj.parent = root
+    return {"collection": collection.name, "stages": stages, "vertices": vertices}
+
+def generate_variants(context, seeds, ranges=None, output='COLLECTIONS', directory="",
+                      lights=True, camera=True, spacing=12.0, file_format='BLEND', booth_cache=None):
+    """Builds one complete booth per seed, either into collections or into files.
+
+    Returns a list of per-variant results with the seed, the build time in
+    seconds and where the booth ended up.
+    """
+    return list(variant_steps(context, seeds, ranges, output, directory, lights, camera, spacing,
+                              file_format, booth_cache))
+
+def variant_steps(context, seeds, ranges=None, output='COLLECTIONS', directory="",
+                  lights=True, camera=True, spacing=12.0, file_format='BLEND', booth_cache=None):
+    """Builds the variants of generate_variants one at a time, yielding each result."""
+    if ranges is None:
+        ranges = DEFAULT_VARIANT_RANGES
+    if output == 'FILES':
+        directory = bpy.path.abspath(directory)
+        os.makedirs(directory, exist_ok=True)
+
+    base = booth_params(active_booth(context.scene))
+    seeds = list(seeds)
+    columns = max(1, math.ceil(math.sqrt(len(seeds))))
+
+    for index, seed in enumerate(seeds):
+        start = time.perf_counter()
+
+        params = sample_variant(base, seed, ranges)
+
+        result = {"seed": seed}
+        result.update(batch_booth(
+            context, spec_from_params(params, lights), f"Booth_Variant_{seed}", f"booth_variant_{seed:05d}",
+            ((index % columns) * spacing, (index // columns) * spacing, 0.0),
+            output, directory, file_format, camera, booth_cache
+        ))
+
+        result["seconds"] = time.perf_counter() - start
+        yield result
+
+def remove_variant_results(results):
+    """Deletes what variants produced: their collections, or their files."""
+    for result in results:
+        collection = bpy.data.collections.get(result.get("collection", ""))
+        if collection is not None:
+            remove_booth_collection(collection)
+        path = result.get("path")
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+def format_stages(stages):
+    """Formats stage timings in seconds as e.g. "build 12.3 ms, export 45.6 ms"."""
+    return ", ".join(f"{stage} {seconds * 1000.0:.1f} ms" for stage, seconds in stages.items())
+
+def summarize_variants(results):
+    """Formats the total time, throughput and time per stage of a variant batch."""
+    total = sum(result["seconds"] for result in results)
+    rate = len(results) / total if total > 0 else 0.0
+    stages = {}
+    for result in results:
+        for stage, seconds in result.get("stages", {}).items():
+            stages[stage] = stages.get(stage, 0.0) + seconds
+    summary = f"Generated {len(results)} booth variants in {total:.2f} s ({rate:.1f} variants/s)"
+    if stages:
+        summary += "; " + ", ".join(f"{stage} {seconds:.2f} s" for stage, seconds in stages.items())
+    return summary
+
+# ______________EXPO HALL______________
+
+HALL_NAME = "Expo_Hall"
+
+def booth_config_key(params):
+    """Returns a hashable key that is equal for booths that would be built identically."""
+    return tuple(sorted(vars(params).items()))
+
+def sample_hall_booth(base, seed, index, jitter, step, layouts):
+    """Returns the parameters of booth ``index`` of a hall.
+
+    Floor width and length are jittered by up to +-``jitter`` and snapped to
+    ``step``, and the elements use one of ``layouts`` seeds. Snapping keeps the
+    number of distinct booths small, so most booths share a configuration.
+    """
+    booth_rng = rng.element_rng(seed, "hall_booth", index)
+    values = dict(vars(base))
+
+    for name in ("floor_width", "floor_length"):
+        value = values[name] + booth_rng.uniform(-jitter, jitter)
+        if step > 0:
+            value = round(value / step) * step
+        values[name] = min(8.0, max(3.0, value))
+
+    fit_to_floor(values)
+    values["seed"] = base.seed + booth_rng.randrange(max(1, layouts))
+    return types.SimpleNamespace(**values)
+
+def remove_expo_hall(name=HALL_NAME):
+    """Deletes a generated hall with its booth instances and booth configurations."""
+    hall = bpy.data.collections.get(name)
+    if hall is None:
+        return
+    children = list(hall.children_recursive)
+    remove_booth_collection(hall)
+    for child in children:
+        bpy.data.collections.remove(child)
+
+def generate_expo_hall(context, rows, columns, aisle_width=3.0, jitter=0.0, step=0.5, layouts=4,
+                       seed=0, lights=False, deduplicate=True, booth_cache=None):
+    """Lays out ``rows`` x ``columns`` booths with aisles between them.
+
+    Each distinct booth configuration is built once into a collection of the
+    hidden "Expo_Hall_Booths" library, and every booth of the hall is an empty
+    instancing one of those collections. Memory therefore grows with the
+    number of distinct configurations, not with the number of booths.
+
+    Returns a dict with the booth count, the number of built configurations
+    and the time taken in seconds.
+    """
+    start = time.perf_counter()
+    remove_expo_hall()
+
+    base = booth_params(active_booth(context.scene))
+    booths = [
+        sample_hall_booth(base, seed, index, jitter, step, layouts)
+        for index in range(rows * columns)
+    ]
+    pitch_x = max(params.floor_width for params in booths) + aisle_width
+    pitch_y = max(params.floor_length for params in booths) + aisle_width
+
+    hall = bpy.data.collections.new(HALL_NAME)
+    context.scene.collection.children.link(hall)
+    library = bpy.data.collections.new(f"{HALL_NAME}_Booths")
+    hall.children.link(library)
+    # The configurations are only shown through their instances
+    context.view_layer.layer_collection.children[hall.name].children[library.name].exclude = True
+
+    configurations = {}
+    for index, params in enumerate(booths):
+        key = booth_config_key(params) if deduplicate else index
+        collection = configurations.get(key)
+        if collection is None:
+            name = f"{HALL_NAME}_Booth_Config_{len(configurations) + 1}"
+            if booth_cache is not None:
+                collection, _objects, _hit = build_cached(
+                    context, spec_from_params(params, lights), name, booth_cache, parent=library
+                )
+            else:
+                collection = bpy.data.collections.new(name)
+                library.children.link(collection)
+                build_booth(params, collection, lights=lights, camera=False)
+            configurations[key] = collection
+
+        row, column = divmod(index, columns)
+        instance = bpy.data.objects.new(f"{HALL_NAME}_Booth_{row + 1}_{column + 1}", None)
+        instance.instance_type = 'COLLECTION'
+        instance.instance_collection = collection
+        instance.location = (column * pitch_x, row * pitch_y, 0.0)
+        hall.objects.link(instance)
+
+    return {"booths": len(booths), "configurations": len(configurations), "seconds": time.perf_counter() - start}
+
+# ______________DIAGNOSTICS______________
+
+def instrument_class(cls):
+    """Routes an operator's execute, or the update callbacks of a property group, through the timers.
+
+    Called before registering, so recording can be switched on at any time
+    without re-registering anything.
+    """
+    if issubclass(cls, bpy.types.Operator) and "execute" in cls.__dict__:
+        cls.execute = instrument.timed(cls.bl_idname, "operator", cls.execute)
+
+    annotations = cls.__dict__.get("__annotations__", {})
+    for name, prop in annotations.items():
+        keywords = getattr(prop, "keywords", None)
+        if not keywords or keywords.get("update") is None:
+            continue
+        update = instrument.timed(f"{cls.__name__}.{name}", "update", keywords["update"])
+        annotations[name] = prop.function(**dict(keywords, update=update))
+
+@bpy.app.handlers.persistent
+def count_depsgraph_update(scene, depsgraph):
+    """Counts every depsgraph evaluation, and the datablocks it updated, towards the last recorded call."""
+    if instrument.enabled():
+        instrument.count_evaluation(len(depsgraph.updates))
+
+def update_diagnostics(self, context):
+    if self.enabled:
+        instrument.enable(profile=self.profile)
+    else:
+        instrument.disable()
+
+# ______________TIME SLICING______________
+
+# A time sliced operator works at most this long per timer event, which fires this often
+SLICE_SECONDS = 0.04
+SLICE_INTERVAL = 0.01
+
+class TimeSlicedOperator:
+    """Mixin running an operator's work in short slices from an event timer.
+
+    ``run_slices`` takes a generator that yields after every small piece of
+    work. Each timer event runs it for at most SLICE_SECONDS inside one
+    object_batch and then returns to Blender, which redraws and handles input
+    in between, with the progress in the status bar. Esc stops the work and
+    calls the operator's ``rollback``; the end calls its ``finish``. Without a
+    window, e.g. in background mode, the steps simply run to the end.
+    """
+
+    # Whether a slice runs in one object_batch; off for steps that must see their objects synced
+    batch_slices = True
+
+    def run_slices(self, context, steps, total, label):
+        self._steps = steps
+        self._total = max(1, total)
+        self._done = 0
+        self._label = label
+        if context.window is None:
+            with self.slice_batch():
+                for _ in steps:
+                    self._done += 1
+            return self.finish(context)
+
+        wm = context.window_manager
+        wm.progress_begin(0, self._total)
+        self._timer = wm.event_timer_add(SLICE_INTERVAL, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.end_slices(context)
+            self.rollback(context)
+            self.report({'WARNING'}, f"{self._label} cancelled after {self._done} of {self._total} steps")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {"PASS_THROUGH"}
+
+        deadline = time.perf_counter() + SLICE_SECONDS
+        try:
+            with self.slice_batch():
+                while time.perf_counter() < deadline:
+                    next(self._steps)
+                    self._done += 1
+        except StopIteration:
+            self.end_slices(context)
+            return self.finish(context)
+        except Exception:
+            self.end_slices(context)
+            self.rollback(context)
+            raise
+
+        context.window_manager.progress_update(min(self._done, self._total))
+        context.workspace.status_text_set(f"{self._label}: {self._done}/{self._total}, Esc to cancel")
+        return {"PASS_THROUGH"}
+
+    def slice_batch(self):
+        return object_batch() if self.batch_slices else contextlib.nullcontext()
+
+    def end_slices(self, context):
+        self._steps.close()
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+# ----------------------------------CLASSES-----------------------------------
+
+# ______________BOOTH BASE______________
+
+#________FLOOR__________
+
+class MESH_OT_add_floor(bpy.types.Operator):
+    """Create a floor of the booth"""
+    bl_idname = "mesh.add_floor_booth"
+    bl_label = "Add Floor for the Booth"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        props = active_booth(context.scene)
+        
+        obj = ensure_part(props, "floor")
+        geometry.select_objects([obj], context)
+        return {"FINISHED"}
+
+#________ROOF__________
+class MESH_OT_add_roof(bpy.types.Operator):
+    """Create a roof of the booth"""
+    bl_idname = "mesh.add_roof_booth"
+    bl_label = "Add Roof for the Booth"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        props = active_booth(context.scene)
+        
+        obj = ensure_part(props, "roof")
+        geometry.select_objects([obj], context)
+        return {"FINISHED"}
+
+#________WALLS__________
+class MESH_OT_add_all_walls(bpy.types.Operator):
+    """Create the Back, Left, and Right walls for the booth"""
+    bl_idname = "mesh.add_all_walls"
+    bl_label = "Add ALL Walls"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        props = active_booth(context.scene)
+        with object_batch():
+            for role in ("back_wall", "left_wall", "right_wall"):
+                ensure_part(props, role)
+        return {"FINISHED"}
+
+# ______________BOOTH ELEMENTS______________
+
+#________TABLE__________
+class MESH_OT_add_table(bpy.types.Operator):
+    """Create a table for the booth"""
+    bl_idname = "mesh.add_table_booth"
+    bl_label = "Add Table for the Booth"
+    bl_options = {"UNDO"}
+    
+    def execute(self, context):
+        props = active_booth(context.scene)
+
+        obj = add_table_booth(0.4, 1, 0.8, props.table_pos_range, props.collection,
+                              seed=props.seed, index=next_element_index(props, "table")) 
+        add_material("table", props.table_color, obj)
+        register_booth_objects(props, [obj])
+        geometry.select_objects([obj], context)
+        return {"FINISHED"}
+
+class OBJECT_OT_modify_table_booth_position(bpy.types.Operator):
+    """Randomize the position of the selected Table"""
+    bl_idname = "object.modify_table_booth_position"
+    bl_label = "Randomize Table Position"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        obj = context.active_object
+        if obj is None or obj.type != 'MESH':
+            self.report({'WARNING'}, "No mesh object selected!")
+            return {'CANCELLED'}
+        
+        props = active_booth(context.scene)
+        reroll_element_position(obj, props.seed, props.table_pos_range)
+
+        return {"FINISHED"}
+
+#________CHAIR__________
+    
+class MESH_OT_add_chair(bpy.types.Operator):
+    """Create a chair for the booth"""
+    bl_idname = "mesh.add_chair_booth"
+    bl_label = "Add Chair for the Booth"
+    bl_options = {"UNDO"}
+    
+    def execute(self, context):
+        props = active_booth(context.scene)
+
+        obj = add_chair_booth(0.4, 0.4, 0.4, props.chair_pos_range, props.collection,
+                              seed=props.seed, index=next_element_index(props, "chair"))
+        add_material("chair", props.chair_color, obj)
+        register_booth_objects(props, [obj])
+        geometry.select_objects([obj], context)
+        return {"FINISHED"}
+    
+class OBJECT_OT_modify_chair_booth_position(bpy.types.Operator):
+    """Randomize the position of the selected Chair"""
+    bl_idname = "object.modify_chair_booth_position"
+    bl_label = "Randomize Chair Position"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        obj = context.active_object
+        if obj is None or obj.type != 'MESH':
+            self.report({'WARNING'}, "No mesh object selected!")
+            return {'CANCELLED'}
+        
+        props = active_booth(context.scene)
+        reroll_element_position(obj, props.seed, props.chair_pos_range)
+
+        return {"FINISHED"}
+
+#________TOTEM__________
+
+class MESH_OT_add_totem(bpy.types.Operator):
+    """Create a totem for the booth"""
+    bl_idname = "mesh.add_totem_booth"
+    bl_label = "Add Totem for the Booth"
+    bl_options = {"UNDO"}
+    
+    def execute(self, context):
+        props = active_booth(context.scene)
+        
+        obj = add_totem_booth(0.4, 0.4, 1, props.totem_pos_range, props.collection,
+                              seed=props.seed, index=next_element_index(props, "totem"))
+        add_material("totem", props.totem_color, obj)
+        register_booth_objects(props, [obj])
+        geometry.select_objects([obj], context)
+        return {"FINISHED"}
+    
+class OBJECT_OT_modify_totem_booth_position(bpy.types.Operator):
+    """Randomize the position of the selected Totem"""
+    bl_idname = "object.modify_totem_booth_position"
+    bl_label = "Randomize Totem Position"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        obj = context.active_object
+        if obj is None or obj.type != 'MESH':
+            self.report({'WARNING'}, "No mesh object selected!")
+            return {'CANCELLED'}
+        
+        props = active_booth(context.scene)
+        reroll_element_position(obj, props.seed, props.totem_pos_range)
+
+        return {"FINISHED"}
+    
+#________POLES__________
+
+class MESH_OT_add_poles(bpy.types.Operator):
+    """Create poles of the booth"""
+    bl_idname = "mesh.add_poles_booth"
+    bl_label = "Add Poles for the Booth"
+    bl_options = {"UNDO"}
+    
+    def execute(self, context):
+        props = active_booth(context.scene)
+        
+        poles = sync_poles(props)
+        # Select once at the end instead of syncing the view layer per pole
+        geometry.select_objects(poles, context)
+
+        return {"FINISHED"}
+
+class OBJECT_OT_modify_poles_position(bpy.types.Operator):
+    """Randomize the position of ALL generated Poles"""
+    bl_idname = "object.modify_poles_booth_position"
+    bl_label = "Randomize Poles Position"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        props = active_booth(context.scene)
+        prune_booth_elements(props)
+        poles = booth_poles(props)
+
+        reroll_poles(poles, props.seed, props.pole_pos_range)
+        geometry.select_objects(poles, context)
+
+        return {"FINISHED"}
+
+#________LAYOUT__________
+
+class OBJECT_OT_arrange_booth_elements(bpy.types.Operator):
+    """Re-place all tables, chairs, totems and poles so none overlap each other or the walls"""
+    bl_idname = "object.arrange_booth_elements"
+    bl_label = "Arrange Booth Elements"
+    bl_options = {"UNDO"}
+
+    def execute(self, context):
+        props = active_booth(context.scene)
+        prune_booth_elements(props)
+        objects = booth_elements(props)
+        if props.pole_cloud_object is not None:
+            objects.append(props.pole_cloud_object)
+
+        unplaced = arrange_elements(objects, props)
+        if unplaced:
+            self.report({'WARNING'}, f"{unplaced} element(s) did not fit and kept their position")
+        return {"FINISHED"}
+
+class OBJECT_OT_search_booth_layouts(bpy.types.Operator):
+    """Score thousands of candidate element layouts and keep only the best"""
+    bl_idname = "object.search_booth_layouts"
+    bl_label = "Search Booth Layouts"
+    bl_options = {"REGISTER", "UNDO"}
+
+    candidates: bpy.props.IntProperty(name="Candidates", default=2000, min=1, max=1000000)
+    keep: bpy.props.IntProperty(name="Keep", default=3, min=1, max=50, description="How many of the best layouts are built as booths")
+    output: bpy.props.EnumProperty(
+        name="Output",
+        items=[
+            ('APPLY', "Apply Best", "Move the active booth's elements to the best layout"),
+            ('COLLECTIONS', "Collections", "Build the best layouts of the booth's parameters as booths behind it"),
+        ],
+        default='APPLY'
+    )
+    aisle_width: bpy.props.FloatProperty(name="Aisle Width", default=search.AISLE_WIDTH, min=0.1, max=3.0, subtype='DISTANCE')
+    coverage_weight: bpy.props.FloatProperty(name="Coverage", default=1.0, min=0.0, max=10.0, description="Weight of the share of the floor within reach of an element")
+    clearance_weight: bpy.props.FloatProperty(name="Wall Clearance", default=1.0, min=0.0, max=10.0, description="Weight of keeping elements off the walls")
+    aisle_weight: bpy.props.FloatProperty(name="Aisles", default=1.0, min=0.0, max=10.0, description="Weight of walkable gaps between elements")
+    visibility_weight: bpy.props.FloatProperty(name="Visibility", default=1.0, min=0.0, max=10.0, description="Weight of elements the camera keys see unblocked")
+    parallel: bpy.props.BoolProperty(
+        name="Background Processes",
+        default=True,
+        description="Score candidates in a pool of Python processes while Blender stays responsive. Esc cancels"
+    )
+    workers: bpy.props.IntProperty(name="Processes", default=0, min=0, max=64, description="0 uses one per core but one")
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        props = active_booth(context.scene)
+        weights = search_weights(self.coverage_weight, self.clearance_weight, self.aisle_weight, self.visibility_weight)
+        self._start = time.perf_counter()
+        if self.output == 'APPLY':
+            self._target = element_search_space(props)
+            if self._target is None:
+                self.report({'WARNING'}, "The booth has no elements to place")
+                return {'CANCELLED'}
+            space = self._target[0]
+        else:
+            self._params = booth_params(props)
+            space = search.params_space(self._params)
+
+        if not self.parallel or context.window is None:
+            winners = search.search(space, self.candidates, self.keep, props.seed, weights, self.aisle_width)
+            return self.finish(context, winners)
+
+        try:
+            self._pool = search.PoolSearch(space, self.candidates, self.keep, props.seed, weights, self.aisle_width,
+                                           self.workers or None)
+        except Exception as error:
+            self.report({'ERROR'}, f"Could not start the layout search processes: {error}")
+            return {'CANCELLED'}
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.stop(context)
+            self.report({'WARNING'}, f"Layout search cancelled after {self._pool.scored} candidates")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {"PASS_THROUGH"}
+
+        try:
+            done = self._pool.poll()
+            winners = self._pool.winners() if done else None
+        except Exception as error:
+            # A worker failed; its exception comes back from the chunk's future
+            self.stop(context)
+            self.report({'ERROR'}, f"Layout search failed: {error}")
+            return {'CANCELLED'}
+
+        if not done:
+            context.window_manager.progress_update(int(self._pool.progress * 100))
+            context.workspace.status_text_set(
+                f"Searching booth layouts: {self._pool.scored}/{self._pool.candidates} scored, Esc to cancel"
+            )
+            return {"PASS_THROUGH"}
+        self.stop(context)
+        return self.finish(context, winners)
+
+    def stop(self, context):
+        self._pool.close()
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+
+    def finish(self, context, winners):
+        if self.output == 'APPLY':
+            _space, elements, sources = self._target
+            try:
+                apply_search_winner(elements, sources, winners[0])
+            except ReferenceError:
+                self.report({'WARNING'}, "Booth elements were deleted during the search")
+                return {'CANCELLED'}
+        else:
+            build_search_winners(context, active_booth(context.scene), self._params, winners)
+        self.report({'INFO'}, summarize_search(self.candidates, time.perf_counter() - self._start, winners))
+        return {"FINISHED"}
+
+# _____________LIGHTS AND CAMERA______________
+
+#________LIGHTS__________
+
+class OBJECT_OT_add_all_lights(bpy.types.Operator):
+    """Create all default area lights and enable visibility toggles"""
+    bl_idname = "object.add_all_lights"
+    bl_label = "Add ALL Lights"
+    bl_options = {"REGISTER", "UNDO"}
+    
+    def execute(self, context):
+        props = active_booth(context.scene)
+        props.light_top_visible = True
+        props.light_back_visible = True
+        props.light_front_visible = True
+        props.light_left_visible = True
+        props.light_right_visible = True
+        lights = sync_lights(props)
+        geometry.select_objects(lights, context)
+        return {"FINISHED"}
+
+#________CAMERA__________
+    
+class OBJECT_OT_add_keyframed_camera(bpy.types.Operator):
+    """Create a camera with keyframed position and rotation for an animation"""
+    bl_idname = "object.add_keyframed_camera"
+    bl_label = "Add Keyframed Camera"
+    bl_options = {"REGISTER", "UNDO"}
+    
+    def execute(self, context):
+        props = active_booth(context.scene)
+        cam_obj = ensure_part(props, "camera")
+        geometry.select_objects([cam_obj], context)
+        self.report({'INFO'}, "Keyframed Camera Added!")
+        return {"FINISHED"}
+
+# ______________BOOTH INSTANCES______________
+
+class OBJECT_OT_add_booth_instance(bpy.types.Operator):
+    """Add a new booth with its own parameters and collection"""
+    bl_idname = "object.add_booth_instance"
+    bl_label = "Add Booth"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        add_booth_instance(context.scene)
+        return {"FINISHED"}
+
+class OBJECT_OT_remove_booth_instance(bpy.types.Operator):
+    """Delete the active booth and everything in its collection"""
+    bl_idname = "object.remove_booth_instance"
+    bl_label = "Remove Booth"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        scene = context.scene
+        return 0 <= scene.generative_booth_index < len(scene.generative_booths)
+
+    def execute(self, context):
+        remove_booth_instance(context.scene, context.scene.generative_booth_index)
+        return {"FINISHED"}
+
+class OBJECT_OT_generate_booth(TimeSlicedOperator, bpy.types.Operator):
+    """Build a new booth from the active booth's parameters a few objects per timer event, so Blender stays responsive. Esc cancels"""
+    bl_idname = "object.generate_booth"
+    bl_label = "Generate Booth"
+    bl_options = {"REGISTER", "UNDO"}
+
+    lights: bpy.props.BoolProperty(name="Lights", default=True)
+    camera: bpy.props.BoolProperty(name="Camera", default=False, description="Also make the booth's camera the scene camera")
+
+    def execute(self, context):
+        scene = context.scene
+        params = booth_params(active_booth(scene))
+        layout = booth.booth_layout(params, self.lights, self.camera)
+
+        self._scene = scene
+        self._scene_camera = scene.camera
+        self._active_index = scene.generative_booth_index
+        props = add_booth_instance(scene)
+        write_booth_params(props, params)
+        self._name = props.name
+        return self.run_slices(context, booth_instance_steps(scene, self._name, layout),
+                               layout_step_count(layout), f"Generating {self._name}")
+
+    def rollback(self, context):
+        scene = self._scene
+        index = scene.generative_booths.find(self._name)
+        if index >= 0:
+            remove_booth_instance(scene, index)
+        if scene.camera is None:
+            scene.camera = self._scene_camera
+        scene.generative_booth_index = min(self._active_index, len(scene.generative_booths) - 1)
+
+    def finish(self, context):
+        self.report({'INFO'}, f"Generated {self._name} with {self._done} objects")
+        return {"FINISHED"}
+
+class OBJECT_OT_rebuild_booth(bpy.types.Operator):
+    """Create, update or delete only the parts of the active booth that differ from its parameters"""
+    bl_idname = "object.rebuild_booth"
+    bl_label = "Rebuild Booth"
+    bl_options = {"REGISTER", "UNDO"}
+
+    lights: bpy.props.BoolProperty(name="Lights", default=True)
+
+    def execute(self, context):
+        stats = rebuild_booth(active_booth(context.scene), self.lights)
+        self.report({'INFO'}, summarize_rebuild(stats))
+        return {"FINISHED"}
+
+class OBJECT_OT_update_booth_detail(bpy.types.Operator):
+    """Add or remove subdivision on the active booth's parts to match its detail settings"""
+    bl_idname = "object.update_booth_detail"
+    bl_label = "Update Detail"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        count = apply_detail(active_booth(context.scene), context.scene)
+        self.report({'INFO'}, f"Booth has {count} vertices")
+        return {"FINISHED"}
+
+# ______________SPECS______________
+
+SPEC_FILTER = "*.json;*.jsonl;*.msgpack"
+
+class OBJECT_OT_export_booth_spec(bpy.types.Operator, ExportHelper):
+    """Save booth parameters and element placements to a .json, .jsonl or .msgpack spec file"""
+    bl_idname = "object.export_booth_spec"
+    bl_label = "Export Booth Spec"
+
+    filename_ext = ".json"
+    # Keep .jsonl and .msgpack names as typed
+    check_extension = None
+    filter_glob: bpy.props.StringProperty(default=SPEC_FILTER, options={'HIDDEN'})
+    all_booths: bpy.props.BoolProperty(
+        name="All Booths",
+        default=False,
+        description="Write every booth of the scene instead of the active one"
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        booths = list(scene.generative_booths) if self.all_booths else []
+        if not booths:
+            booths = [active_booth(scene)]
+
+        try:
+            count = specs.write(self.filepath, (spec_from_booth(props) for props in booths))
+        except (ImportError, ValueError) as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {count} booth spec(s)")
+        return {"FINISHED"}
+
+class OBJECT_OT_import_booth_spec(bpy.types.Operator, ImportHelper):
+    """Load booths from a .json, .jsonl or .msgpack spec file"""
+    bl_idname = "object.import_booth_spec"
+    bl_label = "Import Booth Spec"
+    bl_options = {"REGISTER", "UNDO"}
+
+    filter_glob: bpy.props.StringProperty(default=SPEC_FILTER, options={'HIDDEN'})
+    target: bpy.props.EnumProperty(
+        name="Into",
+        items=[
+            ('ACTIVE', "Active Booth", "Apply the first spec of the file to the active booth"),
+            ('INSTANCES', "New Booths", "Add one booth instance per spec of the file"),
+        ],
+        default='INSTANCES'
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        count = 0
+        try:
+            for spec in specs.iter_specs(self.filepath):
+                if self.target == 'ACTIVE':
+                    apply_spec(active_booth(scene), spec)
+                    count = 1
+                    break
+                name = spec["name"] if spec["name"] not in scene.generative_booths else ""
+                apply_spec(add_booth_instance(scene, name), spec)
+                count += 1
+        except (ImportError, ValueError, KeyError) as error:
+            self.report({'ERROR'}, f"Invalid booth spec: {error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Loaded {count} booth spec(s)")
+        return {"FINISHED"}
+
+# ______________VARIANTS______________
+
+class OBJECT_OT_generate_booth_variants(TimeSlicedOperator, bpy.types.Operator):
+    """Generate a batch of complete booths, one per seed, from the current booth parameters"""
+    bl_idname = "object.generate_booth_variants"
+    bl_label = "Generate Booth Variants"
+    bl_options = {"REGISTER", "UNDO"}
+
+    seed_start: bpy.props.IntProperty(name="First Seed", default=0, min=0)
+    count: bpy.props.IntProperty(name="Variants", default=10, min=1, max=10000)
+    floor_width_range: bpy.props.FloatVectorProperty(name="Floor Width", size=2, default=(3.0, 8.0), min=3.0, max=8.0)
+    floor_length_range: bpy.props.FloatVectorProperty(name="Floor Length", size=2, default=(3.0, 8.0), min=3.0, max=8.0)
+    pole_count_range: bpy.props.IntVectorProperty(name="Poles", size=2, default=(2, 8), min=1, max=10000)
+    output: bpy.props.EnumProperty(
+        name="Output",
+        items=[
+            ('COLLECTIONS', "Collections", "Lay the variants out in this file, one collection each"),
+            ('FILES', "Files", "Export every variant to its own file and free it before building the next"),
+        ],
+        default='COLLECTIONS'
+    )
+    directory: bpy.props.StringProperty(name="Directory", subtype='DIR_PATH', default="//booth_variants")
+    file_format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ('BLEND', "Blend", "Blender library with the variant collection"),
+            ('GLTF', "glTF", "Binary glTF (.glb)"),
+            ('FBX', "FBX", "Autodesk FBX (.fbx)"),
+            ('OBJ', "OBJ", "Wavefront OBJ (.obj), geometry only"),
+        ],
+        default='BLEND'
+    )
+    lights: bpy.props.BoolProperty(name="Lights", default=True)
+    camera: bpy.props.BoolProperty(name="Camera", default=False)
+    sliced: bpy.props.BoolProperty(
+        name="Keep Responsive",
+        default=True,
+        description="Build one variant after another between redraws, with progress in the status bar. "
+                    "Esc cancels and deletes the variants built so far"
+    )
+
+    # Variants are exported right after they are built, with their objects hidden already
+    batch_slices = False
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        ranges = {
+            "floor_width": tuple(self.floor_width_range),
+            "floor_length": tuple(self.floor_length_range),
+            "pole_count": tuple(self.pole_count_range),
+        }
+        settings = dict(
+            output=self.output,
+            directory=self.directory,
+            lights=self.lights,
+            camera=self.camera,
+            file_format=self.file_format,
+            booth_cache=booth_cache()
+        )
+        seeds = range(self.seed_start, self.seed_start + self.count)
+        if not self.sliced:
+            self._results = generate_variants(context, seeds, ranges, **settings)
+            return self.finish(context)
+
+        # bpy.context rather than this call's context, which is only valid until execute returns
+        self._results = []
+        steps = (self._results.append(result) for result in variant_steps(bpy.context, seeds, ranges, **settings))
+        return self.run_slices(context, steps, len(seeds), "Generating booth variants")
+
+    def rollback(self, context):
+        remove_variant_results(self._results)
+
+    def finish(self, context):
+        self.report({'INFO'}, summarize_variants(self._results))
+        return {"FINISHED"}
+
+# ______________MATERIALS______________
+
+class OBJECT_OT_apply_booth_palette(bpy.types.Operator):
+    """Recolor every booth in the file with a palette"""
+    bl_idname = "object.apply_booth_palette"
+    bl_label = "Apply Palette"
+    bl_options = {"REGISTER", "UNDO"}
+
+    palette: bpy.props.EnumProperty(
+        name="Palette",
+        items=[(key, label, f"{label} booth colors") for key, (label, _colors) in BOOTH_PALETTES.items()]
+    )
+
+    def execute(self, context):
+        apply_palette(BOOTH_PALETTES[self.palette][1])
+        return {"FINISHED"}
+
+class OBJECT_OT_clean_booth_materials(bpy.types.Operator):
+    """Delete booth materials no object uses any more"""
+    bl_idname = "object.clean_booth_materials"
+    bl_label = "Clean Up Materials"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        removed = materials.collect_garbage()
+        self.report({'INFO'}, f"Removed {removed} unused booth material(s)")
+        return {"FINISHED"}
+
+# ______________EXPO HALL______________
+
+class OBJECT_OT_generate_expo_hall(bpy.types.Operator):
+    """Lay out a hall of booths in rows and columns, instancing identical booths"""
+    bl_idname = "object.generate_expo_hall"
+    bl_label = "Generate Expo Hall"
+    bl_options = {"REGISTER", "UNDO"}
+
+    rows: bpy.props.IntProperty(name="Rows", default=10, min=1, max=100)
+    columns: bpy.props.IntProperty(name="Columns", default=10, min=1, max=100)
+    aisle_width: bpy.props.FloatProperty(name="Aisle Width", default=3.0, min=0.0, max=20.0, unit='LENGTH')
+    jitter: bpy.props.FloatProperty(
+        name="Size Jitter", default=1.0, min=0.0, max=5.0, unit='LENGTH',
+        description="Maximum random change of each booth's floor width and length"
+    )
+    step: bpy.props.FloatProperty(
+        name="Size Step", default=0.5, min=0.0, max=5.0, unit='LENGTH',
+        description="Booth sizes snap to this step so identical booths can be instanced. 0 disables snapping"
+    )
+    layouts: bpy.props.IntProperty(
+        name="Layouts", default=4, min=1, max=1000,
+        description="Number of different element arrangements booths pick from"
+    )
+    seed: bpy.props.IntProperty(name="Seed", default=0, min=0)
+    lights: bpy.props.BoolProperty(name="Booth Lights", default=False)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        result = generate_expo_hall(
+            context, self.rows, self.columns, self.aisle_width, self.jitter, self.step,
+            self.layouts, self.seed, self.lights, booth_cache=booth_cache()
+        )
+        self.report({'INFO'}, f"Generated {result['booths']} booths from {result['configurations']} "
+                              f"configurations in {result['seconds']:.2f} s")
+        return {"FINISHED"}
+
+# ______________CACHE______________
+
+class OBJECT_OT_clear_booth_cache(bpy.types.Operator):
+    """Delete every generated booth stored in the booth cache"""
+    bl_idname = "object.clear_booth_cache"
+    bl_label = "Clear Booth Cache"
+
+    @classmethod
+    def poll(cls, context):
+        return booth_cache() is not None
+
+    def execute(self, context):
+        removed = booth_cache().clear()
+        self.report({'INFO'}, f"Removed {removed} cached booth(s)")
+        return {"FINISHED"}
+
+# ______________DIAGNOSTICS______________
+
+class OBJECT_OT_reset_booth_diagnostics(bpy.types.Operator):
+    """Forget every recorded operator and update timing"""
+    bl_idname = "object.reset_booth_diagnostics"
+    bl_label = "Reset Booth Diagnostics"
+
+    def execute(self, context):
+        instrument.reset()
+        return {"FINISHED"}
+
+class OBJECT_OT_export_booth_diagnostics(bpy.types.Operator, ExportHelper):
+    """Save the recorded timings as a JSON summary, a Chrome trace or a cProfile file"""
+    bl_idname = "object.export_booth_diagnostics"
+    bl_label = "Export Booth Diagnostics"
+
+    filename_ext = ".json"
+    # Keep .prof names as typed
+    check_extension = None
+    filter_glob: bpy.props.StringProperty(default="*.json;*.prof", options={'HIDDEN'})
+    file_format: bpy.props.EnumProperty(
+        name="Format",
+        items=[
+            ('SUMMARY', "Summary", "Calls and total, mean and max time per operator and update (.json)"),
+            ('TRACE', "Chrome Trace", "Every timed call on a timeline, for chrome://tracing or Perfetto (.json)"),
+            ('PROFILE', "cProfile", "The cProfile snapshot, for pstats or snakeviz (.prof)"),
+        ],
+        default='SUMMARY'
+    )
+
+    def execute(self, context):
+        if self.file_format == 'TRACE':
+            instrument.write_chrome_trace(self.filepath)
+        elif self.file_format == 'PROFILE':
+            if not instrument.write_profile(self.filepath):
+                self.report({'ERROR'}, "Record with cProfile enabled to export a profile")
+                return {'CANCELLED'}
+        else:
+            instrument.write_json(self.filepath)
+        self.report({'INFO'}, f"Wrote {self.filepath}")
+        return {"FINISHED"}
+
+# ------------------------------------PROPERTIES GROUP-----------------------------------
+
+class GenerativeBoothPreferences(bpy.types.AddonPreferences):
+    bl_idname = __package__
+
+    use_cache: bpy.props.BoolProperty(
+        name="Cache Generated Booths",
+        default=True,
+        description="Reuse booths generated before from the cache instead of building them again"
+    )
+    cache_directory: bpy.props.StringProperty(
+        name="Cache Directory",
+        subtype='DIR_PATH',
+        default="",
+        description="Where cached booths are stored. Empty uses the system temporary directory"
+    )
+    cache_max_mb: bpy.props.IntProperty(
+        name="Cache Size (MB)",
+        default=DEFAULT_CACHE_MB,
+        min=1,
+        description="Least recently used booths are deleted once the cache grows past this size"
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "use_cache")
+        col = layout.column()
+        col.active = self.use_cache
+        col.prop(self, "cache_directory")
+        col.prop(self, "cache_max_mb")
+
+class BoothDiagnosticsSettings(bpy.types.PropertyGroup):
+    enabled: bpy.props.BoolProperty(
+        name="Record",
+        default=False,
+        description="Time every booth operator and property update",
+        update=update_diagnostics
+    )
+    profile: bpy.props.BoolProperty(
+        name="cProfile",
+        default=False,
+        description="Also profile every timed call with cProfile. Slows the add-on down while recording",
+        update=update_diagnostics
+    )
+    rows: bpy.props.IntProperty(
+        name="Rows",
+        default=8,
+        min=1,
+        max=50,
+        description="Number of slowest calls listed in the panel"
+    )
+
+class BoothElementRef(bpy.types.PropertyGroup):
+    """Registry entry for one table, chair, totem or pole object of a booth."""
+    kind: bpy.props.StringProperty(name="Kind")
+    object: bpy.props.PointerProperty(name="Object", type=bpy.types.Object)
+
+class GenerativeBoothProperties(bpy.types.PropertyGroup):
+
+    #____________FLOOR_______________
+    
+    def update_floor_color(self, context):
+        obj = self.floor_object
+        if obj and obj.type == 'MESH':
+            add_material("floor", self.floor_color, obj)
+    
+    def update_floor_dimensions(self, context):
+        obj = self.floor_object
+        if obj and obj.type == 'MESH':
+            geometry.set_transform(obj, *part_layout(self, "floor"))
+                
+    #____________ROOF______________
+    def update_roof_color(self, context):
+        obj = self.roof_object
+        if obj and obj.type == 'MESH':
+            add_material("roof", self.roof_color, obj)
+    
+    def update_roof_dimensions(self, context):
+        obj = self.roof_object
+        if obj and obj.type == 'MESH':
+            geometry.set_transform(obj, *part_layout(self, "roof"))
+
+    #___________WALL_______________
+    def update_back_wall_visibility(self, context):
+        """Toggles the visibility of the back wall object."""
+        toggle_wall_visibility(self.back_wall_object, self.back_wall_visible)
+        
+    def update_left_wall_visibility(self, context):
+        """Toggles the visibility of the left wall object."""
+        toggle_wall_visibility(self.left_wall_object, self.left_wall_visible)
+
+    def update_right_wall_visibility(self, context):
+        """Toggles the visibility of the right wall object."""
+        toggle_wall_visibility(self.right_wall_object, self.right_wall_visible)
+
+    def update_back_wall_dimensions(self, context):
+        obj = self.back_wall_object
+        if obj is not None:
+            geometry.set_transform(obj, *part_layout(self, "back_wall"))
+
+    def update_back_wall_color(self, context):
+        obj = self.back_wall_object
+        if obj and obj.type == 'MESH':
+            add_material("back_wall", self.back_wall_color, obj)
+
+    def update_left_wall_dimensions(self, context):
+        obj = self.left_wall_object
+        if obj is not None:
+            geometry.set_transform(obj, *part_layout(self, "left_wall"))
+    
+    def update_left_wall_color(self, context):
+        obj = self.left_wall_object
+        if obj and obj.type == 'MESH':
+            add_material("left_wall", self.left_wall_color, obj)
+
+    def update_right_wall_dimensions(self, context):
+        obj = self.right_wall_object
+        if obj is not None:
+            geometry.set_transform(obj, *part_layout(self, "right_wall"))
+
+    def update_right_wall_color(self, context):
+        obj = self.right_wall_object
+        if obj and obj.type == 'MESH':
+            add_material("right_wall", self.right_wall_color, obj)
+
+    #____________FLOOR_______________
+
+    # Floor, roof and wall edits only mark their parts dirty; updates.flush
+    # applies them at most once per frame. Floor edits also dirty the walls,
+    # which are aligned to the new floor edges.
+
+    floor_color: bpy.props.FloatVectorProperty(name="Floor Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=updates.deferred("floor_color"))
+    floor_width: bpy.props.FloatProperty(name="Width", default=3.0, min=3.0, max=8.0, description="The width of the floor (X-axis)", update=updates.deferred("floor_dimensions", "back_wall_dimensions", "left_wall_dimensions", "right_wall_dimensions"))
+    floor_length: bpy.props.FloatProperty(name="Length", default=3.0, min=3.0, max=8.0, description="The length of the floor (Y-axis)", update=updates.deferred("floor_dimensions", "back_wall_dimensions", "left_wall_dimensions", "right_wall_dimensions"))
+    floor_height: bpy.props.FloatProperty(name="Height", default=0.1, min=0.01, max=0.1, description="The height of the floor", update=updates.deferred("floor_dimensions", "back_wall_dimensions", "left_wall_dimensions", "right_wall_dimensions"))
+    
+    #____________ROOF_______________
+    
+    roof_color: bpy.props.FloatVectorProperty(name="Roof Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=updates.deferred("roof_color"))
+    roof_width: bpy.props.FloatProperty(name="Width", default=3.0, min=3.0, max=8.0, description="The width of the roof", update=updates.deferred("roof_dimensions"))
+    roof_length: bpy.props.FloatProperty(name="Length", default=3.0, min=3.0, max=8.0, description="The length of the roof", update=updates.deferred("roof_dimensions"))
+    roof_height: bpy.props.FloatProperty(name="Height", default=0.1, min=0.01, max=0.1, description="The height of the roof", update=updates.deferred("roof_dimensions"))
+
+    #____________WALL_____________
+    back_wall_length: bpy.props.FloatProperty(name="Length", default=3.0, min=1.0, max=8.0, update=updates.deferred("back_wall_dimensions")) 
+    back_wall_width: bpy.props.FloatProperty(name="Thickness", default=0.1, min=0.01, max=0.1, update=updates.deferred("back_wall_dimensions"))
+    back_wall_height: bpy.props.FloatProperty(name="Height", default=2.7, min=1.0, max=2.8, update=updates.deferred("back_wall_dimensions"))
+    back_wall_visible: bpy.props.BoolProperty(name="Visible", default=True, update=updates.deferred("back_wall_visibility"))
+    back_wall_color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=updates.deferred("back_wall_color"))
+
+    left_wall_length: bpy.props.FloatProperty(name="Length", default=3.0, min=1.0, max=8.0, update=updates.deferred("left_wall_dimensions"))
+    left_wall_width: bpy.props.FloatProperty(name="Thickness", default=0.1, min=0.01, max=0.1, update=updates.deferred("left_wall_dimensions"))
+    left_wall_height: bpy.props.FloatProperty(name="Height", default=2.7, min=1.0, max=2.8, update=updates.deferred("left_wall_dimensions"))
+    left_wall_visible: bpy.props.BoolProperty(name="Visible", default=True, update=updates.deferred("left_wall_visibility"))
+    left_wall_color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=updates.deferred("left_wall_color"))
+
+    right_wall_length: bpy.props.FloatProperty(name="Length", default=3.0, min=1.0, max=8.0, update=updates.deferred("right_wall_dimensions"))
+    right_wall_width: bpy.props.FloatProperty(name="Thickness", default=0.1, min=0.01, max=0.1, update=updates.deferred("right_wall_dimensions"))
+    right_wall_height: bpy.props.FloatProperty(name="Height", default=2.7, min=1.0, max=2.8, update=updates.deferred("right_wall_dimensions"))
+    right_wall_visible: bpy.props.BoolProperty(name="Visible", default=True, update=updates.deferred("right_wall_visibility"))
+    right_wall_color: bpy.props.FloatVectorProperty(name="Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=updates.deferred("right_wall_color"))
+
+    #____________CHAIR_______________
+
+    # Element colors act on the active object, which is only known while the
+    # callback runs, so they are applied right away instead of deferred.
+
+    def update_chair_color(self, context):
+        obj = context.active_object
+        if obj and obj.type == 'MESH':
+            add_material("chair", self.chair_color, obj)
+
+    chair_color: bpy.props.FloatVectorProperty(name="Chair Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=update_chair_color)
+    chair_pos_range: bpy.props.FloatProperty(name="Random Position Range", default=1.0, min=0.1, max=4.0, description="Max distance from center for random position")
+    
+    #____________TABLE_______________
+    
+    def update_table_color(self, context):
+        obj = context.active_object
+        if obj and obj.type == 'MESH':
+            add_material("table", self.table_color, obj)
+
+    table_color: bpy.props.FloatVectorProperty(name="Table Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=update_table_color)
+    table_pos_range: bpy.props.FloatProperty(name="Random Position Range", default=1.0, min=0.1, max=4.0, description="Max distance from center for random table position")
+    
+    #____________TOTEM______________
+    
+    def update_totem_color(self, context):
+        obj = context.active_object
+        if obj and obj.type == 'MESH':
+            add_material("totem", self.totem_color, obj)
+
+    totem_color: bpy.props.FloatVectorProperty(name="Totem Color", subtype='COLOR', size=4, min=0.0, max=1.0, default=(1.0, 1.0, 1.0, 1.0), update=update_totem_color)
+    totem_pos_range: bpy.props.FloatProperty(name="Random Position Range", default=1.0, min=0.1, max=4.0, description="Max distance from center for random totem position")
+    
+    #____________REGISTRY______________
+
+    floor_object: bpy.props.PointerProperty(name="Floor", type=bpy.types.Object)
+    roof_object: bpy.props.PointerProperty(name="Roof", type=bpy.types.Object)
+    back_wall_object: bpy.props.PointerProperty(name="Back Wall", type=bpy.types.Object)
+    left_wall_object: bpy.props.PointerProperty(name="Left Wall", type=bpy.types.Object)
+    right_wall_object: bpy.props.PointerProperty(name="Right Wall", type=bpy.types.Object)
+    pole_cloud_object: bpy.props.PointerProperty(name="Pole Cloud", type=bpy.types.Object)
+    light_top_object: bpy.props.PointerProperty(name="Top Light", type=bpy.types.Object)
+    light_back_object: bpy.props.PointerProperty(name="Back Light", type=bpy.types.Object)
+    light_front_object: bpy.props.PointerProperty(name="Front Light", type=bpy.types.Object)
+    light_left_object: bpy.props.PointerProperty(name="Left Light", type=bpy.types.Object)
+    light_right_object: bpy.props.PointerProperty(name="Right Light", type=bpy.types.Object)
+    camera_object: bpy.props.PointerProperty(name="Camera", type=bpy.types.Object)
+    collection: bpy.props.PointerProperty(name="Collection", type=bpy.types.Collection)
+    root_object: bpy.props.PointerProperty(name="Root", type=bpy.types.Object)
+    elements: bpy.props.CollectionProperty(type=BoothElementRef)
+
+    #____________SEED______________
+
+    seed: bpy.props.IntProperty(
+        name="Seed",
+        default=0,
+        min=0,
+        description="Seed of the random streams every generated element draws its position from"
+    )
+
+    #____________LAYOUT______________
+
+    avoid_overlaps: bpy.props.BoolProperty(
+        name="Avoid Overlaps",
+        default=False,
+        description="Arrange generated elements so they do not overlap each other or the walls"
+    )
+    layout_gap: bpy.props.FloatProperty(
+        name="Gap",
+        default=0.1,
+        min=0.0,
+        max=2.0,
+        description="Minimum free space between two elements"
+    )
+    wall_clearance: bpy.props.FloatProperty(
+        name="Wall Clearance",
+        default=0.2,
+        min=0.0,
+        max=2.0,
+        description="Minimum free space between an element and a visible wall"
+    )
+
+    #____________POLE______________
+    
+    def update_pole_color(self, context):
+        materials.assign_all(booth_poles(self), "pole", self.pole_color)
+
+    pole_color: bpy.props.FloatVectorProperty(
+        name="Pole Color",
+        subtype='COLOR',
+        size=4,
+        min=0.0,
+        max=1.0,
+        default=(1.0, 1.0, 1.0, 1.0),
+        update=updates.deferred("pole_color")
+    )
+    pole_pos_range: bpy.props.FloatProperty(
+        name="Random Position Range", 
+        default=1.0, 
+        min=0.1, 
+        max=4.0, 
+        description="Max distance from center for random pole position"
+    )
+    pole_count: bpy.props.IntProperty(
+        name="Number of Poles", 
+        default=4, 
+        min=1, 
+        max=10000, 
+        soft_max=200,
+        description="The number of poles to generate. Use Geometry Nodes instancing for thousands"
+    )
+    pole_instancing: bpy.props.EnumProperty(
+        name="Instancing",
+        items=[
+            ('OBJECTS', "Objects", "One object per pole, all sharing a single mesh"),
+            ('GEOMETRY_NODES', "Geometry Nodes", "A single object instancing the pole mesh on points, for large pole counts"),
+        ],
+        default='OBJECTS',
+        description="How generated poles are represented in the scene"
+    )
+    
+    #____________DETAIL______________
+
+    def update_detail(self, context):
+        apply_detail(self, context.scene)
+
+    detail_mode: bpy.props.EnumProperty(
+        name="Detail",
+        items=[
+            ('BASE', "Base", "Every part at the lowest resolution"),
+            ('ALL', "All Parts", "Subdivide every part except the poles"),
+            ('NEAR_CAMERA', "Near Camera", "Subdivide only parts close to the scene camera, or the booth's camera path"),
+        ],
+        default='BASE',
+        description="Where the booth gets subdivision detail on top of its base geometry",
+        update=updates.deferred("detail")
+    )
+    detail_levels: bpy.props.IntProperty(
+        name="Levels",
+        default=2,
+        min=1,
+        max=6,
+        description="Subdivision levels added to detailed parts",
+        update=updates.deferred("detail")
+    )
+    detail_distance: bpy.props.FloatProperty(
+        name="Distance",
+        default=20.0,
+        min=0.0,
+        subtype='DISTANCE',
+        description="Parts closer than this to the camera get detail",
+        update=updates.deferred("detail")
+    )
+
+    #____________LIGHT______________
+
+    def update_light_rig(self, context):
+        # Switching rigs only replaces lights the booth already has
+        if has_lights(self):
+            with object_batch():
+                sync_lights(self)
+
+    light_rig: bpy.props.EnumProperty(
+        name="Light Rig",
+        items=[
+            ('STANDARD', "Standard", "Five area lights above and around the booth"),
+            ('SOFT', "Soft", "Large, dim lights from above and both sides"),
+            ('SHOWCASE', "Showcase", "A tight top light, a key light from the front and a rim light from behind"),
+        ],
+        default=booth.DEFAULT_LIGHT_RIG,
+        description="Template of the booth's lights. Lights of equal size and energy share one light datablock",
+        update=updates.deferred("light_rig")
+    )
+    light_top_visible: bpy.props.BoolProperty(name="Top Light", default=True, description="Toggle visibility of the Top Area Light", update=light_visibility_update("top"))
+    light_back_visible: bpy.props.BoolProperty(name="Back Light", default=True, description="Toggle visibility of the Back Area Light", update=light_visibility_update("back"))
+    light_front_visible: bpy.props.BoolProperty(name="Front Light", default=True, description="Toggle visibility of the Front Area Light", update=light_visibility_update("front"))
+    light_left_visible: bpy.props.BoolProperty(name="Left Light", default=True, description="Toggle visibility of the Left Area Light", update=light_visibility_update("left"))
+    light_right_visible: bpy.props.BoolProperty(name="Right Light", default=True, description="Toggle visibility of the Right Area Light", update=light_visibility_update("right"))
+
+
+# ------------------------------------DRAWS-----------------------------------
+
+class GENERATE_UL_booths(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.prop(item, "name", text="", emboss=False, icon='OUTLINER_COLLECTION')
+
+class GENERATE_Booths(bpy.types.Panel):
+    bl_label = "Booths"
+    bl_category = "Generative Booth"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+
+        row = layout.row()
+        row.template_list("GENERATE_UL_booths", "", scene, "generative_booths", scene, "generative_booth_index", rows=3)
+
+        col = row.column(align=True)
+        col.operator("object.add_booth_instance", text="", icon='ADD')
+        col.operator("object.remove_booth_instance", text="", icon='REMOVE')
+        col.separator()
+        col.operator("object.generate_booth", text="", icon='PLAY')
+
+        layout.operator("object.rebuild_booth", text="Rebuild Booth", icon='FILE_REFRESH')
+
+        box = layout.box()
+        box.label(text=f"Materials: {len(bpy.data.materials)}", icon='MATERIAL')
+        row = box.row(align=True)
+        row.operator_menu_enum("object.apply_booth_palette", "palette", text="Palette", icon='COLOR')
+        row.operator("object.clean_booth_materials", text="Clean Up", icon='TRASH')
+
+        row = layout.row(align=True)
+        row.operator("object.import_booth_spec", text="Import Spec", icon='IMPORT')
+        row.operator("object.export_booth_spec", text="Export Spec", icon='EXPORT')
+
+class GENERATE_Base(bpy.types.Panel):
+    bl_label = "Generate Base"
+    bl_category = "Generative Booth"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    def draw(self, context):
+        layout = self.layout
+        props = active_booth(context.scene)
+        
+        # ------------------------------------FLOOR-----------------------------------
+        box = layout.box()
+        box.label(text='Floor', icon='AXIS_TOP')
+        
+        box.operator("mesh.add_floor_booth", text="Add Floor", icon='ADD')
+        
+        col = box.column(align=True)
+        col.prop(props, "floor_width")
+        col.prop(props, "floor_length")
+        col.prop(props, "floor_height")
+        
+        row = box.row()
+        row.label(text="    Color:")
+        row.prop(props, "floor_color", text="")
+        
+        # ------------------------------------ROOF-----------------------------------
+        box = layout.box()
+        box.label(text='Roof', icon='GRID')
+        
+        box.operator("mesh.add_roof_booth", text="Add Roof", icon='ADD')
+        
+        col = box.column(align=True)
+        col.prop(props, "roof_width")
+        col.prop(props, "roof_length")
+        col.prop(props, "roof_height")
+        
+        row = box.row()
+        row.label(text="    Color:")
+        row.prop(props, "roof_color", text="")
+        
+        # ------------------------------------WALLS (NEW LAYOUT)-----------------------------------
+        box = layout.box()
+        box.label(text='Walls', icon='AXIS_SIDE')
+        
+        box.operator("mesh.add_all_walls", text="Add Walls", icon='ADD')
+        
+        col = layout.column(align=True)
+        
+        row = box.row(align=True)
+        row.prop(props, "back_wall_visible", icon='HIDE_OFF' if props.back_wall_visible else 'HIDE_ON', text="")
+        row.label(text=" Back Wall") 
+        
+        col = box.column(align=True)
+        col.prop(props, "back_wall_length", text="Length")
+        col.prop(props, "back_wall_width", text="Width")
+        col.prop(props, "back_wall_height", text="Height")
+        
+        color_row = box.row(align=True)
+        color_row.label(text="   Color:")
+        color_row.prop(props, "back_wall_color", text="")
+        
+        col = layout.column(align=True)
+        
+        row = box.row(align=True)
+        row.prop(props, "left_wall_visible", icon='HIDE_OFF' if props.left_wall_visible else 'HIDE_ON', text="")
+        row.label(text=" Left Wall")
+        
+        col = box.column(align=True)
+        col.prop(props, "left_wall_length", text="Length")
+        col.prop(props, "left_wall_width", text="Width")
+        col.prop(props, "left_wall_height", text="Height")
+        
+        color_row = box.row(align=True)
+        color_row.label(text="   Color:")
+        color_row.prop(props, "left_wall_color", text="")
+
+        col = layout.column(align=True)
+
+        row = box.row(align=True)
+        row.prop(props, "right_wall_visible", icon='HIDE_OFF' if props.right_wall_visible else 'HIDE_ON', text="")
+        row.label(text=" Right Wall")
+        
+        col = box.column(align=True)
+        col.prop(props, "right_wall_length", text="Length")
+        col.prop(props, "right_wall_width", text="Width")
+        col.prop(props, "right_wall_height", text="Height")
+
+        color_row = box.row(align=True)
+        color_row.label(text="   Color:")
+        color_row.prop(props, "right_wall_color", text="")
+
+        # ------------------------------------DETAIL-----------------------------------
+        box = layout.box()
+        box.label(text='Detail', icon='MOD_SUBSURF')
+
+        col = box.column(align=True)
+        col.prop(props, "detail_mode", text="")
+        if props.detail_mode != 'BASE':
+            col.prop(props, "detail_levels")
+        if props.detail_mode == 'NEAR_CAMERA':
+            col.prop(props, "detail_distance")
+
+        box.operator("object.update_booth_detail", text="Update Detail", icon='FILE_REFRESH')
+        count = vertex_counts.get(booth_key(props))
+        if count is not None:
+            box.label(text=f"Vertices: {count}")
+
+
+class GENERATE_Booth_Elements(bpy.types.Panel):
+    bl_label = "Generate Booth Elements"
+    bl_category = "Generative Booth"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    def draw(self, context):
+        layout = self.layout
+        props = active_booth(context.scene)
+
+        row = layout.row()
+        row.prop(props, "seed", icon='MOD_NOISE')
+
+        box = layout.box()
+        box.label(text="Layout", icon='SNAP_GRID')
+        box.prop(props, "avoid_overlaps")
+        col = box.column(align=True)
+        col.prop(props, "layout_gap")
+        col.prop(props, "wall_clearance")
+        box.operator("object.arrange_booth_elements", text="Arrange Elements", icon='STICKY_UVS_DISABLE')
+        box.operator("object.search_booth_layouts", text="Search Layouts", icon='VIEWZOOM')
+        
+        # ------------------------------------TABLE-----------------------------------
+        box = layout.box()
+        box.label(text="Table", icon='NOCURVE')
+        box.operator("mesh.add_table_booth", text="Add Table", icon='ADD')
+        
+        row = box.row()
+        row.label(text="    Parameter:")
+        row.prop(props, "table_pos_range", text="")
+        
+        box.operator("object.modify_table_booth_position", text="Generate Position", icon='STICKY_UVS_DISABLE')
+        
+        row = box.row()
+        row.label(text="    Color:")
+        row.prop(props, "table_color", text="")
+        
+        layout.separator()
+        
+        # ------------------------------------CHAIR-----------------------------------
+        box = layout.box()
+        box.label(text="Chair", icon='CON_SAMEVOL')
+
+        box.operator("mesh.add_chair_booth", text="Add Chair", icon='ADD')
+        
+        row = box.row()
+        row.label(text="    Parameter:")
+        row.prop(props, "chair_pos_range", text="")
+        
+        box.operator("object.modify_chair_booth_position", text="Generate Position", icon='STICKY_UVS_DISABLE')
+        
+        row = box.row()
+        row.label(text="    Color:")
+        row.prop(props, "chair_color", text="")
+        
+        layout.separator()
+        
+        # ------------------------------------TOTEM-----------------------------------
+        box = layout.box()
+        box.label(text="Totem", icon='ASSET_MANAGER')
+        box.operator("mesh.add_totem_booth", text="Add Totem", icon='ADD')
+        
+        row = box.row()
+        row.label(text="    Parameter:")
+        row.prop(props, "totem_pos_range", text="")
+        
+        box.operator("object.modify_totem_booth_position", text="Generate Position", icon='STICKY_UVS_DISABLE')
+        
+        row = box.row()
+        row.label(text="    Color:")
+        row.prop(props, "totem_color", text="")
+        
+        layout.separator()
+        
+        # ------------------------------------POLES-----------------------------------
+        box = layout.box()
+        box.label(text="Poles", icon='MOD_ARRAY')
+        
+        row = box.row()
+        row.prop(props, "pole_count", text="Count")
+
+        row = box.row()
+        row.prop(props, "pole_instancing", text="")
+
+        box.operator("mesh.add_poles_booth", text="Add Poles", icon='ADD')
+
+        row = box.row()
+        row.label(text="     Parameter:")
+        row.prop(props, "pole_pos_range", text="")
+
+        box.operator("object.modify_poles_booth_position", text="Generate Position", icon='STICKY_UVS_DISABLE')
+
+        row = box.row()
+        row.label(text="     Color:")
+        row.prop(props, "pole_color", text="")
+
+class GENERATE_Lights(bpy.types.Panel):
+    bl_label = "Generate Light"
+    bl_category = "Generative Booth"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    def draw(self, context):
+        layout = self.layout
+        props = active_booth(context.scene)
+        
+        box = layout.box()
+        box.label(text="Lights", icon='LIGHT_AREA')
+
+        box.prop(props, "light_rig", text="Rig")
+        box.operator("object.add_all_lights", text="Add Lights", icon='ADD')
+        
+        col = box.column(align=True)
+        col.label(text="Lights Visibility:")
+        
+        # Only the sides the booth's rig has a light on
+        lights = [(f"light_{side}_visible", f" {side.title()} Light") for side in booth.light_rig(props)]
+
+        for prop_name, label in lights:
+            row = col.row(align=True)
+
+            row.prop(props, prop_name, icon='HIDE_OFF' if getattr(props, prop_name) else 'HIDE_ON', text="")
+            row.label(text=label)
+
+        box = layout.box()
+        box.label(text="Camera", icon='OUTLINER_OB_CAMERA')
+        box.operator("object.add_keyframed_camera", text="Add Keyframed Camera", icon='ADD')
+
+class GENERATE_Variants(bpy.types.Panel):
+    bl_label = "Generate Variants"
+    bl_category = "Generative Booth"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        box.label(text="Batch", icon='RENDERLAYERS')
+        box.operator("object.generate_booth_variants", text="Generate Variants", icon='ADD')
+
+        box = layout.box()
+        box.label(text="Expo Hall", icon='VIEW_ORTHO')
+        box.operator("object.generate_expo_hall", text="Generate Expo Hall", icon='ADD')
+
+        prefs = addon_preferences()
+        if prefs is not None:
+            box = layout.box()
+            box.label(text="Cache", icon='FILE_CACHE')
+            box.prop(prefs, "use_cache", text="Use Cache")
+            booths = booth_cache()
+            if booths is not None:
+                stats = booths.stats
+                total = stats["hits"] + stats["misses"]
+                rate = stats["hits"] / total if total else 0.0
+                col = box.column(align=True)
+                col.label(text=f"Hits: {stats['hits']}  Misses: {stats['misses']}  ({rate:.0%})")
+                col.label(text=f"Stored: {stats['stores']}  Evicted: {stats['evictions']}")
+            box.operator("object.clear_booth_cache", text="Clear Cache", icon='TRASH')
+
+class GENERATE_Diagnostics(bpy.types.Panel):
+    bl_label = "Diagnostics"
+    bl_category = "Generative Booth"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.window_manager.generative_booth_diagnostics
+
+        row = layout.row(align=True)
+        row.prop(settings, "enabled", toggle=True, icon='REC')
+        row.prop(settings, "profile", toggle=True)
+
+        rows = instrument.summary()
+        box = layout.box()
+        if not rows:
+            box.label(text="Nothing recorded yet", icon='INFO')
+        else:
+            grid = box.grid_flow(row_major=True, columns=5, even_columns=False, align=True)
+            for text in ("Call", "Count", "Mean ms", "Max ms", "Evals"):
+                grid.label(text=text)
+            for row in rows[:settings.rows]:
+                grid.label(text=row["name"])
+                grid.label(text=str(row["calls"]))
+                grid.label(text=f"{row['mean_ms']:.2f}")
+                grid.label(text=f"{row['max_ms']:.2f}")
+                grid.label(text=str(row["evaluations"]))
+            box.prop(settings, "rows")
+        box.label(text=f"Depsgraph evaluations: {instrument.counters['evaluations']}, "
+                       f"updated datablocks: {instrument.counters['updated']}")
+
+        row = layout.row(align=True)
+        row.operator("object.export_booth_diagnostics", text="Export", icon='EXPORT')
+        row.operator("object.reset_booth_diagnostics", text="Reset", icon='TRASH')
+
+
+classes = (
+    OBJECT_OT_add_all_lights, 
+    MESH_OT_add_table,
+    MESH_OT_add_totem,
+    MESH_OT_add_chair,
+    MESH_OT_add_floor, 
+    MESH_OT_add_roof, 
+    MESH_OT_add_all_walls, 
+    MESH_OT_add_poles,
+    OBJECT_OT_modify_chair_booth_position,
+    OBJECT_OT_modify_table_booth_position,
+    OBJECT_OT_modify_totem_booth_position,
+    OBJECT_OT_modify_poles_position,
+    OBJECT_OT_arrange_booth_elements,
+    OBJECT_OT_search_booth_layouts,
+    OBJECT_OT_add_keyframed_camera,
+    OBJECT_OT_add_booth_instance,
+    OBJECT_OT_generate_booth,
+    OBJECT_OT_remove_booth_instance,
+    OBJECT_OT_rebuild_booth,
+    OBJECT_OT_update_booth_detail,
+    OBJECT_OT_export_booth_spec,
+    OBJECT_OT_import_booth_spec,
+    OBJECT_OT_generate_booth_variants,
+    OBJECT_OT_apply_booth_palette,
+    OBJECT_OT_clean_booth_materials,
+    OBJECT_OT_generate_expo_hall,
+    OBJECT_OT_clear_booth_cache,
+    OBJECT_OT_reset_booth_diagnostics,
+    OBJECT_OT_export_booth_diagnostics,
+    GenerativeBoothPreferences,
+    BoothDiagnosticsSettings,
+    BoothElementRef,
+    GenerativeBoothProperties,
+    GENERATE_UL_booths,
+    GENERATE_Booths,
+    GENERATE_Base, 
+    GENERATE_Booth_Elements, 
+    GENERATE_Lights,
+    GENERATE_Variants,
+    GENERATE_Diagnostics
+)
+
+#------------------------------------REGISTER/UNREGISTER-----------------------------------
+
+def register():
+    for cls in classes:
+        instrument_class(cls)
+        bpy.utils.register_class(cls)
+        
+    bpy.types.Scene.generative_booth_props = bpy.props.PointerProperty(type=GenerativeBoothProperties)
+    bpy.types.Scene.generative_booths = bpy.props.CollectionProperty(type=GenerativeBoothProperties)
+    bpy.types.Scene.generative_booth_index = bpy.props.IntProperty(name="Active Booth", default=-1, min=-1)
+    bpy.types.WindowManager.generative_booth_diagnostics = bpy.props.PointerProperty(type=BoothDiagnosticsSettings)
+    bpy.app.handlers.load_post.append(adopt_legacy_objects)
+    bpy.app.handlers.depsgraph_update_post.append(count_depsgraph_update)
+
+
+def unregister():
+    updates.cancel()
+    instrument.disable()
+    if adopt_legacy_objects in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(adopt_legacy_objects)
+    if count_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(count_depsgraph_update)
+    del bpy.types.WindowManager.generative_booth_diagnostics
+    del bpy.types.Scene.generative_booth_index
+    del bpy.types.Scene.generative_booths
+    del bpy.types.Scene.generative_booth_props
+    
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,363 @@
+"""Booth layout model.
+
+Computes where every part of a booth goes, what it looks like and which
+keys the camera flies through, from the booth parameters alone. Parameters
+are any object with the attributes of GenerativeBoothProperties, such as
+the properties themselves or the namespace booth_params copies them into.
+
+A layout is plain data: the add-on turns it into Blender objects in one
+pass (apply_layout), and everything else, like tests, benchmarks or layout
+search, can compute and inspect it with plain CPython in microseconds.
+
+This module does not import bpy.
+"""
+
+import math
+import types
+
+from . import placement, solver
+from .rng import element_position
+
+# Height of the roof's underside
+ROOF_BASE = 2.8
+
+WALL_SIDES = solver.WALL_SIDES
+
+# Footprint and height of every element kind
+ELEMENT_SIZES = {
+    "table": (0.4, 1.0, 0.8),
+    "chair": (0.4, 0.4, 0.4),
+    "totem": (0.4, 0.4, 1.0),
+}
+
+# Width, height and center height of every pole
+POLE_SIZE = 0.1
+POLE_Z_SCALE = 2.7
+POLE_Z_LOC = 1.4
+
+DETAIL_MODES = ('BASE', 'ALL', 'NEAR_CAMERA')
+
+# Sides a light can sit on; each has its own visibility toggle
+LIGHT_SIDES = ("top", "back", "front", "left", "right")
+
+# Light rig templates: rig -> side -> (location, rotation, size, energy) of its
+# area lights, relative to the booth. A rig lights any subset of LIGHT_SIDES.
+# Lights of equal size and energy share one light datablock.
+LIGHT_RIGS = {
+    "STANDARD": {
+        "top": ((0.0, 0.0, 5.0), (0.0, 0.0, 0.0), 5.0, 200.0),
+        "back": ((0.0, -4.0, 1.5), (math.radians(90), 0.0, 0.0), 3.5, 200.0),
+        "front": ((0.0, 4.0, 1.5), (math.radians(-90), 0.0, 0.0), 3.5, 200.0),
+        "left": ((4.0, 0.0, 1.5), (0.0, math.radians(90), 0.0), 3.5, 200.0),
+        "right": ((-4.0, 0.0, 1.5), (0.0, math.radians(-90), 0.0), 3.5, 200.0),
+    },
+    "SOFT": {
+        "top": ((0.0, 0.0, 4.5), (0.0, 0.0, 0.0), 6.0, 150.0),
+        "left": ((3.5, 0.0, 2.0), (0.0, math.radians(90), 0.0), 5.0, 100.0),
+        "right": ((-3.5, 0.0, 2.0), (0.0, math.radians(-90), 0.0), 5.0, 100.0),
+    },
+    "SHOWCASE": {
+        "top": ((0.0, 0.0, 4.0), (0.0, 0.0, 0.0), 1.5, 300.0),
+        "back": ((0.0, -3.5, 2.5), (math.radians(70), 0.0, 0.0), 1.5, 300.0),
+        "front": ((0.0, 3.5, 2.5), (math.radians(-70), 0.0, 0.0), 3.0, 250.0),
+    },
+}
+DEFAULT_LIGHT_RIG = "STANDARD"
+
+# (frame, location, rotation) the keyframed camera passes through
+CAMERA_KEYS = (
+    (1, (12.0268, 13.0229, 4.59699), (math.radians(78.6001), math.radians(-0.000062), math.radians(137))),
+    (2, (-13.0768, 13.0707, 4.69756), (math.radians(79.2001), 0.0, math.radians(225.2))),
+    (3, (0.0, 15.3912, 6.08665), (math.radians(72.2002), 0.0, math.radians(180))),
+)
+
+
+WHITE = (1.0, 1.0, 1.0, 1.0)
+
+# Defaults of GenerativeBoothProperties, for building layouts outside Blender
+DEFAULT_PARAMS = {
+    "seed": 0,
+    "floor_width": 3.0, "floor_length": 3.0, "floor_height": 0.1, "floor_color": WHITE,
+    "roof_width": 3.0, "roof_length": 3.0, "roof_height": 0.1, "roof_color": WHITE,
+    "avoid_overlaps": False, "layout_gap": 0.1, "wall_clearance": 0.2,
+    "pole_count": 4, "pole_pos_range": 1.0, "pole_color": WHITE, "pole_instancing": 'OBJECTS',
+    "detail_mode": 'BASE', "detail_levels": 2, "detail_distance": 20.0,
+    "light_rig": DEFAULT_LIGHT_RIG,
+}
+for _side in WALL_SIDES:
+    DEFAULT_PARAMS.update({
+        f"{_side}_wall_length": 3.0, f"{_side}_wall_width": 0.1, f"{_side}_wall_height": 2.7,
+        f"{_side}_wall_visible": True, f"{_side}_wall_color": WHITE,
+    })
+for _kind in ELEMENT_SIZES:
+    DEFAULT_PARAMS.update({f"{_kind}_pos_range": 1.0, f"{_kind}_color": WHITE})
+for _side in LIGHT_SIDES:
+    DEFAULT_PARAMS[f"light_{_side}_visible"] = True
+
+
+def default_params(**overrides):
+    """Returns booth parameters with the add-on's defaults, like booth_params does in Blender."""
+    return types.SimpleNamespace(**dict(DEFAULT_PARAMS, **overrides))
+
+
+class Part:
+    """A cube of the booth with its transform, material and visibility.
+
+    ``role`` is set for the floor, roof and walls, ``kind`` and ``index`` for
+    tables, chairs and totems. ``cuts`` of None keeps the default level of
+    the shared cube mesh; ``detail`` is the number of subdivision levels
+    added on top of it.
+    """
+
+    __slots__ = ("name", "role", "kind", "index", "location", "scale", "rotation",
+                 "material", "color", "cuts", "visible", "detail")
+
+    def __init__(self, name, location, scale, material, color, role=None, kind=None, index=0,
+                 rotation=(0.0, 0.0, 0.0), cuts=None, visible=True, detail=0):
+        self.name = name
+        self.role = role
+        self.kind = kind
+        self.index = index
+        self.location = location
+        self.scale = scale
+        self.rotation = rotation
+        self.material = material
+        self.color = color
+        self.cuts = cuts
+        self.visible = visible
+        self.detail = detail
+
+    def __repr__(self):
+        return f"Part({self.name!r}, location={self.location}, scale={self.scale})"
+
+
+class Poles:
+    """Every pole of a booth: an (n, 2) array of floor positions of one size and color."""
+
+    __slots__ = ("positions", "color", "instancing")
+
+    scale = (POLE_SIZE, POLE_SIZE, POLE_Z_SCALE)
+    z = POLE_Z_LOC
+
+    def __init__(self, positions, color, instancing='OBJECTS'):
+        self.positions = positions
+        self.color = color
+        self.instancing = instancing
+
+    def __len__(self):
+        return len(self.positions)
+
+
+class Light:
+    """An area light of the booth's light rig."""
+
+    __slots__ = ("side", "location", "rotation", "size", "energy", "visible")
+
+    def __init__(self, side, location, rotation, size, energy, visible=True):
+        self.side = side
+        self.location = location
+        self.rotation = rotation
+        self.size = size
+        self.energy = energy
+        self.visible = visible
+
+    @property
+    def role(self):
+        return f"light_{self.side}"
+
+    @property
+    def name(self):
+        return f"Area_Light_{self.side.title()}"
+
+
+class CameraKey:
+    """A keyframe of the booth camera."""
+
+    __slots__ = ("frame", "location", "rotation")
+
+    def __init__(self, frame, location, rotation):
+        self.frame = frame
+        self.location = location
+        self.rotation = rotation
+
+
+class BoothLayout:
+    """Everything that makes up one booth, in build order."""
+
+    __slots__ = ("parts", "poles", "lights", "camera")
+
+    def __init__(self, parts, poles, lights=(), camera=()):
+        self.parts = parts
+        self.poles = poles
+        self.lights = list(lights)
+        self.camera = list(camera)
+
+    def elements(self):
+        return [part for part in self.parts if part.kind is not None]
+
+
+def base_part(params, role):
+    """Returns the floor, roof or a wall of the booth, walls aligned to the floor's edges."""
+    if role == "floor":
+        return Part("Booth_Floor", (0.0, 0.0, params.floor_height / 2.0),
+                    (params.floor_width, params.floor_length, params.floor_height),
+                    "floor", params.floor_color, role="floor")
+    if role == "roof":
+        return Part("Booth_Roof", (0.0, 0.0, ROOF_BASE + params.roof_height / 2.0),
+                    (params.roof_width, params.roof_length, params.roof_height),
+                    "roof", params.roof_color, role="roof")
+
+    side = role[:-len("_wall")]
+    width = getattr(params, f"{side}_wall_width")
+    length = getattr(params, f"{side}_wall_length")
+    height = getattr(params, f"{side}_wall_height")
+    if side == "back":
+        location = (0.0, -params.floor_length / 2.0 - width / 2.0, height / 2.0)
+        scale = (length, width, height)
+    elif side == "left":
+        location = (-params.floor_width / 2.0 - width / 2.0, 0.0, height / 2.0)
+        scale = (width, length, height)
+    elif side == "right":
+        location = (params.floor_width / 2.0 + width / 2.0, 0.0, height / 2.0)
+        scale = (width, length, height)
+    else:
+        raise ValueError(f"Unknown booth part {role!r}")
+    return Part(f"Booth_Wall_{side.title()}", location, scale, role, getattr(params, f"{role}_color"),
+                role=role, cuts=0, visible=getattr(params, f"{role}_visible"))
+
+
+def element_part(params, kind, index=0, generation=0):
+    """Returns a table, chair or totem at the position of its (seed, kind, index) stream."""
+    width, length, height = ELEMENT_SIZES[kind]
+    x, y = element_position(params.seed, kind, index, getattr(params, f"{kind}_pos_range"), generation)
+    return Part("Cube", (x, y, height / 2.0), (width, length, height), kind,
+                getattr(params, f"{kind}_color"), kind=kind, index=index)
+
+
+def booth_poles(params, count=None, generation=0):
+    """Returns the booth's poles, sampled from the pole stream in one call."""
+    if count is None:
+        count = params.pole_count
+    positions = placement.sample_positions(params.seed, "pole", count, params.pole_pos_range, generation)
+    return Poles(positions, params.pole_color, params.pole_instancing)
+
+
+def light_rig(params):
+    """Returns the template of the booth's light rig, side -> (location, rotation, size, energy)."""
+    return LIGHT_RIGS[params.light_rig]
+
+
+def booth_light(params, side):
+    """Returns the light the booth's rig has on ``side``, or None if it has none there."""
+    template = light_rig(params).get(side)
+    if template is None:
+        return None
+    location, rotation, size, energy = template
+    return Light(side, location, rotation, size, energy, getattr(params, f"light_{side}_visible"))
+
+
+def booth_lights(params):
+    """Returns every light of the booth's rig."""
+    return [booth_light(params, side) for side in light_rig(params)]
+
+
+def camera_keys():
+    return [CameraKey(frame, location, rotation) for frame, location, rotation in CAMERA_KEYS]
+
+
+def arrange(layout, params):
+    """Re-places the elements and poles of ``layout`` so none overlap or crowd the walls.
+
+    Returns the number of elements that did not fit; those keep their position.
+    """
+    elements = [
+        solver.Element(part.kind, part.index, part.scale[0] / 2.0, part.scale[1] / 2.0,
+                       getattr(params, f"{part.kind}_pos_range"))
+        for part in layout.elements()
+    ]
+    parts = layout.elements()
+    half = POLE_SIZE / 2.0
+    elements += [solver.Element("pole", i, half, half, params.pole_pos_range) for i in range(len(layout.poles))]
+
+    walls = [side for side in WALL_SIDES if getattr(params, f"{side}_wall_visible")]
+    unplaced = solver.solve_layout(
+        elements, params.floor_width, params.floor_length, walls,
+        gap=params.layout_gap, wall_clearance=params.wall_clearance, seed=params.seed
+    )
+
+    positions = layout.poles.positions
+    for i, element in enumerate(elements):
+        if not element.placed:
+            continue
+        if i < len(parts):
+            parts[i].location = (element.x, element.y, parts[i].location[2])
+        else:
+            positions[element.index] = (element.x, element.y)
+    return len(unplaced)
+
+
+def camera_viewpoints():
+    """Returns the locations of the booth camera's keys, where detail matters most."""
+    return [location for _frame, location, _rotation in CAMERA_KEYS]
+
+
+def detail_level(center, params, viewpoints=None):
+    """Returns the subdivision levels a part centered at ``center`` should get.
+
+    'BASE' keeps every part at the lowest resolution, 'ALL' details every part
+    and 'NEAR_CAMERA' only parts within ``detail_distance`` of a viewpoint.
+    """
+    mode = params.detail_mode
+    if mode == 'ALL':
+        return params.detail_levels
+    if mode == 'NEAR_CAMERA':
+        if viewpoints is None:
+            viewpoints = camera_viewpoints()
+        if any(math.dist(center, point) <= params.detail_distance for point in viewpoints):
+            return params.detail_levels
+    return 0
+
+
+def assign_detail(layout, params, viewpoints=None):
+    """Sets the detail of every part of ``layout``. Poles always stay at the base level."""
+    for part in layout.parts:
+        part.detail = detail_level(part.location, params, viewpoints)
+
+
+def cube_counts(cuts=0):
+    """Returns the (vertices, edges, faces) of a cube with ``cuts`` grid cuts per edge."""
+    n = cuts + 2
+    vertices = 6 * n * n - 12 * n + 8
+    faces = 6 * (n - 1) * (n - 1)
+    return vertices, vertices + faces - 2, faces
+
+
+def subdivided_counts(vertices, edges, faces, levels):
+    """Returns the (vertices, edges, faces) of an all-quad mesh after ``levels`` of subdivision."""
+    for _ in range(levels):
+        vertices, edges, faces = vertices + edges + faces, 2 * edges + 4 * faces, 4 * faces
+    return vertices, edges, faces
+
+
+def vertex_count(layout):
+    """Returns the number of vertices the objects of ``layout`` evaluate to."""
+    total = 0
+    for part in layout.parts:
+        total += subdivided_counts(*cube_counts(part.cuts or 0), part.detail)[0]
+    return total + len(layout.poles) * cube_counts(0)[0]
+
+
+def booth_layout(params, lights=True, camera=True):
+    """Computes the complete booth described by ``params``."""
+    parts = [base_part(params, role) for role in ("floor", "roof", "back_wall", "left_wall", "right_wall")]
+    parts += [element_part(params, kind) for kind in ELEMENT_SIZES]
+    layout = BoothLayout(
+        parts,
+        booth_poles(params),
+        booth_lights(params) if lights else (),
+        camera_keys() if camera else (),
+    )
+    if params.avoid_overlaps:
+        arrange(layout, params)
+    assign_detail(layout, params)
+    return layout
@@ -0,0 +1,136 @@
+"""Content-addressed cache of generated booths.
+
+Generation is deterministic, so a booth is fully described by its spec and
+the version of the add-on that built it. The cache stores each generated
+booth as a file named after the hash of both, e.g.
+``3f2a...9c.blend``, and later requests for the same spec reuse that file
+instead of building the booth again.
+
+Entries are evicted least recently used first once the cache grows past its
+size limit. A hit touches the file's modification time, so the directory
+itself is the LRU index and several worker processes can share one cache.
+Files are written under a temporary name and moved into place, so readers
+never see a half written entry.
+
+This module does not import bpy.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+# directory -> BoothCache, so counters survive between operator runs
+_caches = {}
+
+
+def spec_key(spec, version=(), extra=()):
+    """Returns the hex digest identifying the booth ``spec`` builds.
+
+    The booth name does not change what gets built and is left out.
+    """
+    data = {key: value for key, value in spec.items() if key != "name"}
+    payload = json.dumps([data, list(version), list(extra)], sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class BoothCache:
+    """A directory of generated booth files, limited to ``max_bytes``."""
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def path(self, key, extension):
+        return os.path.join(self.directory, key + extension)
+
+    def lookup(self, key, extension):
+        """Returns the path of the cached file for ``key``, or None on a miss."""
+        path = self.path(key, extension)
+        try:
+            # Mark as most recently used
+            os.utime(path)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return path
+
+    def pending_path(self, key, extension):
+        """Returns a temporary path to write a new entry to before ``commit``."""
+        os.makedirs(self.directory, exist_ok=True)
+        return self.path(key, f".{os.getpid()}.tmp{extension}")
+
+    def commit(self, key, extension, pending):
+        """Moves a file written to ``pending_path`` into the cache. Returns its path."""
+        path = self.path(key, extension)
+        os.replace(pending, path)
+        self.stats["stores"] += 1
+        self.evict(keep=path)
+        return path
+
+    def store(self, key, extension, source):
+        """Copies an existing file into the cache. Returns its path."""
+        pending = self.pending_path(key, extension)
+        shutil.copyfile(source, pending)
+        return self.commit(key, extension, pending)
+
+    def entries(self):
+        """Returns (last use, size, path) of every entry, least recently used first."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if ".tmp" in name:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                # Evicted by another process meanwhile
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+        entries.sort()
+        return entries
+
+    def size(self):
+        return sum(size for _mtime, size, _path in self.entries())
+
+    def evict(self, keep=None):
+        """Removes least recently used entries until the cache fits its limit."""
+        entries = self.entries()
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        """Removes every entry. Returns how many there were."""
+        entries = self.entries()
+        for _mtime, _size, path in entries:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        return len(entries)
+
+
+def open_cache(directory, max_bytes):
+    """Returns the shared cache of ``directory``, updating its size limit."""
+    directory = os.path.abspath(directory)
+    booth_cache = _caches.get(directory)
+    if booth_cache is None:
+        booth_cache = _caches[directory] = BoothCache(directory, max_bytes)
+    booth_cache.max_bytes = max_bytes
+    return booth_cache
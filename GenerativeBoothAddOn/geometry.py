@@ -0,0 +1,326 @@
+import bmesh
+import bpy
+import numpy as np
+
+# Booth parts are flat colored boxes, so the shared meshes are plain cubes.
+# Parts that need more detail get it from a subdivision modifier (set_detail).
+# Files from before have meshes of 5 cuts, from bpy.ops.mesh.subdivide(number_cuts=5).
+DEFAULT_CUTS = 0
+
+DETAIL_MODIFIER = "GB_Detail"
+
+INSTANCER_NAME = "GB_Instance_Cube"
+
+# (primitive, cuts) -> name of the shared mesh datablock
+_mesh_cache = {}
+
+# (light type, size, energy) -> name of the shared light datablock
+_light_cache = {}
+
+# ------------------------------------MESHES-----------------------------------
+
+def new_cube_mesh(name, cuts=DEFAULT_CUTS):
+    """Builds a unit cube mesh with ``cuts`` grid cuts per edge, without operators."""
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    if cuts > 0:
+        bmesh.ops.subdivide_edges(bm, edges=bm.edges[:], cuts=cuts, use_grid_fill=True)
+
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+def shared_mesh(primitive="CUBE", cuts=DEFAULT_CUTS):
+    """Returns the single mesh datablock used by every object of this primitive and level.
+
+    The mesh is tagged with its key, so a cache entry that went stale after an
+    undo, a file load or a rename is found again instead of duplicated.
+    """
+    if primitive != "CUBE":
+        raise ValueError(f"Unknown booth primitive: {primitive!r}")
+
+    key = (primitive, cuts)
+    mesh = bpy.data.meshes.get(_mesh_cache.get(key, ""))
+    if mesh is not None and _is_shared_mesh(mesh, key):
+        return mesh
+
+    mesh = next((m for m in bpy.data.meshes if _is_shared_mesh(m, key)), None)
+    if mesh is None:
+        mesh = new_cube_mesh(f"GB_{primitive.title()}_{cuts}", cuts)
+        mesh["gb_primitive"] = primitive
+        mesh["gb_cuts"] = cuts
+
+    _mesh_cache[key] = mesh.name
+    return mesh
+
+def _is_shared_mesh(mesh, key):
+    return mesh.get("gb_primitive") == key[0] and mesh.get("gb_cuts") == key[1]
+
+# ------------------------------------OBJECTS-----------------------------------
+
+def new_cube_object(name, location=(0.0, 0.0, 0.0), scale=(1.0, 1.0, 1.0),
+                    rotation=(0.0, 0.0, 0.0), collection=None, cuts=DEFAULT_CUTS):
+    """Creates a cube object on the shared cube mesh and links it to ``collection``.
+
+    Falls back to the active collection of the context, which is where
+    bpy.ops.mesh.primitive_cube_add used to put the object.
+    """
+    obj = bpy.data.objects.new(name, shared_mesh("CUBE", cuts))
+    obj.location = location
+    obj.scale = scale
+    obj.rotation_euler = rotation
+
+    if collection is None:
+        collection = bpy.context.collection
+    collection.objects.link(obj)
+    return obj
+
+def differs(current, target, tolerance=1e-6):
+    return any(abs(a - b) > tolerance for a, b in zip(current, target))
+
+def set_transform(obj, location=None, scale=None, rotation=None):
+    """Writes only the parts of a transform that differ from the object's. Returns True if any did.
+
+    Every transform write tags the object for re-evaluation, even when it
+    writes the value the object already has.
+    """
+    changed = False
+    if location is not None and differs(obj.location, location):
+        obj.location = location
+        changed = True
+    if scale is not None and differs(obj.scale, scale):
+        obj.scale = scale
+        changed = True
+    if rotation is not None and differs(obj.rotation_euler, rotation):
+        obj.rotation_euler = rotation
+        changed = True
+    return changed
+
+def select_objects(objects, context=None):
+    """Selects ``objects`` and makes the last one active, replacing any selection.
+
+    Mirrors what the primitive add operators did to the selection, so color
+    callbacks relying on ``context.active_object`` keep working.
+    """
+    if context is None:
+        context = bpy.context
+    view_layer = context.view_layer
+
+    for obj in context.selected_objects:
+        obj.select_set(False)
+
+    last = None
+    for obj in objects:
+        obj.select_set(True)
+        last = obj
+
+    if last is not None:
+        view_layer.objects.active = last
+
+# ------------------------------------MATERIALS-----------------------------------
+
+def set_object_material(obj, mat):
+    """Puts ``mat`` in the first material slot of the object itself.
+
+    Slots are linked to the object rather than the mesh, otherwise coloring one
+    table would recolor every object sharing its mesh.
+    """
+    if not obj.material_slots:
+        obj.data.materials.append(None)
+
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
+
+def object_material(obj):
+    """Returns the material shown in the first slot of ``obj``, or None."""
+    if obj.material_slots:
+        return obj.material_slots[0].material
+    return None
+
+# ------------------------------------DETAIL-----------------------------------
+
+def detail_level(obj):
+    """Returns the subdivision levels the detail modifier adds to ``obj``, 0 without one."""
+    modifier = obj.modifiers.get(DETAIL_MODIFIER)
+    return modifier.levels if modifier is not None else 0
+
+def set_detail(obj, levels):
+    """Gives ``obj`` ``levels`` of simple subdivision. Returns True if anything changed.
+
+    The modifier is only added once an object needs detail and removed again at
+    level 0, so base objects carry no modifier at all.
+    """
+    modifier = obj.modifiers.get(DETAIL_MODIFIER)
+    if levels <= 0:
+        if modifier is None:
+            return False
+        obj.modifiers.remove(modifier)
+        return True
+
+    if modifier is None:
+        modifier = obj.modifiers.new(DETAIL_MODIFIER, 'SUBSURF')
+        modifier.subdivision_type = 'SIMPLE'
+    elif modifier.levels == levels and modifier.render_levels == levels:
+        return False
+    modifier.levels = levels
+    modifier.render_levels = levels
+    return True
+
+# ------------------------------------INSTANCING-----------------------------------
+
+def instancer_node_group():
+    """Returns the geometry nodes group that puts a subdivided cube on every point."""
+    group = bpy.data.node_groups.get(INSTANCER_NAME)
+    if group is not None and group.bl_idname == 'GeometryNodeTree':
+        return group
+
+    group = bpy.data.node_groups.new(INSTANCER_NAME, 'GeometryNodeTree')
+    interface = group.interface
+    interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    interface.new_socket("Scale", in_out='INPUT', socket_type='NodeSocketVector')
+    resolution = interface.new_socket("Resolution", in_out='INPUT', socket_type='NodeSocketInt')
+    resolution.default_value = 2
+    resolution.min_value = 2
+    interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = group.nodes
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+    cube = nodes.new('GeometryNodeMeshCube')
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+
+    group_in.location = (-400, 0)
+    cube.location = (-200, -150)
+    group_out.location = (200, 0)
+
+    links = group.links
+    links.new(group_in.outputs["Geometry"], instance.inputs["Points"])
+    links.new(group_in.outputs["Scale"], instance.inputs["Scale"])
+    for axis in ("Vertices X", "Vertices Y", "Vertices Z"):
+        links.new(group_in.outputs["Resolution"], cube.inputs[axis])
+    links.new(cube.outputs["Mesh"], instance.inputs["Instance"])
+    links.new(instance.outputs["Instances"], group_out.inputs["Geometry"])
+    return group
+
+def new_instancer_object(name, points, scale, collection=None, cuts=DEFAULT_CUTS):
+    """Creates one object that instances a cube of ``scale`` on each of ``points``.
+
+    Thousands of elements cost a single object and a vertex each, instead of
+    one object per element.
+    """
+    mesh = bpy.data.meshes.new(name)
+    obj = bpy.data.objects.new(name, mesh)
+    set_instancer_points(obj, points)
+
+    group = instancer_node_group()
+    modifier = obj.modifiers.new("GB_Instances", 'NODES')
+    modifier.node_group = group
+    modifier[group.interface.items_tree["Scale"].identifier] = tuple(scale)
+    modifier[group.interface.items_tree["Resolution"].identifier] = cuts + 2
+
+    if collection is None:
+        collection = bpy.context.collection
+    collection.objects.link(obj)
+    return obj
+
+def is_instancer(obj):
+    """True for objects created by new_instancer_object."""
+    return obj.type == 'MESH' and "GB_Instances" in obj.modifiers
+
+def get_instancer_points(obj):
+    """Returns the instance positions of an instancer object as an (n, 3) array."""
+    mesh = obj.data
+    points = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", points)
+    return points.reshape(-1, 3)
+
+def set_instancer_points(obj, points):
+    """Replaces the instance positions of an instancer object with ``points`` in one copy.
+
+    A cloud whose points are already in place is left untouched.
+    """
+    points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+    mesh = obj.data
+    if len(mesh.vertices) != len(points):
+        mesh.clear_geometry()
+        mesh.vertices.add(len(points))
+    elif np.allclose(get_instancer_points(obj), points, rtol=0.0, atol=1e-6):
+        return
+    mesh.vertices.foreach_set("co", points.ravel())
+    mesh.update()
+
+def set_object_positions(objects, positions):
+    """Moves each object to the matching x/y row of ``positions``, keeping its height.
+
+    Objects have no bulk transform API, so this is one vector write per object
+    instead of one write per axis.
+    """
+    for obj, (x, y) in zip(objects, positions.tolist()):
+        if differs(obj.location.xy, (x, y)):
+            obj.location.xy = (x, y)
+
+# ------------------------------------LIGHTS-----------------------------------
+
+def shared_light(light_type, size, energy):
+    """Returns the single light datablock used by every light of this type, size and energy.
+
+    Tagged with its key like the shared meshes, so a stale cache entry is found
+    again instead of duplicated. Editing it changes every light sharing it.
+    """
+    key = (light_type, round(size, 4), round(energy, 4))
+    light = bpy.data.lights.get(_light_cache.get(key, ""))
+    if light is not None and _is_shared_light(light, key):
+        return light
+
+    light = next((l for l in bpy.data.lights if _is_shared_light(l, key)), None)
+    if light is None:
+        light = bpy.data.lights.new(f"GB_{light_type.title()}_Light_{key[1]:g}_{key[2]:g}", light_type)
+        light.energy = energy
+        if light_type == 'AREA':
+            light.size = size
+        else:
+            light.shadow_soft_size = size
+        light["gb_light_type"] = key[0]
+        light["gb_light_size"] = key[1]
+        light["gb_light_energy"] = key[2]
+
+    _light_cache[key] = light.name
+    return light
+
+def _is_shared_light(light, key):
+    return (light.get("gb_light_type"), light.get("gb_light_size"), light.get("gb_light_energy")) == key
+
+def set_light_data(obj, light_type, size, energy):
+    """Puts the shared light of these parameters on ``obj``. Returns True if it changed.
+
+    The light the object had before is removed once nothing uses it.
+    """
+    light = shared_light(light_type, size, energy)
+    old = obj.data
+    if old == light:
+        return False
+    obj.data = light
+    if old is not None and old.users == 0:
+        bpy.data.lights.remove(old)
+    return True
+
+def new_light_object(name, light_type, location=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 0.0),
+                     size=1.0, energy=10.0, collection=None):
+    """Creates a light object on the shared light of its parameters and links it to ``collection``.
+
+    ``size`` is the area size of area lights and the soft shadow radius of the
+    others. An area light built this way has the footprint
+    bpy.ops.object.light_add(type='AREA', radius=size) gave it. That operator
+    leaves the object scale at 1 and multiplies the light's default area size
+    of 0.25 by 4 * radius (see benchmarks/bench_geometry.py, which compares both).
+    """
+    obj = bpy.data.objects.new(name, shared_light(light_type, size, energy))
+    obj.location = location
+    obj.rotation_euler = rotation
+
+    if collection is None:
+        collection = bpy.context.collection
+    collection.objects.link(obj)
+    return obj
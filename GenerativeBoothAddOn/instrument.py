@@ -0,0 +1,216 @@
+"""Opt-in timers for operators and property updates.
+
+Operator ``execute`` methods and property update callbacks are wrapped once,
+when the add-on registers. While recording is off a wrapper only checks a
+flag and calls through. While it is on, every call is counted and timed into
+``stats``, appended to a bounded list of trace events and, if requested, run
+under a cProfile profiler.
+
+Depsgraph evaluations are reported through ``count_evaluation`` by a bpy
+handler. Each is charged to the last outermost call, which is the edit that
+caused it, so the summary shows how many evaluations every edit costs.
+
+Recordings are written as a JSON summary, as a Chrome trace
+(chrome://tracing or https://ui.perfetto.dev) or as a .prof file for pstats.
+
+This module does not import bpy.
+"""
+
+import collections
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+
+# Trace events kept in memory, the oldest are dropped first
+MAX_EVENTS = 100000
+
+_state = {"enabled": False, "depth": 0, "profiler": None, "origin": time.perf_counter(), "edit": None}
+
+# name -> {"category", "calls", "total", "max", "evaluations"}, times in seconds
+stats = {}
+
+# Depsgraph evaluations and the datablocks they updated, for the whole recording
+counters = {"evaluations": 0, "updated": 0}
+
+# (name, category, start, duration), times in seconds since _state["origin"]
+events = collections.deque(maxlen=MAX_EVENTS)
+
+
+def enabled():
+    return _state["enabled"]
+
+
+def enable(profile=False):
+    """Starts recording, with cProfile snapshots of every timed call if ``profile``."""
+    _state["enabled"] = True
+    if profile and _state["profiler"] is None:
+        _state["profiler"] = cProfile.Profile()
+    elif not profile:
+        _state["profiler"] = None
+
+
+def disable():
+    """Stops recording. What was recorded so far is kept until ``reset``."""
+    _state["enabled"] = False
+
+
+def reset():
+    stats.clear()
+    events.clear()
+    counters.update(evaluations=0, updated=0)
+    _state["edit"] = None
+    _state["origin"] = time.perf_counter()
+    if _state["profiler"] is not None:
+        _state["profiler"] = cProfile.Profile()
+
+
+def record(name, category, start, duration):
+    entry = stats.get(name)
+    if entry is None:
+        entry = stats[name] = {"category": category, "calls": 0, "total": 0.0, "max": 0.0, "evaluations": 0}
+    entry["calls"] += 1
+    entry["total"] += duration
+    if duration > entry["max"]:
+        entry["max"] = duration
+    events.append((name, category, start - _state["origin"], duration))
+
+
+class _Span:
+    __slots__ = ("name", "category", "start", "profiler")
+
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        # Only the outermost span switches the profiler, nested ones are part of it
+        self.profiler = _state["profiler"] if _state["depth"] == 0 else None
+        _state["depth"] += 1
+        if self.profiler is not None:
+            self.profiler.enable()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter() - self.start
+        if self.profiler is not None:
+            self.profiler.disable()
+        _state["depth"] -= 1
+        if _state["depth"] == 0:
+            _state["edit"] = self.name
+        record(self.name, self.category, self.start, duration)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def count_evaluation(updated):
+    """Records a depsgraph evaluation that updated ``updated`` datablocks."""
+    if not _state["enabled"]:
+        return
+    counters["evaluations"] += 1
+    counters["updated"] += updated
+    entry = stats.get(_state["edit"])
+    if entry is not None:
+        entry["evaluations"] += 1
+    events.append(("depsgraph", "depsgraph", time.perf_counter() - _state["origin"], 0.0))
+
+
+def span(name, category="call"):
+    """Returns a context manager timing its block as ``name`` while recording is on."""
+    return _Span(name, category) if _state["enabled"] else _NO_SPAN
+
+
+def timed(name, category, func):
+    """Wraps a ``func(self, context)`` method or callback to be timed as ``name``.
+
+    The wrapper keeps the two argument signature, which Blender checks when
+    registering operators and properties.
+    """
+    if getattr(func, "gb_timed", False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(self, context):
+        if not _state["enabled"]:
+            return func(self, context)
+        with _Span(name, category):
+            return func(self, context)
+    wrapper.gb_timed = True
+    return wrapper
+
+
+def summary():
+    """Returns every timed name with calls and total, mean and max milliseconds, slowest total first."""
+    rows = [
+        {
+            "name": name,
+            "category": entry["category"],
+            "calls": entry["calls"],
+            "total_ms": entry["total"] * 1000.0,
+            "mean_ms": entry["total"] * 1000.0 / entry["calls"],
+            "max_ms": entry["max"] * 1000.0,
+            "evaluations": entry["evaluations"],
+        }
+        for name, entry in stats.items()
+    ]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def profile_text(limit=20):
+    """Returns the ``limit`` most expensive functions of the cProfile snapshot, or ""."""
+    profiler = _state["profiler"]
+    if profiler is None:
+        return ""
+    stream = io.StringIO()
+    try:
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    except TypeError:
+        # Nothing was profiled yet
+        return ""
+    return stream.getvalue()
+
+
+def write_json(path):
+    """Writes the summary, the depsgraph counters and the profile, if any, as JSON."""
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"calls": summary(), "depsgraph": dict(counters), "profile": profile_text()}, handle, indent=2)
+
+
+def write_chrome_trace(path):
+    """Writes the trace events in the Chrome trace event format."""
+    pid = os.getpid()
+    tid = threading.get_ident()
+    trace = [
+        {"name": name, "cat": category, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6,
+         "pid": pid, "tid": tid}
+        for name, category, start, duration in events
+    ]
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, handle)
+
+
+def write_profile(path):
+    """Writes the cProfile snapshot for pstats or snakeviz. Returns False if there is none."""
+    profiler = _state["profiler"]
+    if profiler is None:
+        return False
+    profiler.dump_stats(path)
+    return True
@@ -0,0 +1,119 @@
+"""Interned booth materials.
+
+Booth parts only differ by their viewport color, so the add-on needs one
+material per (role, color) for the whole file, not one per object or per
+click. Materials are named after that key, e.g. "GB_floor_ffffffff", found
+again by name after a reload, and tagged with ``gb_role`` so the add-on
+only ever removes or recolors materials it created itself.
+
+Changing the color of a part assigns it the material of the new color
+instead of editing the shared one, so other booths keep theirs. The old
+material is removed as soon as nothing uses it.
+"""
+
+import bpy
+
+from . import geometry
+
+PREFIX = "GB_"
+
+# (role, 8-bit color) -> name of the material datablock
+_cache = {}
+
+stats = {"hits": 0, "misses": 0, "removed": 0}
+
+
+def color_key(color):
+    """Quantizes an RGBA color to 8 bits per channel, the precision of the key."""
+    return tuple(round(min(1.0, max(0.0, c)) * 255) for c in color)
+
+
+def material_name(role, color):
+    return PREFIX + role + "_" + "".join(f"{c:02x}" for c in color_key(color))
+
+
+def is_managed(mat):
+    return mat is not None and "gb_role" in mat
+
+
+def material_for(role, color):
+    """Returns the material of ``role`` in ``color``, creating it on first use."""
+    key = (role, color_key(color))
+    name = _cache.get(key)
+    mat = bpy.data.materials.get(name) if name is not None else None
+    if mat is not None:
+        stats["hits"] += 1
+        return mat
+
+    stats["misses"] += 1
+    name = material_name(role, color)
+    mat = bpy.data.materials.get(name)
+    if mat is None:
+        mat = bpy.data.materials.new(name)
+        mat.diffuse_color = color
+        mat["gb_role"] = role
+    _cache[key] = mat.name
+    return mat
+
+
+def release(mat):
+    """Removes ``mat`` if the add-on created it and nothing uses it any more."""
+    if is_managed(mat) and mat.users == 0:
+        bpy.data.materials.remove(mat)
+        stats["removed"] += 1
+
+
+def assign(obj, role, color):
+    """Gives ``obj`` the material of ``role`` in ``color`` and releases its previous one."""
+    return assign_all([obj], role, color)
+
+
+def assign_all(objects, role, color):
+    """Like ``assign`` for many objects, looking the material up once."""
+    mat = material_for(role, color)
+    previous = set()
+    for obj in objects:
+        old = geometry.object_material(obj)
+        if old != mat:
+            geometry.set_object_material(obj, mat)
+            if old is not None:
+                previous.add(old.name)
+
+    for name in previous:
+        release(bpy.data.materials.get(name))
+    return mat
+
+
+def collect_garbage():
+    """Removes every unused material the add-on created. Returns how many went away."""
+    removed = 0
+    for mat in list(bpy.data.materials):
+        if is_managed(mat) and mat.users == 0:
+            bpy.data.materials.remove(mat)
+            removed += 1
+    stats["removed"] += removed
+
+    for key, name in list(_cache.items()):
+        if name not in bpy.data.materials:
+            del _cache[key]
+    return removed
+
+
+def swap_palette(palette):
+    """Recolors every part of the roles in ``palette`` (role -> color) in one pass.
+
+    All materials of a role collapse into the one of its new color: their users
+    are remapped to it and the old materials removed, without visiting objects.
+    Returns the number of materials that were merged away.
+    """
+    targets = {role: material_for(role, color) for role, color in palette.items()}
+    merged = 0
+    for mat in list(bpy.data.materials):
+        target = targets.get(mat.get("gb_role"))
+        if target is None or mat == target:
+            continue
+        mat.user_remap(target)
+        bpy.data.materials.remove(mat)
+        merged += 1
+    stats["removed"] += merged
+    return merged
@@ -0,0 +1,31 @@
+"""Vectorized placement of booth elements.
+
+All positions of one element kind are sampled with a single NumPy call from
+a generator seeded by rng.derive_seed(seed, kind). Row ``i`` of the result
+does not depend on how many rows are requested, so element ``i`` keeps its
+position when the count changes, just like the per-element streams.
+
+This module does not import bpy.
+"""
+
+import numpy as np
+
+from .rng import derive_seed
+
+
+def sample_positions(seed, kind, count, pos_range, generation=0):
+    """Returns a (count, 2) array of x/y positions within +-pos_range of the center."""
+    generator = np.random.default_rng(derive_seed(seed, kind, 0, generation))
+    return generator.uniform(-pos_range, pos_range, size=(count, 2))
+
+
+def to_points(positions, z):
+    """Lifts (n, 2) positions to (n, 3) float32 points at height ``z``.
+
+    float32 matches the vertex coordinates, so foreach_set can copy the buffer
+    without converting every value.
+    """
+    points = np.empty((len(positions), 3), dtype=np.float32)
+    points[:, :2] = positions
+    points[:, 2] = z
+    return points
@@ -0,0 +1,487 @@
+"""Generative layout search.
+
+Instead of one random placement per click, many candidate placements of a
+booth's elements are sampled at once and scored with NumPy on four terms,
+each between 0 and 1:
+
+- coverage: share of the floor within reach of an element
+- clearance: how far elements keep from the walls, up to the wall clearance
+- aisle: gap to the nearest other element, up to a walkable aisle width
+- visibility: share of elements the camera keys see over walls and elements
+
+The total is the weighted mean of the terms. Candidates whose footprints
+overlap rank below every candidate without overlaps. Only the ``keep`` best
+candidates are returned, so only the winners ever become Blender objects.
+
+Candidates are scored in chunks that bound the size of the pairwise arrays,
+and each chunk is sampled from its own seeded generator, so a search gives
+the same winners for the same seed however it is chunked. PoolSearch
+scores the chunks in a process pool instead: the search space is sent to
+every worker once, then each chunk goes out as one float32 array and only
+its best candidates come back.
+
+This module does not import bpy.
+"""
+
+import concurrent.futures
+import contextlib
+import heapq
+import multiprocessing
+import os
+import sys
+
+import numpy as np
+
+from . import booth, solver
+from .rng import derive_seed
+
+# Weight of every score term
+WEIGHTS = {"coverage": 1.0, "clearance": 1.0, "aisle": 1.0, "visibility": 1.0}
+
+# Cells per floor side the coverage term samples, and how far from an element a cell counts as covered
+COVERAGE_CELLS = 12
+COVERAGE_REACH = 0.75
+
+# Narrowest gap between elements visitors walk through
+AISLE_WIDTH = 0.6
+
+# Candidates sampled per generator, and the most pairwise entries scored at once
+CHUNK_CANDIDATES = 256
+MAX_PAIR_ENTRIES = 4_000_000
+
+
+class Candidate:
+    """A scored placement: one (x, y) row per searched element."""
+
+    __slots__ = ("score", "terms", "positions", "overlaps")
+
+    def __init__(self, score, terms, positions, overlaps=False):
+        self.score = score
+        self.terms = terms
+        self.positions = positions
+        self.overlaps = overlaps
+
+    def __repr__(self):
+        terms = ", ".join(f"{name}={value:.2f}" for name, value in self.terms.items())
+        return f"Candidate(score={self.score:.3f}, {terms})"
+
+
+class SearchSpace:
+    """The elements to place and everything they are scored against, as arrays.
+
+    ``half`` and ``heights`` hold the half footprint and height of every
+    element; ``low`` and ``high`` bound the centers each one is sampled in.
+    Walls that stand are kept as boxes, which block the view and the
+    clearance term measures against.
+    """
+
+    __slots__ = ("half", "heights", "low", "high", "floor", "walls", "wall_boxes", "viewpoints",
+                 "wall_clearance", "gap")
+
+    def __init__(self, elements, heights, params, viewpoints=None):
+        self.half = np.array([(e.half_x, e.half_y) for e in elements], dtype=np.float64).reshape(-1, 2)
+        self.heights = np.asarray(heights, dtype=np.float64)
+        self.floor = (params.floor_width, params.floor_length)
+        self.walls = [side for side in booth.WALL_SIDES if getattr(params, f"{side}_wall_visible")]
+        self.wall_clearance = params.wall_clearance
+        self.gap = params.layout_gap
+
+        # Sample anywhere on the floor: keeping off the walls is scored, not enforced
+        bounds = []
+        for element in elements:
+            box = solver.placement_bounds(element, params.floor_width, params.floor_length, (), 0.0)
+            if box is None:
+                box = (-element.pos_range, element.pos_range, -element.pos_range, element.pos_range)
+            bounds.append(box)
+        bounds = np.array(bounds, dtype=np.float64).reshape(-1, 4)
+        self.low = bounds[:, [0, 2]]
+        self.high = bounds[:, [1, 3]]
+
+        boxes = []
+        for side in self.walls:
+            part = booth.base_part(params, f"{side}_wall")
+            (x, y, _z), (sx, sy, sz) = part.location, part.scale
+            boxes.append((x, y, sx / 2.0, sy / 2.0, sz))
+        self.wall_boxes = np.array(boxes, dtype=np.float64).reshape(-1, 5)
+
+        if viewpoints is None:
+            viewpoints = booth.camera_viewpoints()
+        self.viewpoints = np.array(viewpoints, dtype=np.float64).reshape(-1, 3)
+
+    def __len__(self):
+        return len(self.half)
+
+    def sample(self, seed, chunk, count):
+        """Returns ``count`` candidate placements of chunk ``chunk`` as a (count, n, 2) float32 array."""
+        generator = np.random.default_rng(derive_seed(seed, "search", chunk))
+        return generator.uniform(self.low, self.high, size=(count, len(self), 2)).astype(np.float32)
+
+
+def layout_space(layout, params, viewpoints=None):
+    """Returns the SearchSpace of the tables, chairs, totems and poles of a booth.BoothLayout."""
+    elements = []
+    heights = []
+    for part in layout.elements():
+        elements.append(solver.Element(part.kind, part.index, part.scale[0] / 2.0, part.scale[1] / 2.0,
+                                       getattr(params, f"{part.kind}_pos_range")))
+        heights.append(part.scale[2])
+    half = booth.POLE_SIZE / 2.0
+    for i in range(len(layout.poles)):
+        elements.append(solver.Element("pole", i, half, half, params.pole_pos_range))
+        heights.append(booth.POLE_Z_SCALE)
+    return SearchSpace(elements, heights, params, viewpoints)
+
+
+def apply_candidate(layout, candidate):
+    """Moves the elements and poles of ``layout`` to ``candidate``, in layout_space order."""
+    parts = layout.elements()
+    for part, (x, y) in zip(parts, candidate.positions[:len(parts)].tolist()):
+        part.location = (x, y, part.location[2])
+    layout.poles.positions = np.array(candidate.positions[len(parts):], dtype=np.float64).reshape(-1, 2)
+    return layout
+
+
+def box_gaps(centers, half, other_centers, other_half):
+    """Returns the gap between every pair of axis-aligned boxes along x or y, negative where they overlap.
+
+    ``centers`` is (..., n, 2) and ``other_centers`` (..., m, 2); the result is (..., n, m).
+    """
+    gaps = np.abs(centers[..., :, None, :] - other_centers[..., None, :, :]) - (half[:, None, :] + other_half[None, :, :])
+    return gaps.max(axis=-1)
+
+
+def coverage(space, positions):
+    """Share of floor cells within COVERAGE_REACH of an element footprint."""
+    width, length = space.floor
+    xs = (np.arange(COVERAGE_CELLS) + 0.5) / COVERAGE_CELLS * width - width / 2.0
+    ys = (np.arange(COVERAGE_CELLS) + 0.5) / COVERAGE_CELLS * length - length / 2.0
+    cells = np.stack(np.meshgrid(xs, ys, indexing="ij"), axis=-1).reshape(-1, 2)
+
+    # (candidates, cells, elements) distance from each cell center to each footprint
+    delta = np.abs(cells[None, :, None, :] - positions[:, None, :, :]) - space.half[None, None, :, :]
+    distance = np.linalg.norm(np.maximum(delta, 0.0), axis=-1)
+    return (distance.min(axis=-1) <= COVERAGE_REACH).mean(axis=-1)
+
+
+def clearance(space, positions):
+    """Mean over elements of their distance to the nearest standing wall, relative to the wall clearance."""
+    if not space.walls:
+        return np.ones(len(positions))
+    width, length = space.floor
+    gaps = []
+    if "back" in space.walls:
+        gaps.append(positions[..., 1] - space.half[:, 1] + length / 2.0)
+    if "left" in space.walls:
+        gaps.append(positions[..., 0] - space.half[:, 0] + width / 2.0)
+    if "right" in space.walls:
+        gaps.append(width / 2.0 - positions[..., 0] - space.half[:, 0])
+    nearest = np.min(gaps, axis=0)
+    if space.wall_clearance <= 0.0:
+        return (nearest >= 0.0).mean(axis=-1)
+    return np.clip(nearest / space.wall_clearance, 0.0, 1.0).mean(axis=-1)
+
+
+def aisles(space, positions, aisle_width):
+    """Mean over elements of the gap to their nearest neighbor relative to ``aisle_width``.
+
+    Also returns, per candidate, whether any two footprints come closer than the layout gap.
+    """
+    count = len(space)
+    if count < 2:
+        return np.ones(len(positions)), np.zeros(len(positions), dtype=bool)
+    gaps = box_gaps(positions, space.half, positions, space.half)
+    gaps[:, np.arange(count), np.arange(count)] = np.inf
+    nearest = gaps.min(axis=-1)
+    return np.clip(nearest / aisle_width, 0.0, 1.0).mean(axis=-1), (nearest < space.gap).any(axis=-1)
+
+
+def ray_exits(origin, targets, centers, half):
+    """Returns where the segments from ``origin`` to ``targets`` leave every box, as a fraction of the segment.
+
+    ``targets`` is (c, n, 2) and ``centers`` and ``half`` (m, 2); the result
+    is (c, n, m) with NaN where a segment misses a box.
+    """
+    direction = targets - origin[:2]
+    direction = np.where(np.abs(direction) < 1e-9, 1e-9, direction)[..., :, None, :]
+    low = (centers - half - origin[:2]) / direction
+    high = (centers + half - origin[:2]) / direction
+    enter = np.minimum(low, high).max(axis=-1)
+    leave = np.maximum(low, high).min(axis=-1)
+    hit = (enter <= leave) & (leave > 0.0) & (enter < 1.0)
+    return np.where(hit, np.minimum(leave, 1.0), np.nan)
+
+
+def visibility(space, positions):
+    """Share of (element, viewpoint) pairs where the view to the element's top passes over everything else.
+
+    The sight line descends from the viewpoint to the top of the element. An
+    element in front blocks it if it covers the line's bearing and stands
+    taller than the line where it crosses; elements are taken as circles
+    around their footprint, walls as their boxes.
+    """
+    count = len(space)
+    if not len(space.viewpoints):
+        return np.ones(len(positions))
+    radius = np.linalg.norm(space.half, axis=-1)
+    heights = space.heights
+    diagonal = np.arange(count)
+    visible = np.zeros(positions.shape[:2])
+    for origin in space.viewpoints:
+        offset = positions - origin[:2]
+        distance = np.maximum(np.linalg.norm(offset, axis=-1), 1e-9)
+        bearing = np.arctan2(offset[..., 1], offset[..., 0])
+        spread = np.arctan(radius / distance)
+
+        # [c, i, j]: does element j block the view of element i
+        turn = np.abs((bearing[:, :, None] - bearing[:, None, :] + np.pi) % (2.0 * np.pi) - np.pi)
+        line = origin[2] + distance[:, None, :] / distance[:, :, None] * (heights[:, None] - origin[2])
+        hidden = (turn < spread[:, None, :]) & (distance[:, None, :] < distance[:, :, None]) & (line < heights)
+        hidden[:, diagonal, diagonal] = False
+        hidden = hidden.any(axis=-1)
+
+        if len(space.wall_boxes):
+            walls = space.wall_boxes
+            exits = ray_exits(origin, positions, walls[:, :2], walls[:, 2:4])
+            line = origin[2] + exits * (heights[:, None] - origin[2])
+            with np.errstate(invalid="ignore"):
+                hidden |= (line < walls[:, 4]).any(axis=-1)
+        visible += ~hidden
+    return (visible / len(space.viewpoints)).mean(axis=-1)
+
+
+def score(space, positions, weights=None, aisle_width=AISLE_WIDTH):
+    """Scores a (c, n, 2) array of candidate placements.
+
+    Returns the total score, a dict of every term and whether footprints
+    overlap, each with one entry per candidate.
+    """
+    if weights is None:
+        weights = WEIGHTS
+    aisle, overlaps = aisles(space, positions, aisle_width)
+    terms = {
+        "coverage": coverage(space, positions),
+        "clearance": clearance(space, positions),
+        "aisle": aisle,
+        "visibility": visibility(space, positions),
+    }
+    total_weight = sum(weights.values()) or 1.0
+    total = sum(weights[name] * terms[name] for name in weights) / total_weight
+    return total, terms, overlaps
+
+
+def chunk_size(space):
+    """Candidates per scoring pass, so the pairwise arrays stay below MAX_PAIR_ENTRIES."""
+    count = max(len(space), 1)
+    pairs = count * max(count, COVERAGE_CELLS * COVERAGE_CELLS, 1)
+    return int(max(1, min(CHUNK_CANDIDATES, MAX_PAIR_ENTRIES // pairs)))
+
+
+def search_chunks(space, seed, start, stop, keep, weights=None, aisle_width=AISLE_WIDTH):
+    """Samples and scores candidates ``start`` to ``stop`` and returns the ``keep`` best.
+
+    Candidate ``i`` always comes from the same chunk generator, so splitting a
+    search into ranges (e.g. over processes) and merging the winners gives
+    the same result as one search.
+    """
+    best = []
+    for chunk, first, last in chunks(start, stop):
+        positions = space.sample(seed, chunk, CHUNK_CANDIDATES)[first - chunk * CHUNK_CANDIDATES:last - chunk * CHUNK_CANDIDATES]
+        best = heapq.nlargest(keep, best + score_positions(space, positions, first, keep, weights, aisle_width),
+                              key=entry_key)
+    return best
+
+
+def chunks(start, stop):
+    """Yields (chunk, first, last) for every sampling chunk overlapping candidates ``start`` to ``stop``."""
+    step = CHUNK_CANDIDATES
+    for chunk in range(start // step, (stop + step - 1) // step):
+        yield chunk, max(start, chunk * step), min(stop, (chunk + 1) * step)
+
+
+def entry_key(entry):
+    # Higher rank first, earlier candidate on ties
+    return entry[0], -entry[1]
+
+
+def score_positions(space, positions, first, keep, weights=None, aisle_width=AISLE_WIDTH):
+    """Scores candidate placements numbered from ``first`` and returns the ``keep`` best as (rank, number, Candidate)."""
+    best = []
+    step = chunk_size(space)
+    for offset in range(0, len(positions), step):
+        batch = positions[offset:offset + step]
+        total, terms, overlaps = score(space, batch, weights, aisle_width)
+        ranked = np.where(overlaps, total - 1.0, total)
+        for i in np.argsort(ranked)[::-1][:keep].tolist():
+            candidate = Candidate(
+                float(total[i]), {name: float(values[i]) for name, values in terms.items()},
+                batch[i].copy(), bool(overlaps[i])
+            )
+            best.append((float(ranked[i]), first + offset + i, candidate))
+        best = heapq.nlargest(keep, best, key=entry_key)
+    return best
+
+
+def merge(results, keep):
+    """Merges the winners of several ``search_chunks`` calls into the ``keep`` best candidates."""
+    entries = [entry for result in results for entry in result]
+    return [candidate for _rank, _index, candidate in
+            heapq.nlargest(keep, entries, key=entry_key)]
+
+
+def search(space, candidates, keep=3, seed=0, weights=None, aisle_width=AISLE_WIDTH):
+    """Scores ``candidates`` placements of ``space`` and returns the ``keep`` best, best first."""
+    return merge([search_chunks(space, seed, 0, candidates, keep, weights, aisle_width)], keep)
+
+
+def params_space(params, viewpoints=None):
+    """Returns the SearchSpace of the elements of the booth ``params`` describe."""
+    return layout_space(booth.booth_layout(params, lights=False, camera=False), params, viewpoints)
+
+
+def winner_layouts(params, winners, lights=True, camera=True):
+    """Returns a booth.BoothLayout of ``params`` for every candidate, paired with it."""
+    results = []
+    for winner in winners:
+        layout = apply_candidate(booth.booth_layout(params, lights, camera), winner)
+        booth.assign_detail(layout, params)
+        results.append((layout, winner))
+    return results
+
+
+def search_layout(params, candidates=2000, keep=3, weights=None, aisle_width=AISLE_WIDTH, viewpoints=None,
+                  lights=True, camera=True):
+    """Returns the ``keep`` best booth.BoothLayouts of ``params`` with their candidates, best first."""
+    winners = search(params_space(params, viewpoints), candidates, keep, params.seed, weights, aisle_width)
+    return winner_layouts(params, winners, lights, camera)
+
+# ------------------------------------PROCESS POOL-----------------------------------
+
+# The search space of this worker process, set once by init_worker
+_worker = {"space": None}
+
+
+def init_worker(space):
+    _worker["space"] = space
+
+
+def score_chunk(positions, first, keep, weights, aisle_width):
+    """Process pool task: scores a shipped chunk of candidates against the worker's search space."""
+    return score_positions(_worker["space"], positions, first, keep, weights, aisle_width)
+
+
+@contextlib.contextmanager
+def _hidden_main():
+    """Keeps workers spawned in the block from running the main script.
+
+    A spawned process first imports the parent's ``__main__`` by path. In
+    Blender that is a script importing bpy, which the worker's interpreter
+    does not have, and the search never needs it.
+    """
+    main = sys.modules.get("__main__")
+    if main is None:
+        yield
+        return
+    path = main.__dict__.pop("__file__", None)
+    spec = main.__dict__.get("__spec__")
+    main.__spec__ = None
+    try:
+        yield
+    finally:
+        main.__spec__ = spec
+        if path is not None:
+            main.__file__ = path
+
+
+def default_workers():
+    """One worker per core, leaving one for Blender itself."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+class PoolSearch:
+    """A search whose chunks are scored in a process pool while the caller keeps running.
+
+    ``poll`` never blocks: it collects the chunks that finished and hands out
+    new ones, keeping two per worker in flight so the sampled arrays waiting
+    in memory stay few. Workers are spawned rather than forked, so they start
+    from a clean interpreter that imports only this module and what it needs.
+    """
+
+    def __init__(self, space, candidates, keep=3, seed=0, weights=None, aisle_width=AISLE_WIDTH, workers=None):
+        self.space = space
+        self.candidates = candidates
+        self.keep = keep
+        self.seed = seed
+        self.weights = weights
+        self.aisle_width = aisle_width
+        self.workers = workers or default_workers()
+        self.scored = 0
+        self._chunks = chunks(0, candidates)
+        self._pending = {}
+        self._results = []
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker, initargs=(space,)
+        )
+        # Workers are spawned as the first chunks are submitted
+        try:
+            with _hidden_main():
+                self.poll()
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def done(self):
+        return self.scored >= self.candidates
+
+    @property
+    def progress(self):
+        return self.scored / self.candidates if self.candidates else 1.0
+
+    def poll(self):
+        """Collects finished chunks and submits new ones without waiting. Returns True once all are scored.
+
+        A chunk that raised in its worker stops the pool and raises here.
+        """
+        for future in [future for future in self._pending if future.done()]:
+            count = self._pending.pop(future)
+            try:
+                self._results.append(future.result())
+            except BaseException:
+                self.close()
+                raise
+            self.scored += count
+
+        while len(self._pending) < 2 * self.workers:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            index, first, last = chunk
+            step = CHUNK_CANDIDATES
+            positions = self.space.sample(self.seed, index, step)[first - index * step:last - index * step]
+            future = self._executor.submit(score_chunk, positions, first, self.keep, self.weights, self.aisle_width)
+            self._pending[future] = last - first
+        return self.done
+
+    def wait(self):
+        """Blocks until every candidate is scored. Returns the winners."""
+        while not self.poll():
+            concurrent.futures.wait(self._pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        return self.winners()
+
+    def winners(self):
+        """Returns the ``keep`` best candidates scored so far, best first."""
+        return merge(self._results, self.keep)
+
+    def close(self):
+        """Stops the pool. Chunks that did not start yet are dropped."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parallel_search(space, candidates, keep=3, seed=0, weights=None, aisle_width=AISLE_WIDTH, workers=None):
+    """Like ``search``, with the chunks scored in a process pool of ``workers`` processes."""
+    pool = PoolSearch(space, candidates, keep, seed, weights, aisle_width, workers)
+    try:
+        return pool.wait()
+    finally:
+        pool.close()
@@ -0,0 +1,152 @@
+"""Declarative booth specs.
+
+A spec is a plain dict describing one booth: the booth parameters, whether
+it has lights, and the placement of every element:
+
+    {
+        "version": 1,
+        "name": "Booth_001",
+        "params": {"floor_width": 4.0, "pole_count": 4, ...},
+        "lights": true,
+        "elements": [
+            {"kind": "table", "index": 0, "generation": 0,
+             "location": [x, y, z], "scale": [x, y, z], "color": [r, g, b, a]},
+            ...
+        ],
+        "pole_cloud": [[x, y, z], ...] or null
+    }
+
+Specs carry their schema version, and ``upgrade`` brings specs written by
+older versions of the add-on up to date. Files hold a single spec or a list
+of specs (.json), one spec per line (.jsonl) or a stream of specs
+(.msgpack, needs the msgpack package). ``iter_specs`` reads .jsonl and
+.msgpack files one booth at a time, so large batches are never held in
+memory as a whole.
+
+This module does not import bpy.
+"""
+
+import json
+import os
+
+SPEC_VERSION = 1
+
+FORMATS = {".json": 'JSON', ".jsonl": 'JSONL', ".msgpack": 'MSGPACK'}
+
+# version -> function upgrading a spec of that version to the next one
+_UPGRADES = {}
+
+
+def new_spec(params, elements=(), pole_cloud=None, lights=True, name=""):
+    """Returns a spec of the current version."""
+    return {
+        "version": SPEC_VERSION,
+        "name": name,
+        "params": dict(params),
+        "lights": bool(lights),
+        "elements": list(elements),
+        "pole_cloud": pole_cloud,
+    }
+
+
+def element_entry(kind, index, location, scale, generation=0, color=None):
+    """Returns the spec entry of one placed element."""
+    return {
+        "kind": kind,
+        "index": int(index),
+        "generation": int(generation),
+        "location": [float(v) for v in location],
+        "scale": [float(v) for v in scale],
+        "color": [float(v) for v in color] if color is not None else None,
+    }
+
+
+def upgrade(spec):
+    """Validates ``spec`` and upgrades it to the current version.
+
+    Raises ValueError for anything that is not a booth spec of a known version.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("A booth spec must be a JSON object")
+    version = spec.get("version")
+    if not isinstance(version, int) or not 1 <= version <= SPEC_VERSION:
+        raise ValueError(f"Unsupported booth spec version {version!r}")
+
+    while version < SPEC_VERSION:
+        spec = _UPGRADES[version](spec)
+        version = spec["version"]
+
+    if not isinstance(spec.get("params"), dict):
+        raise ValueError("A booth spec needs a 'params' object")
+    spec.setdefault("name", "")
+    spec.setdefault("lights", True)
+    spec.setdefault("elements", [])
+    spec.setdefault("pole_cloud", None)
+    return spec
+
+
+def spec_format(path):
+    """Returns the format of a spec file from its extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Unknown booth spec file type {extension!r}, use one of {', '.join(FORMATS)}")
+    return FORMATS[extension]
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError("Reading and writing .msgpack booth specs needs the msgpack package") from None
+    return msgpack
+
+
+def write(path, specs):
+    """Writes ``specs`` to ``path`` in the format of its extension. Returns how many were written."""
+    fmt = spec_format(path)
+    count = 0
+
+    if fmt == 'MSGPACK':
+        packer = _msgpack().Packer()
+        with open(path, "wb") as handle:
+            for spec in specs:
+                handle.write(packer.pack(spec))
+                count += 1
+        return count
+
+    with open(path, "w", encoding="utf-8") as handle:
+        if fmt == 'JSONL':
+            for spec in specs:
+                handle.write(json.dumps(spec, separators=(",", ":")))
+                handle.write("\n")
+                count += 1
+        else:
+            specs = list(specs)
+            json.dump(specs[0] if len(specs) == 1 else specs, handle, indent=2)
+            count = len(specs)
+    return count
+
+
+def iter_specs(path):
+    """Yields the upgraded specs of a file, reading .jsonl and .msgpack files incrementally."""
+    fmt = spec_format(path)
+
+    if fmt == 'MSGPACK':
+        with open(path, "rb") as handle:
+            for spec in _msgpack().Unpacker(handle, raw=False):
+                yield upgrade(spec)
+    elif fmt == 'JSONL':
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield upgrade(json.loads(line))
+    else:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        for spec in data if isinstance(data, list) else [data]:
+            yield upgrade(spec)
+
+
+def load(path):
+    """Returns every spec of a file as a list."""
+    return list(iter_specs(path))
@@ -0,0 +1,70 @@
+"""Debounced property updates.
+
+Dragging a slider fires its update callback for every intermediate value.
+Instead of touching objects each time, callbacks made with ``deferred``
+only record which parts of which booth became dirty. A one-shot
+bpy.app.timers flush then applies every dirty part once, so a drag costs at
+most one round of object writes per frame, and only for the objects whose
+inputs changed.
+
+A dirty part is named after the method applying it: the part
+"floor_dimensions" is applied by ``props.update_floor_dimensions(context)``.
+"""
+
+import bpy
+
+from . import instrument
+
+FLUSH_INTERVAL = 1.0 / 60.0
+
+# (scene name, path of the booth properties) -> names of dirty parts
+_dirty = {}
+
+stats = {"marked": 0, "flushes": 0, "applied": 0}
+
+
+def mark_dirty(props, parts):
+    """Records ``parts`` of the booth owning ``props`` for the next flush."""
+    key = (props.id_data.name, props.path_from_id())
+    _dirty.setdefault(key, set()).update(parts)
+    stats["marked"] += 1
+
+    if not bpy.app.timers.is_registered(flush):
+        bpy.app.timers.register(flush, first_interval=FLUSH_INTERVAL)
+
+
+def deferred(*parts):
+    """Returns an update callback that marks ``parts`` dirty instead of applying them."""
+    def update(self, context):
+        mark_dirty(self, parts)
+    return update
+
+
+def flush():
+    """Applies every pending part once. Returns None so the timer does not repeat."""
+    pending = dict(_dirty)
+    _dirty.clear()
+    stats["flushes"] += 1
+
+    context = bpy.context
+    for (scene_name, path), parts in pending.items():
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is None:
+            continue
+        try:
+            props = scene.path_resolve(path)
+        except ValueError:
+            # The booth went away (undo, deleted scene data) before the flush
+            continue
+        for part in sorted(parts):
+            with instrument.span(f"flush {part}", "flush"):
+                getattr(props, f"update_{part}")(context)
+            stats["applied"] += 1
+    return None
+
+
+def cancel():
+    """Drops pending updates and the flush timer, e.g. when the add-on is disabled."""
+    _dirty.clear()
+    if bpy.app.timers.is_registered(flush):
+        bpy.app.timers.unregister(flush)
@@ -0,0 +1,39 @@
+"""Times computing complete booth layouts with the bpy-free booth model.
+
+Needs no Blender, only NumPy. Run from the repository root with:
+
+    python benchmarks/bench_booth_model.py --poles 1 20 1000 --repeat 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GenerativeBoothAddOn import booth
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--poles", type=int, nargs="+", default=[1, 20, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    print(f"{'poles':>7}{'arranged':>10}{'us/layout':>11}")
+    for count in args.poles:
+        for arranged in (False, True):
+            params = booth.default_params(pole_count=count, avoid_overlaps=arranged, floor_width=8.0,
+                                          floor_length=8.0, pole_pos_range=4.0)
+            booth.booth_layout(params)
+            start = time.perf_counter()
+            for seed in range(args.repeat):
+                params.seed = seed
+                booth.booth_layout(params)
+            us = (time.perf_counter() - start) * 1e6 / args.repeat
+            print(f"{count:>7}{str(arranged):>10}{us:>11.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
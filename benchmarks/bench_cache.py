@@ -0,0 +1,53 @@
+"""Times generating the same variants twice through an empty booth cache.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_cache.py -- --variants 100 --output files
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import cache
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--variants", type=int, default=100)
+    parser.add_argument("--output", choices=("collections", "files"), default="files")
+    args = parser.parse_args(argv)
+
+    addon.register()
+    seeds = list(range(args.variants))
+    ranges = {"floor_width": (3.0, 8.0), "pole_count": (2.0, 12.0)}
+
+    print(f"{'pass':>6}{'s':>9}{'hits':>7}{'misses':>8}{'hit rate':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        booth_cache = cache.open_cache(os.path.join(directory, "cache"), addon.DEFAULT_CACHE_MB * 1024 * 1024)
+        for label in ("cold", "warm"):
+            hits, misses = booth_cache.stats["hits"], booth_cache.stats["misses"]
+            start = time.perf_counter()
+            addon.generate_variants(
+                bpy.context, seeds, ranges,
+                output=args.output.upper(),
+                directory=os.path.join(directory, label),
+                booth_cache=booth_cache
+            )
+            seconds = time.perf_counter() - start
+            hits = booth_cache.stats["hits"] - hits
+            misses = booth_cache.stats["misses"] - misses
+            print(f"{label:>6}{seconds:>9.2f}{hits:>7}{misses:>8}{hits / max(1, hits + misses):>10.0%}")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
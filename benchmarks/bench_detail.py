@@ -0,0 +1,75 @@
+"""Reports vertex counts and build times of a booth for every detail mode.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_detail.py -- --levels 2 --repeat 5
+
+The counted vertices are checked against the evaluated meshes, and the
+booth's old geometry, parts subdivided with 5 cuts, is listed for comparison.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import booth, geometry, updates
+
+
+def evaluated_vertices(objects):
+    """Returns the vertex count of ``objects`` after modifiers, as Blender evaluates them."""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    total = 0
+    for obj in objects:
+        if obj.type != 'MESH' or geometry.is_instancer(obj):
+            continue
+        total += len(obj.evaluated_get(depsgraph).data.vertices)
+    return total
+
+
+def build_ms(props, repeat):
+    samples = []
+    for _ in range(repeat):
+        addon.remove_objects(addon.booth_mesh_objects(props))
+        addon.purge_orphans()
+        start = time.perf_counter()
+        addon.rebuild_booth(props, lights=False)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--levels", type=int, default=2)
+    parser.add_argument("--distance", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    props = bpy.context.scene.generative_booth_props
+    props.detail_levels = args.levels
+    props.detail_distance = args.distance
+
+    layout = booth.booth_layout(booth.default_params(), lights=False)
+    old = sum(booth.cube_counts(5 if part.cuts is None else part.cuts)[0] for part in layout.parts)
+    print(f"{'mode':>12}{'vertices':>10}{'evaluated':>11}{'build ms':>10}")
+    print(f"{'5 cuts':>12}{old:>10}{'-':>11}{'-':>10}")
+    for mode in booth.DETAIL_MODES:
+        props.detail_mode = mode
+        updates.flush()
+        ms = build_ms(props, args.repeat)
+        objects = addon.booth_mesh_objects(props)
+        count = addon.vertex_count(objects)
+        print(f"{mode:>12}{count:>10}{evaluated_vertices(objects):>11}{ms:>10.2f}")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,49 @@
+"""Times expo hall generation with and without deduplicated booth configurations.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_expo_hall.py -- --sizes 10x10 20x25
+"""
+
+import argparse
+import os
+import sys
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+
+
+def grid(text):
+    rows, columns = text.lower().split("x")
+    return int(rows), int(columns)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=grid, nargs="+", default=[(10, 10), (20, 25)])
+    parser.add_argument("--jitter", type=float, default=1.0)
+    parser.add_argument("--layouts", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    context = bpy.context
+
+    print(f"{'booths':>8}{'mode':>8}{'configs':>9}{'seconds':>9}{'objects':>9}{'meshes':>8}")
+    for rows, columns in args.sizes:
+        for deduplicate in (True, False):
+            result = addon.generate_expo_hall(context, rows, columns, jitter=args.jitter,
+                                              layouts=args.layouts, deduplicate=deduplicate)
+            mode = "dedup" if deduplicate else "full"
+            print(f"{result['booths']:>8}{mode:>8}{result['configurations']:>9}{result['seconds']:>9.2f}"
+                  f"{len(bpy.data.objects):>9}{len(bpy.data.meshes):>8}")
+            addon.remove_expo_hall()
+            bpy.data.orphans_purge(do_recursive=True)
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,47 @@
+"""Measures how variant throughput scales with the number of Blender workers.
+
+Runs with any Python 3 interpreter, outside Blender:
+
+    python benchmarks/bench_farm.py --variants 64 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import variant_farm
+
+
+def main(argv):
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--variants", type=int, default=64)
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"))
+    args = parser.parse_args(argv)
+
+    seeds = list(range(args.variants))
+    baseline = None
+
+    print(f"{'workers':>8}{'wall s':>10}{'variants/s':>12}{'speedup':>9}{'efficiency':>12}")
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = variant_farm.run_farm(seeds, directory, workers, args.blender, lights=False)
+        if manifest["failed_workers"]:
+            print(f"{workers:>8}  failed, rerun scripts/variant_farm.py to inspect worker.log")
+            continue
+
+        rate = manifest["variants_per_second"]
+        if baseline is None:
+            baseline = rate / workers
+        speedup = rate / baseline
+        print(f"{workers:>8}{manifest['wall_seconds']:>10.2f}{rate:>12.2f}{speedup:>9.2f}{speedup / workers:>12.0%}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
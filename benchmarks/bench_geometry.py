@@ -0,0 +1,134 @@
+"""Compares operator-based and data-API construction of the booth primitives.
+
+Also checks that the booth's area lights have the footprint the
+bpy.ops.object.light_add calls they replaced gave them.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_geometry.py -- --repeat 5 --poles 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import booth, geometry
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    for mat in list(bpy.data.materials):
+        bpy.data.materials.remove(mat)
+    for light in list(bpy.data.lights):
+        bpy.data.lights.remove(light)
+
+
+def operator_cube(location, scale, cuts):
+    """The cube recipe the builders used before the geometry engine."""
+    bpy.ops.mesh.primitive_cube_add(size=1.0, enter_editmode=False, align='WORLD',
+                                    location=location, scale=scale)
+    if cuts:
+        bpy.ops.object.editmode_toggle()
+        bpy.ops.mesh.subdivide(number_cuts=cuts)
+        bpy.ops.object.editmode_toggle()
+    return bpy.context.active_object
+
+
+def booth_with_operators(props, pole_count):
+    operator_cube((0, 0, 0.05), (props.floor_width, props.floor_length, 0.1), 5)
+    operator_cube((0, 0, 2.85), (props.roof_width, props.roof_length, 0.1), 5)
+    for _ in range(3):
+        operator_cube((0, 0, 0), (3.0, 0.1, 2.7), 0)
+    operator_cube((0, 0, 0.4), (0.4, 1.0, 0.8), 5)
+    operator_cube((0, 0, 0.2), (0.4, 0.4, 0.4), 5)
+    operator_cube((0, 0, 0.5), (0.4, 0.4, 1.0), 5)
+    for _ in range(pole_count):
+        operator_cube((0, 0, 1.4), (0.1, 0.1, 2.7), 0)
+
+
+def booth_with_geometry(props, pole_count):
+    addon.add_floor_booth(props.floor_width, props.floor_length, props.floor_height)
+    addon.add_roof_booth(props.roof_width, props.roof_length, props.roof_height)
+    addon.add_all_walls(props)
+    addon.add_table_booth(0.4, 1, 0.8, props.table_pos_range)
+    addon.add_chair_booth(0.4, 0.4, 0.4, props.chair_pos_range)
+    addon.add_totem_booth(0.4, 0.4, 1, props.totem_pos_range)
+    addon.generate_poles(pole_count, props.pole_pos_range, props.pole_color)
+
+
+def check_lights():
+    """Builds every light of the standard rig both ways and prints where they differ.
+
+    The operator gets the radius the old builders passed, which is the size
+    stored in the rig. Returns the number of differences.
+    """
+    params = booth.default_params(light_rig='STANDARD')
+    differences = 0
+    for light in booth.booth_lights(params):
+        bpy.ops.object.light_add(type='AREA', radius=light.size, align='WORLD', location=light.location,
+                                 rotation=light.rotation, scale=(1, 1, 1))
+        old = bpy.context.object
+        old.data.energy = light.energy
+        new = addon.new_light(light, bpy.context.scene.collection)
+
+        for name, before, after in (
+            ("size", old.data.size, new.data.size),
+            ("energy", old.data.energy, new.data.energy),
+            ("scale", tuple(old.scale), tuple(new.scale)),
+            ("location", tuple(old.location), tuple(new.location)),
+            ("rotation", tuple(old.rotation_euler), tuple(new.rotation_euler)),
+        ):
+            if geometry.differs(before if isinstance(before, tuple) else (before,),
+                                      after if isinstance(after, tuple) else (after,), 1e-4):
+                print(f"  {light.role} {name}: light_add {before}, add-on {after}")
+                differences += 1
+    clear_scene()
+    return differences
+
+
+def best_of(fn, repeat, *args):
+    timings = []
+    for _ in range(repeat):
+        clear_scene()
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    clear_scene()
+    return min(timings)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--poles", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    props = bpy.context.scene.generative_booth_props
+
+    ops_time = best_of(booth_with_operators, args.repeat, props, args.poles)
+    geo_time = best_of(booth_with_geometry, args.repeat, props, args.poles)
+
+    print(f"booth with {args.poles} poles (best of {args.repeat})")
+    print(f"  bpy.ops builders : {ops_time * 1000.0:9.2f} ms")
+    print(f"  geometry engine  : {geo_time * 1000.0:9.2f} ms")
+    print(f"  speedup          : {ops_time / geo_time:9.2f}x")
+
+    print("area lights against bpy.ops.object.light_add")
+    differences = check_lights()
+    print(f"  {differences} difference(s)")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,58 @@
+"""Reports datablock counts, .blend size and build time of poles per instancing mode.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_instancing.py -- --counts 10 100 1000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    bpy.data.orphans_purge(do_recursive=True)
+
+
+def blend_size(directory):
+    path = os.path.join(directory, "poles.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=path, copy=True)
+    return os.path.getsize(path)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args(argv)
+
+    addon.register()
+    props = bpy.context.scene.generative_booth_props
+
+    print(f"{'mode':<16}{'poles':>8}{'objects':>10}{'meshes':>9}{'blend KiB':>12}{'build ms':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ('OBJECTS', 'GEOMETRY_NODES'):
+            for count in args.counts:
+                clear_scene()
+                start = time.perf_counter()
+                addon.generate_poles(count, props.pole_pos_range, props.pole_color, instancing=mode)
+                elapsed = time.perf_counter() - start
+                size = blend_size(directory)
+                print(f"{mode:<16}{count:>8}{len(bpy.data.objects):>10}{len(bpy.data.meshes):>9}"
+                      f"{size / 1024.0:>12.1f}{elapsed * 1000.0:>11.2f}")
+
+    clear_scene()
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,70 @@
+"""Times the collision-free layout solver against a brute-force neighbor search.
+
+Needs no Blender, only the solver. Run from the repository root with:
+
+    python benchmarks/bench_layout.py --counts 10 100 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GenerativeBoothAddOn import solver
+
+
+class BruteForceIndex:
+    """Drop-in for SpatialHash that checks every placed element."""
+
+    def __init__(self, cell_size):
+        self.items = []
+
+    def insert(self, element):
+        self.items.append(element)
+
+    def nearby(self, x, y):
+        return iter(self.items)
+
+
+def elements(count):
+    kinds = (("table", 0.2, 0.5), ("chair", 0.2, 0.2), ("totem", 0.2, 0.2), ("pole", 0.05, 0.05))
+    result = []
+    for i in range(count):
+        kind, half_x, half_y = kinds[i % len(kinds)] if i < 12 else kinds[-1]
+        result.append(solver.Element(kind, i, half_x, half_y, pos_range=50.0))
+    return result
+
+
+def run(count, side):
+    batch = elements(count)
+    start = time.perf_counter()
+    unplaced = solver.solve_layout(batch, side, side, gap=0.1, wall_clearance=0.2)
+    return (time.perf_counter() - start) * 1000.0, len(unplaced)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--density", type=float, default=0.5, help="elements per square meter of floor")
+    args = parser.parse_args(argv)
+
+    print(f"{'elements':>9}{'floor m':>9}{'grid ms':>10}{'us/elem':>9}{'brute ms':>10}{'unplaced':>10}")
+    for count in args.counts:
+        side = max(3.0, (count / args.density) ** 0.5)
+
+        grid_ms, unplaced = run(count, side)
+
+        spatial_hash = solver.SpatialHash
+        solver.SpatialHash = BruteForceIndex
+        try:
+            brute_ms, _ = run(count, side)
+        finally:
+            solver.SpatialHash = spatial_hash
+
+        print(f"{count:>9}{side:>9.1f}{grid_ms:>10.2f}{grid_ms * 1000.0 / count:>9.1f}{brute_ms:>10.2f}{unplaced:>10}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
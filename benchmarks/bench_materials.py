@@ -0,0 +1,56 @@
+"""Checks that material counts stay bounded and times palette swaps.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_materials.py -- --clicks 100 --booths 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import materials, updates
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clicks", type=int, default=100)
+    parser.add_argument("--booths", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    scene = bpy.context.scene
+    props = scene.generative_booth_props
+
+    for _ in range(args.clicks):
+        addon.add_all_walls(props)
+    print(f"'Add Walls' x{args.clicks}: {len(bpy.data.materials)} materials")
+
+    booths = [addon.add_booth_instance(scene) for _ in range(args.booths)]
+    for booth in booths:
+        addon.rebuild_booth(booth, lights=False)
+    print(f"{args.booths} booths: {len(bpy.data.materials)} materials")
+
+    for step in range(args.clicks):
+        booths[0].floor_color = (step / args.clicks, 0.5, 0.5, 1.0)
+        updates.flush()
+    print(f"Floor color dragged over {args.clicks} values: {len(bpy.data.materials)} materials, "
+          f"cache {materials.stats}")
+
+    for key, (label, colors) in addon.BOOTH_PALETTES.items():
+        start = time.perf_counter()
+        merged = addon.apply_palette(colors)
+        ms = (time.perf_counter() - start) * 1000.0
+        print(f"Palette {label:>9}: {ms:8.2f} ms, {merged} materials merged, {len(bpy.data.materials)} left")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,74 @@
+"""Times the slices of a time sliced booth build, as the Generate Booth operator runs them.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_modal.py -- --poles 10000
+
+Background mode has no window to run a modal operator in, so the steps are
+driven here the same way its timer events drive them: each slice runs steps
+for up to SLICE_SECONDS in one object batch. Prints how many slices the build
+took and how long the longest one blocked, which bounds the UI latency.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import booth
+
+
+def run_slices(steps):
+    """Runs ``steps`` to the end in timed slices. Returns the milliseconds of every slice."""
+    slices = []
+    done = False
+    while not done:
+        start = time.perf_counter()
+        deadline = start + addon.SLICE_SECONDS
+        with addon.object_batch():
+            while time.perf_counter() < deadline:
+                try:
+                    next(steps)
+                except StopIteration:
+                    done = True
+                    break
+        slices.append((time.perf_counter() - start) * 1000.0)
+    return slices
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--poles", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    scene = bpy.context.scene
+
+    print(f"{'build':>20}{'objects':>9}{'slices':>8}{'median ms':>11}{'max ms':>9}{'total s':>9}")
+    for instancing in ('OBJECTS', 'GEOMETRY_NODES'):
+        params = addon.booth_params(scene.generative_booth_props, pole_count=args.poles, pole_instancing=instancing)
+        layout = booth.booth_layout(params, lights=True, camera=False)
+        props = addon.add_booth_instance(scene)
+        addon.write_booth_params(props, params)
+
+        start = time.perf_counter()
+        slices = run_slices(addon.booth_instance_steps(scene, props.name, layout))
+        total = time.perf_counter() - start
+        print(f"{instancing:>20}{addon.layout_step_count(layout):>9}{len(slices):>8}"
+              f"{statistics.median(slices):>11.2f}{max(slices):>9.2f}{total:>9.2f}")
+
+        start = time.perf_counter()
+        addon.remove_booth_instance(scene, scene.generative_booths.find(props.name))
+        print(f"{'rollback':>20}{'':>9}{'':>8}{'':>11}{(time.perf_counter() - start) * 1000.0:>9.2f}")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
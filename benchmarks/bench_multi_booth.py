@@ -0,0 +1,67 @@
+"""Times editing one booth while the scene holds a growing number of booths.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_multi_booth.py -- --booths 10 50 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import updates
+
+
+def clear_scene(scene):
+    while len(scene.generative_booths):
+        addon.remove_booth_instance(scene, len(scene.generative_booths) - 1)
+    bpy.data.orphans_purge(do_recursive=True)
+
+
+def edit_ms(props, repeat):
+    """Drags the floor width of ``props`` ``repeat`` times, flushing after each step."""
+    start = time.perf_counter()
+    for step in range(repeat):
+        props.floor_width = 3.0 + (step % 50) * 0.1
+        # No timers run in background mode, so flush by hand as the timer would
+        updates.flush()
+    return (time.perf_counter() - start) * 1000.0 / repeat
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--booths", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    scene = bpy.context.scene
+
+    print(f"{'booths':>8}{'objects':>9}{'build s':>9}{'edit ms':>9}{'parts/flush':>13}")
+    for count in args.booths:
+        clear_scene(scene)
+
+        start = time.perf_counter()
+        for _ in range(count):
+            addon.rebuild_booth(addon.add_booth_instance(scene), lights=False)
+        build_s = time.perf_counter() - start
+
+        applied = updates.stats["applied"]
+        flushes = updates.stats["flushes"]
+        ms = edit_ms(scene.generative_booths[count // 2], args.repeat)
+        parts = (updates.stats["applied"] - applied) / max(1, updates.stats["flushes"] - flushes)
+
+        print(f"{count:>8}{len(scene.objects):>9}{build_s:>9.2f}{ms:>9.3f}{parts:>13.1f}")
+
+    clear_scene(scene)
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,64 @@
+"""Times pole placement: per-element streams versus the vectorized sampler.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_placement.py -- --counts 20 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import placement, rng
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def per_element(count, pos_range):
+    return [rng.element_position(0, "pole", i, pos_range) for i in range(count)]
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    bpy.data.orphans_purge(do_recursive=True)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[20, 1000, 10000])
+    args = parser.parse_args(argv)
+
+    addon.register()
+
+    print(f"{'poles':>8}{'streams ms':>12}{'numpy ms':>10}{'reroll objects ms':>19}{'reroll cloud ms':>17}")
+    for count in args.counts:
+        _, stream_ms = timed(per_element, count, 2.0)
+        _, numpy_ms = timed(placement.sample_positions, 0, "pole", count, 2.0)
+
+        clear_scene()
+        poles = addon.generate_poles(count, 2.0, (1, 1, 1, 1), instancing='OBJECTS')
+        _, objects_ms = timed(addon.reroll_poles, poles, 0, 2.0)
+
+        clear_scene()
+        cloud = addon.generate_poles(count, 2.0, (1, 1, 1, 1), instancing='GEOMETRY_NODES')
+        _, cloud_ms = timed(addon.reroll_poles, cloud, 0, 2.0)
+
+        print(f"{count:>8}{stream_ms:>12.2f}{numpy_ms:>10.2f}{objects_ms:>19.2f}{cloud_ms:>17.2f}")
+
+    clear_scene()
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,59 @@
+"""Times rebuilding a booth from scratch, unchanged and after small edits.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_rebuild.py -- --poles 200 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+
+
+def timed_rebuild(props):
+    start = time.perf_counter()
+    stats = addon.rebuild_booth(props)
+    return stats, (time.perf_counter() - start) * 1000.0
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--poles", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    props = bpy.context.scene.generative_booth_props
+    props.pole_count = args.poles
+
+    steps = [("first build", None)]
+    steps += [("unchanged", None)] * args.repeat
+    steps += [
+        ("wider floor", ("floor_width", 6.0)),
+        ("fewer poles", ("pole_count", args.poles // 2)),
+        ("more poles", ("pole_count", args.poles)),
+        ("pole cloud", ("pole_instancing", 'GEOMETRY_NODES')),
+    ]
+
+    print(f"{'step':>12}{'ms':>9}{'created':>9}{'updated':>9}{'removed':>9}{'objects':>9}")
+    for label, change in steps:
+        if change is not None:
+            setattr(props, *change)
+        stats, ms = timed_rebuild(props)
+        if label == "unchanged" and stats["created"] + stats["removed"]:
+            print("rebuilding an unchanged booth created or removed objects")
+        print(f"{label:>12}{ms:>9.2f}{stats['created']:>9}{stats['updated']:>9}{stats['removed']:>9}"
+              f"{len(bpy.data.objects):>9}")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
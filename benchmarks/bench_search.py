@@ -0,0 +1,68 @@
+"""Times the generative layout search and compares its winners with a single random layout.
+
+Needs no Blender, only NumPy. Run from the repository root with:
+
+    python benchmarks/bench_search.py --candidates 1000 5000 20000 --poles 4 50 --workers 1 4
+
+A worker count of 1 searches in this process; more score the candidates in
+a process pool, which must find the same winners. The serial search always
+runs first, and every pool run reports its throughput against it. Pool times
+include starting the worker processes, and a pool can only be faster on a
+machine with more than one core.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GenerativeBoothAddOn import booth, search
+
+
+def layout_positions(layout):
+    """Returns the element and pole positions of a layout in layout_space order."""
+    rows = [part.location[:2] for part in layout.elements()]
+    return np.concatenate([np.array(rows).reshape(-1, 2), layout.poles.positions])[None]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--poles", type=int, nargs="+", default=[4, 50])
+    parser.add_argument("--keep", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, search.default_workers()])
+    args = parser.parse_args(argv)
+    workers_list = [1] + sorted({workers for workers in args.workers if workers > 1})
+
+    print(f"{os.cpu_count()} cores")
+    print(f"{'poles':>7}{'candidates':>12}{'workers':>9}{'s':>8}{'per s':>9}{'speedup':>9}{'random':>8}{'best':>8}")
+    for count in args.poles:
+        params = booth.default_params(pole_count=count, floor_width=6.0, floor_length=6.0, pole_pos_range=3.0)
+        layout = booth.booth_layout(params, lights=False, camera=False)
+        space = search.layout_space(layout, params)
+        random_score = search.score(space, layout_positions(layout))[0][0]
+        for candidates in args.candidates:
+            scores = set()
+            serial = None
+            for workers in workers_list:
+                start = time.perf_counter()
+                if workers > 1:
+                    winners = search.parallel_search(space, candidates, args.keep, params.seed, workers=workers)
+                else:
+                    winners = search.search(space, candidates, args.keep, params.seed)
+                seconds = time.perf_counter() - start
+                if serial is None:
+                    serial = seconds
+                scores.add(tuple(winner.score for winner in winners))
+                print(f"{count:>7}{candidates:>12}{workers:>9}{seconds:>8.2f}{candidates / seconds:>9.0f}"
+                      f"{serial / seconds:>8.2f}x{random_score:>8.3f}{winners[0].score:>8.3f}")
+            if len(scores) > 1:
+                print("the process pool found different winners")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
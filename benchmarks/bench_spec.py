@@ -0,0 +1,67 @@
+"""Times writing and parsing booth spec files of many booths.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_spec.py -- --booths 1000 --poles 20
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import specs
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--booths", type=int, default=1000)
+    parser.add_argument("--poles", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    props = bpy.context.scene.generative_booth_props
+    props.pole_count = args.poles
+    addon.rebuild_booth(props)
+    template = addon.spec_from_booth(props)
+
+    booths = []
+    for index in range(args.booths):
+        booth = dict(template, name=f"Booth_{index:04d}")
+        booth["params"] = dict(template["params"], seed=index)
+        booths.append(booth)
+
+    formats = [".jsonl", ".json"]
+    try:
+        import msgpack  # noqa: F401
+        formats.append(".msgpack")
+    except ImportError:
+        print("msgpack is not installed, skipping .msgpack")
+
+    print(f"{'format':>9}{'MB':>8}{'write ms':>10}{'parse ms':>10}{'us/booth':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in formats:
+            path = os.path.join(directory, f"booths{extension}")
+
+            start = time.perf_counter()
+            specs.write(path, booths)
+            write_ms = (time.perf_counter() - start) * 1000.0
+
+            start = time.perf_counter()
+            count = sum(1 for _ in specs.iter_specs(path))
+            parse_ms = (time.perf_counter() - start) * 1000.0
+
+            size = os.path.getsize(path) / 1e6
+            print(f"{extension:>9}{size:>8.2f}{write_ms:>10.1f}{parse_ms:>10.1f}{parse_ms * 1000.0 / count:>10.1f}")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,61 @@
+"""Checks that streaming a batch to files keeps memory flat and times each stage.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_stream.py -- --variants 1000 --format gltf
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def peak_rss_mb():
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--variants", type=int, default=1000)
+    parser.add_argument("--chunk", type=int, default=100)
+    parser.add_argument("--format", choices=("blend", "gltf", "fbx", "obj"), default="gltf")
+    args = parser.parse_args(argv)
+
+    addon.register()
+
+    print(f"{'variants':>9}{'peak MB':>9}{'blocks':>8}{'build ms':>10}{'export ms':>11}{'purge ms':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for first in range(0, args.variants, args.chunk):
+            results = addon.generate_variants(
+                bpy.context, range(first, min(first + args.chunk, args.variants)),
+                output='FILES', directory=directory, lights=True, camera=False,
+                file_format=args.format.upper()
+            )
+            mean = {
+                stage: sum(result["stages"].get(stage, 0.0) for result in results) * 1000.0 / len(results)
+                for stage in ("build", "export", "purge")
+            }
+            print(f"{first + len(results):>9}{peak_rss_mb():>9.1f}{results[-1]['datablocks']:>8}"
+                  f"{mean['build']:>10.2f}{mean['export']:>11.2f}{mean['purge']:>10.2f}")
+
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
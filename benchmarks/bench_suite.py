@@ -0,0 +1,226 @@
+"""Times every booth operator, property-update storms and full booth builds.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_suite.py -- --output results.json
+
+Every case runs ``--repeat`` times on a fresh booth and reports min, median,
+mean and max milliseconds. ``--output`` writes them to JSON together with the
+add-on and Blender versions; ``--compare`` prints the median of each case
+against such a file from an earlier version and flags cases that got slower
+than ``--threshold`` times the baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import booth, updates
+
+
+def reset_booth(scene):
+    """Deletes every object in the scene, so the next case starts from an empty booth."""
+    addon.remove_objects(list(scene.objects))
+    addon.purge_orphans()
+    props = scene.generative_booth_props
+    props.elements.clear()
+    return props
+
+
+def operator_case(operator, **settings):
+    """Returns (setup, run) calling bpy.ops ``operator`` on a fresh booth with ``settings``."""
+    category, name = operator.split(".")
+    call = getattr(getattr(bpy.ops, category), name)
+
+    def setup(scene):
+        props = reset_booth(scene)
+        for key, value in settings.items():
+            setattr(props, key, value)
+        updates.flush()
+
+    def run(scene):
+        call()
+    return setup, run
+
+
+def built_booth(scene, **settings):
+    props = reset_booth(scene)
+    for key, value in settings.items():
+        setattr(props, key, value)
+    updates.flush()
+    addon.rebuild_booth(props)
+    return props
+
+
+def storm_case(prop, values, flush_each):
+    """Returns (setup, run) writing every value of ``values`` to ``prop`` of a built booth.
+
+    With ``flush_each`` the deferred updates are applied after every write,
+    as they are once per frame while dragging a slider; otherwise once at the end.
+    """
+    def setup(scene):
+        built_booth(scene)
+
+    def run(scene):
+        props = scene.generative_booth_props
+        for value in values:
+            setattr(props, prop, value)
+            if flush_each:
+                updates.flush()
+        updates.flush()
+    return setup, run
+
+
+def build_case(lights=True, camera=True, **settings):
+    """Returns (setup, run) building a whole booth into a new collection with build_booth."""
+    def setup(scene):
+        reset_booth(scene)
+        for collection in list(bpy.data.collections):
+            bpy.data.collections.remove(collection)
+
+    def run(scene):
+        collection = bpy.data.collections.new("Bench_Booth")
+        scene.collection.children.link(collection)
+        params = addon.booth_params(scene.generative_booth_props, **settings)
+        addon.build_booth(params, collection, lights=lights, camera=camera)
+    return setup, run
+
+
+def rebuild_case(**settings):
+    """Returns (setup, run) rebuilding an unchanged booth, which should touch nothing."""
+    def setup(scene):
+        built_booth(scene, **settings)
+
+    def run(scene):
+        addon.rebuild_booth(scene.generative_booth_props)
+    return setup, run
+
+
+def layout_case(**settings):
+    """Returns (setup, run) computing a booth layout without creating any object."""
+    params = booth.default_params(**settings)
+
+    def run(scene):
+        booth.booth_layout(params)
+    return (lambda scene: None), run
+
+
+def suite_cases():
+    widths = [3.0 + (step % 50) * 0.1 for step in range(100)]
+    colors = [(step / 100.0, 0.5, 0.5, 1.0) for step in range(100)]
+    toggles = [step % 2 == 0 for step in range(100)]
+    rigs = [tuple(booth.LIGHT_RIGS)[step % len(booth.LIGHT_RIGS)] for step in range(100)]
+    return [
+        ("op mesh.add_floor_booth", operator_case("mesh.add_floor_booth")),
+        ("op mesh.add_roof_booth", operator_case("mesh.add_roof_booth")),
+        ("op mesh.add_all_walls", operator_case("mesh.add_all_walls")),
+        ("op mesh.add_table_booth", operator_case("mesh.add_table_booth")),
+        ("op mesh.add_poles_booth poles=1", operator_case("mesh.add_poles_booth", pole_count=1)),
+        ("op mesh.add_poles_booth poles=20", operator_case("mesh.add_poles_booth", pole_count=20)),
+        ("op mesh.add_poles_booth poles=1000", operator_case("mesh.add_poles_booth", pole_count=1000)),
+        ("op mesh.add_poles_booth poles=1000 gn",
+         operator_case("mesh.add_poles_booth", pole_count=1000, pole_instancing='GEOMETRY_NODES')),
+        ("op object.add_all_lights", operator_case("object.add_all_lights")),
+        ("op object.add_keyframed_camera", operator_case("object.add_keyframed_camera")),
+        ("storm floor_width x100 flush each", storm_case("floor_width", widths, True)),
+        ("storm floor_width x100 one flush", storm_case("floor_width", widths, False)),
+        ("storm floor_color x100 flush each", storm_case("floor_color", colors, True)),
+        ("storm light_top_visible x100", storm_case("light_top_visible", toggles, False)),
+        ("storm light_rig x100 flush each", storm_case("light_rig", rigs, True)),
+        ("build booth poles=20", build_case(pole_count=20)),
+        ("build booth poles=1000", build_case(pole_count=1000)),
+        ("build booth poles=1000 gn", build_case(pole_count=1000, pole_instancing='GEOMETRY_NODES')),
+        ("build booth poles=20 arranged", build_case(pole_count=20, avoid_overlaps=True)),
+        ("rebuild unchanged poles=20", rebuild_case(pole_count=20)),
+        ("layout poles=20", layout_case(pole_count=20)),
+    ]
+
+
+def time_case(scene, setup, run, repeat):
+    samples = []
+    for _ in range(repeat):
+        setup(scene)
+        start = time.perf_counter()
+        run(scene)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+        "runs": repeat,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Prints each case's median against ``baseline``. Returns the names of regressed cases."""
+    regressions = []
+    print(f"\n{'case':<42}{'base ms':>10}{'now ms':>10}{'ratio':>8}")
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<42}{'-':>10}{result['median_ms']:>10.3f}{'new':>8}")
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] > 0 else float("inf")
+        flag = "  SLOWER" if ratio > threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<42}{before['median_ms']:>10.3f}{result['median_ms']:>10.3f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="ratio over the baseline that counts as slower")
+    args = parser.parse_args(argv)
+
+    if not hasattr(bpy.types.Scene, "generative_booth_props"):
+        addon.register()
+    scene = bpy.context.scene
+
+    results = {}
+    print(f"{'case':<42}{'min ms':>10}{'median ms':>11}{'max ms':>10}")
+    for name, (setup, run) in suite_cases():
+        if args.filter not in name:
+            continue
+        result = results[name] = time_case(scene, setup, run, args.repeat)
+        print(f"{name:<42}{result['min_ms']:>10.3f}{result['median_ms']:>11.3f}{result['max_ms']:>10.3f}")
+    reset_booth(scene)
+
+    report = {
+        "addon_version": list(addon.bl_info["version"]),
+        "blender": bpy.app.version_string,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} case(s) slower than {args.threshold:.2f}x the baseline")
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,74 @@
+"""Counts the depsgraph evaluations and updated datablocks of single booth edits.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python benchmarks/bench_updates.py -- --poles 20
+
+Every edit is flushed and followed by one view layer update, as the next
+redraw would do in the UI. Edits that write a value the booth already has
+should update nothing.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import instrument, updates
+
+
+def measure(edit):
+    """Runs ``edit`` and one view layer update. Returns (ms, evaluations, updated datablocks)."""
+    instrument.reset()
+    start = time.perf_counter()
+    edit()
+    updates.flush()
+    bpy.context.view_layer.update()
+    ms = (time.perf_counter() - start) * 1000.0
+    return ms, instrument.counters["evaluations"], instrument.counters["updated"]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--poles", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    addon.register()
+    scene = bpy.context.scene
+    props = scene.generative_booth_props
+    props.pole_count = args.poles
+    updates.flush()
+    instrument.enable()
+    measure(lambda: addon.rebuild_booth(props))
+
+    def write(prop, value):
+        return lambda: setattr(props, prop, value)
+
+    edits = [
+        ("same floor width", write("floor_width", props.floor_width)),
+        ("new floor width", write("floor_width", props.floor_width + 1.0)),
+        ("same floor color", write("floor_color", tuple(props.floor_color))),
+        ("same wall length", write("back_wall_length", props.back_wall_length)),
+        ("hide back wall", write("back_wall_visible", False)),
+        ("hide back wall again", write("back_wall_visible", False)),
+        ("rebuild unchanged", lambda: addon.rebuild_booth(props)),
+        ("arrange elements", lambda: bpy.ops.object.arrange_booth_elements()),
+        ("arrange again", lambda: bpy.ops.object.arrange_booth_elements()),
+    ]
+
+    print(f"{'edit':<24}{'ms':>9}{'evals':>7}{'updated':>9}")
+    for label, edit in edits:
+        ms, evaluations, updated = measure(edit)
+        print(f"{label:<24}{ms:>9.2f}{evaluations:>7}{updated:>9}")
+
+    instrument.disable()
+    addon.unregister()
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,119 @@
+"""Generates a batch of booth variants in a background Blender session.
+
+Run from the repository root with:
+
+    blender -b --factory-startup --python scripts/generate_variants.py -- \
+        --seeds 0:100 --range floor_width 3 8 --range pole_count 2 12 \
+        --output files --directory out/variants
+
+Seeds are given as ``start:stop`` (stop excluded) or a comma separated list.
+Every ``--range NAME LOW HIGH`` samples one GenerativeBoothProperties
+parameter per variant; without any, the add-on defaults are used.
+
+With ``--spec booths.jsonl`` the booths are built from a spec file instead
+of seeds, read one booth at a time:
+
+    blender -b --factory-startup --python scripts/generate_variants.py -- \
+        --spec booths.jsonl --output files --directory out/booths
+
+With ``--cache DIR`` booths generated before, by any run sharing ``DIR``,
+are reused instead of being built again.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GenerativeBoothAddOn as addon
+from GenerativeBoothAddOn import cache, specs
+
+
+def parse_seeds(text):
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return list(range(int(start), int(stop)))
+    return [int(seed) for seed in text.split(",") if seed]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seeds", type=parse_seeds, default=parse_seeds("0:10"))
+    parser.add_argument("--spec", help="build the booths of this .json, .jsonl or .msgpack spec file instead")
+    parser.add_argument("--range", nargs=3, action="append", metavar=("NAME", "LOW", "HIGH"), dest="ranges")
+    parser.add_argument("--output", choices=("collections", "files"), default="files")
+    parser.add_argument("--directory", default="booth_variants")
+    parser.add_argument("--format", choices=("blend", "gltf", "fbx", "obj"), default="blend", help="file format of files output")
+    parser.add_argument("--manifest", help="write the per-variant results to this JSON file")
+    parser.add_argument("--save", help="save the resulting .blend here (collections output)")
+    parser.add_argument("--no-lights", action="store_true")
+    parser.add_argument("--no-camera", action="store_true")
+    parser.add_argument("--cache", help="reuse and store generated booths in this directory")
+    parser.add_argument("--cache-mb", type=int, default=addon.DEFAULT_CACHE_MB, help="size limit of the cache")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    args = parse_args(argv)
+
+    if not hasattr(bpy.types.Scene, "generative_booth_props"):
+        addon.register()
+
+    ranges = None
+    if args.ranges:
+        ranges = {name: (float(low), float(high)) for name, low, high in args.ranges}
+
+    booth_cache = None
+    if args.cache:
+        booth_cache = cache.open_cache(args.cache, args.cache_mb * 1024 * 1024)
+
+    start = time.perf_counter()
+    if args.spec:
+        steps = addon.spec_steps(
+            bpy.context,
+            specs.iter_specs(args.spec),
+            output=args.output.upper(),
+            directory=os.path.abspath(args.directory),
+            camera=not args.no_camera,
+            file_format=args.format.upper(),
+            booth_cache=booth_cache
+        )
+    else:
+        steps = addon.variant_steps(
+            bpy.context,
+            args.seeds,
+            ranges,
+            output=args.output.upper(),
+            directory=os.path.abspath(args.directory),
+            lights=not args.no_lights,
+            camera=not args.no_camera,
+            file_format=args.format.upper(),
+            booth_cache=booth_cache
+        )
+    results = []
+    for result in steps:
+        results.append(result)
+        label = f"spec {result['name']}" if "name" in result else f"variant seed={result['seed']}"
+        print(f"{label} built in {result['seconds'] * 1000.0:.1f} ms ({addon.format_stages(result['stages'])})")
+    wall = time.perf_counter() - start
+
+    print(addon.summarize_variants(results))
+    print(f"Wall time including bookkeeping: {wall:.2f} s")
+    if booth_cache is not None:
+        print(f"Cache: {booth_cache.stats}")
+
+    if args.manifest:
+        with open(args.manifest, "w", encoding="utf-8") as handle:
+            json.dump({"wall_seconds": wall, "variants": results}, handle, indent=2)
+
+    if args.save:
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.save))
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
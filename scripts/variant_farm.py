@@ -0,0 +1,151 @@
+"""Fans a batch of booth variants out to a pool of background Blender workers.
+
+Blender's Python runs one booth at a time, so throughput comes from running
+several ``blender -b`` processes side by side. This driver runs with any
+Python 3 interpreter, outside Blender:
+
+    python scripts/variant_farm.py --seeds 0:1000 --workers 8 \
+        --range floor_width 3 8 --format gltf --output-dir out/farm
+
+Each worker runs scripts/generate_variants.py on its shard of the seeds and
+writes its files and a partial manifest into ``output-dir/worker_NN``. The
+driver merges those into ``output-dir/manifest.json``. With ``--cache DIR``
+all workers share one booth cache, so a rerun only builds new booths.
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WORKER_SCRIPT = os.path.join(HERE, "generate_variants.py")
+
+
+def parse_seeds(text):
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return list(range(int(start), int(stop)))
+    return [int(seed) for seed in text.split(",") if seed]
+
+
+def shard(seeds, count):
+    """Splits ``seeds`` into at most ``count`` contiguous, evenly sized shards."""
+    size = max(1, math.ceil(len(seeds) / max(1, count)))
+    return [seeds[i:i + size] for i in range(0, len(seeds), size)]
+
+
+def worker_command(blender, seeds, directory, manifest, file_format, ranges, lights, camera, cache=None):
+    command = [
+        blender, "-b", "--factory-startup", "--python-exit-code", "1", "--python", WORKER_SCRIPT, "--",
+        "--seeds", ",".join(str(seed) for seed in seeds),
+        "--output", "files",
+        "--directory", directory,
+        "--format", file_format,
+        "--manifest", manifest,
+    ]
+    for name, low, high in ranges or ():
+        command += ["--range", name, str(low), str(high)]
+    if not lights:
+        command.append("--no-lights")
+    if not camera:
+        command.append("--no-camera")
+    if cache:
+        command += ["--cache", cache]
+    return command
+
+
+def run_worker(index, command, directory, manifest):
+    os.makedirs(directory, exist_ok=True)
+    # A manifest left by an earlier run must not pass for this run's
+    if os.path.exists(manifest):
+        os.remove(manifest)
+    start = time.perf_counter()
+    with open(os.path.join(directory, "worker.log"), "w", encoding="utf-8") as log:
+        returncode = subprocess.call(command, stdout=log, stderr=subprocess.STDOUT)
+    elapsed = time.perf_counter() - start
+
+    # Blender exits with 0 even when it could not run the script, so a
+    # worker without a manifest failed whatever its return code
+    failed = returncode != 0 or not os.path.exists(manifest)
+    variants = []
+    if not failed:
+        with open(manifest, encoding="utf-8") as handle:
+            variants = json.load(handle)["variants"]
+    return {"worker": index, "returncode": returncode, "failed": failed, "seconds": elapsed, "variants": variants}
+
+
+def run_farm(seeds, output_dir, workers=None, blender="blender", file_format="blend",
+             ranges=None, lights=True, camera=False, cache=None):
+    """Generates every seed across ``workers`` Blender processes and writes the manifest.
+
+    Returns the manifest as a dict.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shard(list(seeds), workers)
+    os.makedirs(output_dir, exist_ok=True)
+    if cache:
+        cache = os.path.abspath(cache)
+
+    jobs = []
+    for index, seeds_of_worker in enumerate(shards):
+        directory = os.path.abspath(os.path.join(output_dir, f"worker_{index:02d}"))
+        manifest = os.path.join(directory, "manifest.json")
+        command = worker_command(blender, seeds_of_worker, directory, manifest,
+                                 file_format, ranges, lights, camera, cache)
+        jobs.append((index, command, directory, manifest))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(jobs) or 1) as pool:
+        reports = list(pool.map(lambda job: run_worker(*job), jobs))
+    wall = time.perf_counter() - start
+
+    variants = sorted((v for report in reports for v in report["variants"]), key=lambda v: v["seed"])
+    manifest = {
+        "blender": blender,
+        "workers": len(jobs),
+        "format": file_format,
+        "requested": len(seeds),
+        "generated": len(variants),
+        "wall_seconds": wall,
+        "variants_per_second": len(variants) / wall if wall > 0 else 0.0,
+        "failed_workers": [r["worker"] for r in reports if r["failed"]],
+        "variants": variants,
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+    return manifest
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seeds", type=parse_seeds, default=parse_seeds("0:100"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"))
+    parser.add_argument("--output-dir", default="booth_farm")
+    parser.add_argument("--format", choices=("blend", "gltf", "fbx", "obj"), default="blend")
+    parser.add_argument("--range", nargs=3, action="append", metavar=("NAME", "LOW", "HIGH"), dest="ranges")
+    parser.add_argument("--no-lights", action="store_true")
+    parser.add_argument("--camera", action="store_true")
+    parser.add_argument("--cache", help="booth cache directory shared by all workers")
+    args = parser.parse_args(argv)
+
+    manifest = run_farm(
+        args.seeds, args.output_dir, args.workers, args.blender, args.format,
+        args.ranges, lights=not args.no_lights, camera=args.camera, cache=args.cache
+    )
+
+    print(f"{manifest['generated']}/{manifest['requested']} variants with {manifest['workers']} workers "
+          f"in {manifest['wall_seconds']:.2f} s ({manifest['variants_per_second']:.1f} variants/s)")
+    if manifest["failed_workers"]:
+        print(f"Failed workers (see worker.log): {manifest['failed_workers']}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,10 @@
+"""Makes the add-on package importable from plain CPython, without Blender.
+
+Without bpy the package only exposes its bpy-free modules, which is what these
+tests cover.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,73 @@
+"""Tests of the bpy-free booth model, its random streams and pole placement."""
+
+import numpy as np
+
+from GenerativeBoothAddOn import booth, placement, rng
+
+
+def snapshot(layout):
+    """Everything a layout would build, as plain comparable values."""
+    return (
+        [(part.name, part.location, part.scale, part.rotation, part.color, part.visible, part.detail)
+         for part in layout.parts],
+        layout.poles.positions.tolist(),
+        [(light.role, light.location, light.size, light.energy, light.visible) for light in layout.lights],
+        [(key.frame, key.location) for key in layout.camera],
+    )
+
+
+def test_same_seed_gives_same_layout():
+    params = booth.default_params(seed=7, pole_count=30)
+    assert snapshot(booth.booth_layout(params)) == snapshot(booth.booth_layout(params))
+
+
+def test_same_seed_gives_same_arranged_layout():
+    params = booth.default_params(seed=7, pole_count=30, avoid_overlaps=True)
+    assert snapshot(booth.booth_layout(params)) == snapshot(booth.booth_layout(params))
+
+
+def test_other_seed_moves_elements():
+    first = booth.booth_layout(booth.default_params(seed=1))
+    second = booth.booth_layout(booth.default_params(seed=2))
+    assert [part.location for part in first.elements()] != [part.location for part in second.elements()]
+    assert not np.array_equal(first.poles.positions, second.poles.positions)
+
+
+def test_layout_without_lights_and_camera():
+    layout = booth.booth_layout(booth.default_params(), lights=False, camera=False)
+    assert layout.lights == []
+    assert layout.camera == []
+
+
+def test_light_rigs_only_light_their_sides():
+    for rig, template in booth.LIGHT_RIGS.items():
+        layout = booth.booth_layout(booth.default_params(light_rig=rig))
+        assert [light.side for light in layout.lights] == list(template)
+        assert set(template) <= set(booth.LIGHT_SIDES)
+
+
+def test_hidden_light_stays_in_layout_hidden():
+    layout = booth.booth_layout(booth.default_params(light_top_visible=False))
+    top = next(light for light in layout.lights if light.side == "top")
+    assert not top.visible
+
+
+def test_element_streams_are_stable_and_independent():
+    assert rng.derive_seed(3, "table", 0) == rng.derive_seed(3, "table", 0)
+    assert rng.derive_seed(3, "table", 0) != rng.derive_seed(3, "table", 1)
+    assert rng.derive_seed(3, "table", 0) != rng.derive_seed(3, "chair", 0)
+    assert rng.element_position(3, "table", 0, 1.0) == rng.element_position(3, "table", 0, 1.0)
+    assert rng.element_position(3, "table", 0, 1.0, 1) != rng.element_position(3, "table", 0, 1.0)
+
+
+def test_pole_rows_do_not_depend_on_count():
+    few = placement.sample_positions(5, "pole", 4, 1.5)
+    many = placement.sample_positions(5, "pole", 100, 1.5)
+    np.testing.assert_array_equal(few, many[:4])
+    assert np.all(np.abs(many) <= 1.5)
+
+
+def test_to_points_lifts_positions():
+    points = placement.to_points(np.array([[1.0, 2.0], [3.0, 4.0]]), 1.4)
+    assert points.dtype == np.float32
+    np.testing.assert_allclose(points, [[1.0, 2.0, 1.4], [3.0, 4.0, 1.4]], rtol=1e-6)
@@ -0,0 +1,111 @@
+"""Tests of the on-disk booth cache."""
+
+import os
+
+from GenerativeBoothAddOn import cache
+
+SPEC = {"version": 1, "name": "Booth_1", "params": {"seed": 1}, "lights": True}
+
+
+def put(booth_cache, key, size, mtime=None):
+    """Writes an entry of ``size`` bytes through pending_path and commit."""
+    pending = booth_cache.pending_path(key, ".blend")
+    with open(pending, "wb") as handle:
+        handle.write(b"x" * size)
+    path = booth_cache.commit(key, ".blend", pending)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_spec_key_ignores_name_but_not_params():
+    renamed = dict(SPEC, name="Other")
+    changed = dict(SPEC, params={"seed": 2})
+    assert cache.spec_key(SPEC) == cache.spec_key(renamed)
+    assert cache.spec_key(SPEC) != cache.spec_key(changed)
+    assert cache.spec_key(SPEC, (0, 0, 3)) != cache.spec_key(SPEC, (0, 0, 4))
+    assert cache.spec_key(SPEC, extra=(2,)) != cache.spec_key(SPEC, extra=(3,))
+
+
+def test_lookup_counts_hits_and_misses(tmp_path):
+    booth_cache = cache.BoothCache(str(tmp_path), 1000)
+    assert booth_cache.lookup("a", ".blend") is None
+    path = put(booth_cache, "a", 10)
+    assert booth_cache.lookup("a", ".blend") == path
+    assert booth_cache.stats["hits"] == 1
+    assert booth_cache.stats["misses"] == 1
+
+
+def test_commit_is_atomic(tmp_path):
+    booth_cache = cache.BoothCache(str(tmp_path), 1000)
+    pending = booth_cache.pending_path("a", ".blend")
+    with open(pending, "wb") as handle:
+        handle.write(b"partial")
+        # A half written entry is neither found nor counted
+        assert booth_cache.lookup("a", ".blend") is None
+        assert booth_cache.entries() == []
+        handle.write(b" booth")
+
+    path = booth_cache.commit("a", ".blend", pending)
+    assert not os.path.exists(pending)
+    with open(path, "rb") as handle:
+        assert handle.read() == b"partial booth"
+    assert [entry[2] for entry in booth_cache.entries()] == [path]
+
+
+def test_commit_replaces_an_existing_entry(tmp_path):
+    booth_cache = cache.BoothCache(str(tmp_path), 1000)
+    put(booth_cache, "a", 10)
+    path = put(booth_cache, "a", 20)
+    assert os.path.getsize(path) == 20
+    assert len(booth_cache.entries()) == 1
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    booth_cache = cache.BoothCache(str(tmp_path), 300)
+    first = put(booth_cache, "first", 100, mtime=1000)
+    second = put(booth_cache, "second", 100, mtime=2000)
+    third = put(booth_cache, "third", 100, mtime=3000)
+
+    # Using the oldest entry makes "second" the least recently used one
+    assert booth_cache.lookup("first", ".blend") == first
+    fourth = put(booth_cache, "fourth", 100)
+
+    assert not os.path.exists(second)
+    assert all(os.path.exists(path) for path in (first, third, fourth))
+    assert booth_cache.stats["evictions"] == 1
+    assert booth_cache.size() <= 300
+
+
+def test_new_entry_is_kept_even_if_larger_than_the_limit(tmp_path):
+    booth_cache = cache.BoothCache(str(tmp_path), 50)
+    old = put(booth_cache, "old", 40, mtime=1000)
+    new = put(booth_cache, "new", 100)
+    assert os.path.exists(new)
+    assert not os.path.exists(old)
+
+
+def test_store_copies_a_file(tmp_path):
+    source = tmp_path / "booth.glb"
+    source.write_bytes(b"glb")
+    booth_cache = cache.BoothCache(str(tmp_path / "cache"), 1000)
+    path = booth_cache.store("a", ".glb", str(source))
+    assert source.exists()
+    with open(path, "rb") as handle:
+        assert handle.read() == b"glb"
+    assert booth_cache.stats["stores"] == 1
+
+
+def test_clear_removes_every_entry(tmp_path):
+    booth_cache = cache.BoothCache(str(tmp_path), 1000)
+    put(booth_cache, "a", 10)
+    put(booth_cache, "b", 10)
+    assert booth_cache.clear() == 2
+    assert booth_cache.entries() == []
+
+
+def test_open_cache_shares_one_cache_per_directory(tmp_path):
+    first = cache.open_cache(str(tmp_path), 100)
+    second = cache.open_cache(str(tmp_path), 200)
+    assert first is second
+    assert second.max_bytes == 200
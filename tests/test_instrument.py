@@ -0,0 +1,77 @@
+"""Tests of the opt-in operator and update timers."""
+
+import json
+
+import pytest
+
+from GenerativeBoothAddOn import instrument
+
+
+@pytest.fixture(autouse=True)
+def recording():
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_nothing_is_recorded_while_disabled():
+    with instrument.span("edit"):
+        pass
+    instrument.count_evaluation(3)
+    assert instrument.stats == {}
+    assert list(instrument.events) == []
+    assert instrument.counters == {"evaluations": 0, "updated": 0}
+
+
+def test_timed_calls_through_and_records():
+    calls = []
+    wrapper = instrument.timed("op", "operator", lambda self, context: calls.append(context) or "done")
+    assert wrapper(None, 1) == "done"
+    assert instrument.stats == {}
+
+    instrument.enable()
+    assert wrapper(None, 2) == "done"
+    assert calls == [1, 2]
+    assert instrument.stats["op"]["calls"] == 1
+    assert instrument.timed("op", "operator", wrapper) is wrapper
+
+
+def test_evaluations_are_charged_to_the_last_outermost_call():
+    instrument.enable()
+    with instrument.span("outer"):
+        with instrument.span("inner"):
+            pass
+    instrument.count_evaluation(2)
+    instrument.count_evaluation(5)
+
+    rows = {row["name"]: row for row in instrument.summary()}
+    assert rows["outer"]["evaluations"] == 2
+    assert rows["inner"]["evaluations"] == 0
+    assert instrument.counters == {"evaluations": 2, "updated": 7}
+
+
+def test_summary_and_json(tmp_path):
+    instrument.enable()
+    for _ in range(3):
+        with instrument.span("edit", "update"):
+            pass
+    [row] = instrument.summary()
+    assert row["calls"] == 3
+    assert row["category"] == "update"
+    assert row["max_ms"] >= row["mean_ms"]
+
+    path = tmp_path / "timings.json"
+    instrument.write_json(str(path))
+    data = json.loads(path.read_text())
+    assert data["calls"][0]["name"] == "edit"
+    assert data["depsgraph"] == {"evaluations": 0, "updated": 0}
+
+
+def test_chrome_trace_holds_every_event(tmp_path):
+    instrument.enable()
+    with instrument.span("edit"):
+        pass
+    path = tmp_path / "trace.json"
+    instrument.write_chrome_trace(str(path))
+    assert "edit" in path.read_text()
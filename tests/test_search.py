@@ -0,0 +1,75 @@
+"""Tests of the generative layout search."""
+
+import numpy as np
+import pytest
+
+from GenerativeBoothAddOn import booth, search
+
+CANDIDATES = 1000
+KEEP = 5
+
+
+@pytest.fixture(scope="module")
+def space():
+    params = booth.default_params(seed=4, pole_count=6)
+    return search.layout_space(booth.booth_layout(params, lights=False, camera=False), params)
+
+
+def same(first, second):
+    return ([(c.score, c.positions.tolist()) for c in first] ==
+            [(c.score, c.positions.tolist()) for c in second])
+
+
+@pytest.mark.parametrize("bounds", [
+    (0, CANDIDATES),
+    (0, 500, CANDIDATES),
+    (0, 1, 255, 256, 257, 700, CANDIDATES),
+    (0, 100, 513, 999, CANDIDATES),
+])
+def test_merge_does_not_depend_on_the_split(space, bounds):
+    whole = search.search(space, CANDIDATES, KEEP, seed=3)
+    parts = [search.search_chunks(space, 3, start, stop, KEEP) for start, stop in zip(bounds, bounds[1:])]
+    assert same(search.merge(parts, KEEP), whole)
+    assert same(search.merge(parts[::-1], KEEP), whole)
+
+
+def test_winners_are_best_first(space):
+    winners = search.search(space, CANDIDATES, KEEP, seed=3)
+    assert len(winners) == KEEP
+    ranks = [c.score - (1.0 if c.overlaps else 0.0) for c in winners]
+    assert ranks == sorted(ranks, reverse=True)
+
+
+def test_same_seed_gives_same_winners(space):
+    assert same(search.search(space, 300, KEEP, seed=1), search.search(space, 300, KEEP, seed=1))
+
+
+def test_parallel_search_finds_the_same_winners(space):
+    whole = search.search(space, CANDIDATES, KEEP, seed=3)
+    assert same(search.parallel_search(space, CANDIDATES, KEEP, seed=3, workers=2), whole)
+
+
+def test_failing_worker_stops_the_pool(space):
+    # Scoring an unknown term raises KeyError in the worker
+    pool = search.PoolSearch(space, CANDIDATES, KEEP, seed=3, weights={"bogus": 1.0}, workers=2)
+    with pytest.raises(KeyError):
+        pool.wait()
+    with pytest.raises(RuntimeError):
+        pool._executor.submit(int)
+
+
+def test_samples_stay_within_bounds(space):
+    positions = space.sample(0, 0, 64)
+    assert positions.shape == (64, len(space), 2)
+    assert np.all(positions >= space.low - 1e-6)
+    assert np.all(positions <= space.high + 1e-6)
+
+
+def test_winner_layouts_move_only_the_searched_elements():
+    params = booth.default_params(seed=4, pole_count=6)
+    [(layout, winner)] = search.search_layout(params, candidates=200, keep=1, lights=False, camera=False)
+    base = booth.booth_layout(params, lights=False, camera=False)
+    assert [part.location for part in layout.parts if part.kind is None] == \
+           [part.location for part in base.parts if part.kind is None]
+    moved = [part.location[:2] for part in layout.elements()] + layout.poles.positions.tolist()
+    np.testing.assert_allclose(moved, winner.positions, rtol=1e-6)
@@ -0,0 +1,74 @@
+"""Tests of the collision-free layout solver."""
+
+import itertools
+
+import pytest
+
+from GenerativeBoothAddOn import solver
+
+GAP = 0.1
+CLEARANCE = 0.2
+
+
+def elements(count, pos_range=50.0):
+    kinds = (("table", 0.2, 0.5), ("chair", 0.2, 0.2), ("totem", 0.2, 0.2), ("pole", 0.05, 0.05))
+    result = []
+    for i in range(count):
+        kind, half_x, half_y = kinds[i % len(kinds)]
+        result.append(solver.Element(kind, i, half_x, half_y, pos_range))
+    return result
+
+
+@pytest.mark.parametrize("count, side", [(10, 3.0), (100, 12.0), (400, 20.0)])
+def test_placed_elements_never_overlap(count, side):
+    batch = elements(count)
+    solver.solve_layout(batch, side, side, gap=GAP, wall_clearance=CLEARANCE)
+    placed = [element for element in batch if element.placed]
+    assert placed
+    for first, second in itertools.combinations(placed, 2):
+        assert not first.overlaps(second, GAP), (first, second)
+
+
+@pytest.mark.parametrize("walls", [solver.WALL_SIDES, ("back",), ()])
+def test_placed_elements_keep_clear_of_walls(walls):
+    width, length = 4.0, 3.0
+    batch = elements(40)
+    solver.solve_layout(batch, width, length, walls, gap=GAP, wall_clearance=CLEARANCE)
+    clearance = {side: CLEARANCE if side in walls else 0.0 for side in solver.WALL_SIDES}
+    eps = 1e-9
+    for element in batch:
+        if not element.placed:
+            continue
+        assert element.x - element.half_x >= -width / 2.0 + clearance["left"] - eps
+        assert element.x + element.half_x <= width / 2.0 - clearance["right"] + eps
+        assert element.y - element.half_y >= -length / 2.0 + clearance["back"] - eps
+        assert element.y + element.half_y <= length / 2.0 + eps
+
+
+def test_unplaced_elements_are_returned_without_position():
+    batch = elements(200)
+    unplaced = solver.solve_layout(batch, 3.0, 3.0, gap=GAP, wall_clearance=CLEARANCE)
+    assert unplaced
+    assert all(not element.placed for element in unplaced)
+    assert len(unplaced) == sum(1 for element in batch if not element.placed)
+
+
+def test_obstacles_are_avoided_but_not_moved():
+    obstacle = solver.Element("totem", 0, 1.0, 1.0, 0.0, x=0.0, y=0.0)
+    batch = elements(20)
+    solver.solve_layout(batch, 6.0, 6.0, gap=GAP, wall_clearance=CLEARANCE, obstacles=[obstacle])
+    assert (obstacle.x, obstacle.y) == (0.0, 0.0)
+    assert not any(element.overlaps(obstacle, GAP) for element in batch if element.placed)
+
+
+def test_same_seed_gives_same_layout():
+    first, second = elements(50), elements(50)
+    solver.solve_layout(first, 8.0, 8.0, seed=3)
+    solver.solve_layout(second, 8.0, 8.0, seed=3)
+    assert [(e.x, e.y) for e in first] == [(e.x, e.y) for e in second]
+
+
+def test_element_too_large_for_floor_is_unplaced():
+    big = solver.Element("table", 0, 2.0, 2.0, 10.0)
+    assert solver.placement_bounds(big, 3.0, 3.0) is None
+    assert solver.solve_layout([big], 3.0, 3.0) == [big]
@@ -0,0 +1,108 @@
+"""Tests of the versioned booth spec format."""
+
+import pytest
+
+from GenerativeBoothAddOn import specs
+
+
+def sample_specs(count=3):
+    result = []
+    for index in range(count):
+        # Colors as lists, which is how JSON gives them back
+        params = {"seed": index, "floor_width": 3.0, "floor_length": 3.0, "pole_count": 12,
+                  "avoid_overlaps": bool(index % 2), "floor_color": [0.5, 0.25, 1.0, 1.0]}
+        elements = [
+            specs.element_entry("table", 0, (0.5, -0.25, 0.4), (0.4, 1.0, 0.8), generation=2, color=(1, 0, 0, 1)),
+            specs.element_entry("chair", 0, (-0.5, 0.25, 0.2), (0.4, 0.4, 0.4)),
+        ]
+        pole_cloud = [[0.1, 0.2, 1.4], [0.3, 0.4, 1.4]] if index % 2 else None
+        result.append(specs.new_spec(params, elements, pole_cloud, lights=bool(index % 2), name=f"Booth_{index}"))
+    return result
+
+
+@pytest.mark.parametrize("extension", [".json", ".jsonl"])
+def test_round_trip(tmp_path, extension):
+    path = str(tmp_path / f"booths{extension}")
+    written = sample_specs()
+    assert specs.write(path, written) == len(written)
+    assert specs.load(path) == written
+
+
+def test_single_spec_json_round_trip(tmp_path):
+    path = str(tmp_path / "booth.json")
+    written = sample_specs(1)
+    specs.write(path, written)
+    assert specs.load(path) == written
+
+
+def test_jsonl_is_read_one_spec_at_a_time(tmp_path):
+    path = str(tmp_path / "booths.jsonl")
+    specs.write(path, sample_specs(5))
+    stream = specs.iter_specs(path)
+    assert next(stream)["name"] == "Booth_0"
+    assert [spec["name"] for spec in stream] == ["Booth_1", "Booth_2", "Booth_3", "Booth_4"]
+
+
+def test_unknown_extension_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        specs.write(str(tmp_path / "booths.yaml"), sample_specs())
+
+
+def test_upgrade_fills_defaults():
+    spec = specs.upgrade({"version": specs.SPEC_VERSION, "params": {"seed": 1}})
+    assert spec["name"] == ""
+    assert spec["lights"] is True
+    assert spec["elements"] == []
+    assert spec["pole_cloud"] is None
+
+
+@pytest.mark.parametrize("spec", [
+    [],
+    {"params": {}},
+    {"version": 0, "params": {}},
+    {"version": specs.SPEC_VERSION + 1, "params": {}},
+    {"version": "1", "params": {}},
+    {"version": specs.SPEC_VERSION},
+])
+def test_upgrade_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        specs.upgrade(spec)
+
+
+def test_upgrade_chain_runs_every_step(monkeypatch):
+    def to_2(spec):
+        # Version 2 renamed "has_lights" to "lights"
+        spec = dict(spec, version=2)
+        spec["lights"] = spec.pop("has_lights")
+        return spec
+
+    def to_3(spec):
+        # Version 3 moved "seed" out of a nested "random" object
+        spec = dict(spec, version=3)
+        spec["params"] = dict(spec["params"], **spec.pop("random"))
+        return spec
+
+    monkeypatch.setattr(specs, "SPEC_VERSION", 3)
+    monkeypatch.setitem(specs._UPGRADES, 1, to_2)
+    monkeypatch.setitem(specs._UPGRADES, 2, to_3)
+
+    old = {"version": 1, "params": {"floor_width": 4.0}, "has_lights": False, "random": {"seed": 9}}
+    spec = specs.upgrade(old)
+    assert spec["version"] == 3
+    assert spec["lights"] is False
+    assert spec["params"] == {"floor_width": 4.0, "seed": 9}
+
+    middle = {"version": 2, "params": {}, "lights": True, "random": {"seed": 1}}
+    assert specs.upgrade(middle)["params"] == {"seed": 1}
+
+
+def test_files_of_older_versions_are_upgraded_on_read(tmp_path, monkeypatch):
+    path = str(tmp_path / "old.jsonl")
+    specs.write(path, sample_specs(2))
+
+    def to_2(spec):
+        return dict(spec, version=2, upgraded=True)
+
+    monkeypatch.setattr(specs, "SPEC_VERSION", 2)
+    monkeypatch.setitem(specs._UPGRADES, 1, to_2)
+    assert all(spec["version"] == 2 and spec["upgraded"] for spec in specs.iter_specs(path))